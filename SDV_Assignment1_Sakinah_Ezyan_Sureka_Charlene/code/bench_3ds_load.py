@@ -0,0 +1,91 @@
+"""
+Times the 3DS loader (chunk parsing + vtkPolyData build) on synthetic scenes of
+10k, 100k and 1M faces. Rendering objects are not created.
+
+    python bench_3ds_load.py [baseline_main.py]
+
+With a baseline (e.g. main.py from an older commit) both loaders are timed and
+their points, faces and UVs are compared.
+"""
+import importlib.util
+import os
+import struct
+import sys
+import tempfile
+import time
+
+import numpy as np
+from vtk.util import numpy_support
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_module(name, path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def chunk(cid, payload):
+    return struct.pack("<HI", cid, 6 + len(payload)) + payload
+
+
+def write_3ds(path, nfaces):
+    """Random scene split into objects of at most 60000 faces (3DS counts are 16-bit)."""
+    rng = np.random.default_rng(0)
+    objects = []
+    left, k = nfaces, 0
+    while left > 0:
+        fc = min(left, 60000)
+        nv = min(65535, fc)
+        verts = rng.random((nv, 3), dtype=np.float32)
+        faces = np.zeros((fc, 4), np.uint16)
+        faces[:, :3] = rng.integers(0, nv, (fc, 3))
+        uvs = rng.random((nv, 2), dtype=np.float32)
+        mesh = (chunk(0x4110, struct.pack("<H", nv) + verts.astype("<f4").tobytes())
+                + chunk(0x4120, struct.pack("<H", fc) + faces.astype("<u2").tobytes())
+                + chunk(0x4140, struct.pack("<H", nv) + uvs.astype("<f4").tobytes()))
+        objects.append(chunk(0x4000, f"obj{k}".encode() + b"\0" + chunk(0x4100, mesh)))
+        left -= fc
+        k += 1
+    with open(path, "wb") as f:
+        f.write(chunk(0x4D4D, chunk(0x3D3D, b"".join(objects))))
+
+
+def load(module, path):
+    """Seconds taken and the polydata list produced by module's load_3ds_scene."""
+    app = module.myVTK()
+    app.create_mapper = lambda source: source
+    app.create_actor = lambda source: source.GetOutputDataObject(0)
+    t0 = time.perf_counter()
+    parts = module.myVTK.load_3ds_scene(app, path)
+    return time.perf_counter() - t0, [poly for poly, _ in parts]
+
+
+def same_mesh(a, b):
+    arrays = (lambda p: p.GetPoints().GetData(),
+              lambda p: p.GetPolys().GetConnectivityArray(),
+              lambda p: p.GetPointData().GetTCoords())
+    return all(np.array_equal(numpy_support.vtk_to_numpy(get(a)), numpy_support.vtk_to_numpy(get(b)))
+               for get in arrays)
+
+
+def main():
+    current = load_module("main_current", os.path.join(HERE, "main.py"))
+    baseline = load_module("main_baseline", sys.argv[1]) if len(sys.argv) > 1 else None
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in (10_000, 100_000, 1_000_000):
+            path = os.path.join(tmp, f"bench_{n}.3ds")
+            write_3ds(path, n)
+            dt, polys = load(current, path)
+            line = f"{n:>9} faces: {dt:.3f}s"
+            if baseline is not None:
+                dt_old, polys_old = load(baseline, path)
+                same = len(polys) == len(polys_old) and all(map(same_mesh, polys, polys_old))
+                line += f" (baseline {dt_old:.3f}s, identical={same})"
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+OBJ export throughput in MB/s: ObjStreamWriter (export_scene_multi_obj) against
+the per-vertex / per-face string loop the multi-object export used before it.
+
+    python bench_obj_export.py [resolution]
+
+Writes four sphere objects (resolution x resolution each, default 700, about
+2M vertices and 146 MB of OBJ in total; one object has a non-ASCII name) and
+reports size, time, MB/s and peak RSS growth per writer, whether the two files
+are byte-identical, and whether the writer's byte count matches the file size.
+"""
+import importlib.util
+import os
+import resource
+import sys
+import tempfile
+import time
+
+import vtk
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_module(name, path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_parts(resolution):
+    parts = []
+    for i, name in enumerate(("obj 0", "obj 1", "Würfel 2", "obj 3")):
+        sphere = vtk.vtkSphereSource()
+        sphere.SetThetaResolution(resolution)
+        sphere.SetPhiResolution(resolution)
+        sphere.SetCenter(i * 3, 0, 0)
+        sphere.Update()
+        parts.append((name, sphere.GetOutput()))
+    return parts
+
+
+def write_previous(path, parts):
+    """The string-list loop export_scene_multi_obj ran before ObjStreamWriter."""
+    lines = []
+    v_offset = 0
+    for name, poly in parts:
+        lines.append(f"o {name}")
+        pts = poly.GetPoints()
+        for i in range(pts.GetNumberOfPoints()):
+            x, y, z = pts.GetPoint(i)
+            lines.append(f"v {x:.6f} {y:.6f} {z:.6f}")
+        polys = poly.GetPolys()
+        polys.InitTraversal()
+        id_list = vtk.vtkIdList()
+        while polys.GetNextCell(id_list):
+            if id_list.GetNumberOfIds() >= 3:
+                face_idx = " ".join(str(v_offset + id_list.GetId(j) + 1) for j in range(id_list.GetNumberOfIds()))
+                lines.append(f"f {face_idx}")
+        v_offset += pts.GetNumberOfPoints()
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def write_stream(module, path, parts):
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        writer = module.ObjStreamWriter(f)
+        for name, poly in parts:
+            writer.write_object(name, poly)
+    return writer.bytes_written
+
+
+def run(label, write, path):
+    rss0 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    t0 = time.perf_counter()
+    counted = write(path)
+    dt = time.perf_counter() - t0
+    rss = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss0) / 1024.0
+    size = os.path.getsize(path)
+    line = f"{label:>16}: {size / 2**20:6.1f} MB in {dt:6.2f} s = {size / 2**20 / dt:5.1f} MB/s, peak RSS +{rss:.0f} MB"
+    if counted is not None:
+        line += f", bytes_written {'matches' if counted == size else 'differs from'} file size"
+    print(line)
+
+
+def main():
+    current = load_module("main_current", os.path.join(HERE, "main.py"))
+    parts = make_parts(int(sys.argv[1]) if len(sys.argv) > 1 else 700)
+    with tempfile.TemporaryDirectory() as tmp:
+        new_path = os.path.join(tmp, "stream.obj")
+        old_path = os.path.join(tmp, "previous.obj")
+        # Streaming writer first: peak RSS only grows, so the second run's delta is a lower bound
+        run("ObjStreamWriter", lambda p: write_stream(current, p, parts), new_path)
+        run("previous loop", lambda p: write_previous(p, parts), old_path)
+        with open(new_path, "rb") as a, open(old_path, "rb") as b:
+            print("byte-identical:", a.read() == b.read())
+
+
+if __name__ == "__main__":
+    main()
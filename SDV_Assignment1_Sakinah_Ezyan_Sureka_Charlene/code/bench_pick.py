@@ -0,0 +1,127 @@
+"""
+Per-click pick latency on offscreen scenes of 10, 100 and 1000 objects (distinct
+8k-triangle spheres with random rotation and scale, 800x600 viewport).
+
+    python bench_pick.py [clicks]
+
+Two click sets per scene: random viewport pixels, and the projected centres of
+random objects. Compares the previous path (vtkCellPicker over every prop, then a
+scan of the object registry for the name) with ScenePicker and HardwarePicker.
+Times are warm: the first click, which builds cell locators / captures the id
+buffers, is reported separately. Agreement is the share of clicks naming the same
+object as vtkCellPicker.
+"""
+import importlib.util
+import os
+import random
+import sys
+import time
+
+import numpy as np
+import vtk
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_module(name, path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def build_scene(n, rng):
+    window = vtk.vtkRenderWindow()
+    window.SetOffScreenRendering(1)
+    window.SetSize(800, 600)
+    renderer = vtk.vtkRenderer()
+    window.AddRenderer(renderer)
+    registry = {}
+    side = int(np.ceil(n ** (1 / 3)))
+    for i in range(n):
+        sphere = vtk.vtkSphereSource()
+        sphere.SetThetaResolution(64)
+        sphere.SetPhiResolution(64)
+        sphere.Update()
+        poly = vtk.vtkPolyData()
+        poly.DeepCopy(sphere.GetOutput())       # one dataset per object, like imports
+        mapper = vtk.vtkPolyDataMapper()
+        mapper.SetInputData(poly)
+        actor = vtk.vtkActor()
+        actor.SetMapper(mapper)
+        tf = vtk.vtkTransform()
+        tf.Translate(i % side * 1.5, (i // side) % side * 1.5, i // (side * side) * 1.5)
+        tf.RotateZ(rng.random() * 90)
+        tf.Scale(1, 0.6 + rng.random() * 0.5, 1)
+        actor.SetUserTransform(tf)
+        renderer.AddActor(actor)
+        registry[f"obj_{i}"] = actor
+    renderer.ResetCamera()
+    window.Render()
+    return window, renderer, registry
+
+
+def object_clicks(renderer, registry, count, rng):
+    """Display positions of the centres of count random objects."""
+    clicks = []
+    actors = list(registry.values())
+    for _ in range(count):
+        renderer.SetWorldPoint(*rng.choice(actors).GetCenter(), 1.0)
+        renderer.WorldToDisplay()
+        x, y, _ = renderer.GetDisplayPoint()
+        clicks.append((int(round(x)), int(round(y))))
+    return clicks
+
+
+def time_clicks(pick, clicks):
+    """(warm ms per click, first-click ms, names) for pick(x, y) -> name or None."""
+    t0 = time.perf_counter()
+    pick(*clicks[0])
+    first = (time.perf_counter() - t0) * 1000.0
+    for x, y in clicks:                         # warm every locator the clicks reach
+        pick(x, y)
+    t0 = time.perf_counter()
+    names = [pick(x, y) for x, y in clicks]
+    return (time.perf_counter() - t0) * 1000.0 / len(clicks), first, names
+
+
+def main():
+    current = load_module("main_current", os.path.join(HERE, "main.py"))
+    n_clicks = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    rng = random.Random(1)
+    for n in (10, 100, 1000):
+        window, renderer, registry = build_scene(n, rng)
+        names = {actor: name for name, actor in registry.items()}
+        click_sets = (("random", [(rng.randint(0, 799), rng.randint(0, 599)) for _ in range(n_clicks)]),
+                      ("on objects", object_clicks(renderer, registry, n_clicks, rng)))
+
+        cell_picker = vtk.vtkCellPicker()
+        cell_picker.SetTolerance(0.0005)
+
+        def old_pick(x, y):
+            cell_picker.Pick(x, y, 0, renderer)
+            picked = cell_picker.GetActor()
+            for name, actor in registry.items():
+                if actor is picked:
+                    return name
+            return None
+
+        scene_picker = current.ScenePicker(renderer)
+        hardware_picker = current.HardwarePicker(renderer)
+
+        def new_pick(picker):
+            return lambda x, y: names.get(picker.pick(x, y, names)[0])
+
+        for set_name, clicks in click_sets:
+            old_ms, _, old_names = time_clicks(old_pick, clicks)
+            line = f"{n:>5} objects, {set_name:>10}: vtkCellPicker {old_ms:6.2f} ms"
+            for label, picker in (("ScenePicker", scene_picker), ("HardwarePicker", hardware_picker)):
+                ms, first, picked = time_clicks(new_pick(picker), clicks)
+                agree = sum(a == b for a, b in zip(old_names, picked))
+                line += f" | {label} {ms:5.2f} ms (first {first:.0f} ms, agree {agree}/{len(clicks)})"
+            print(line)
+        window.Finalize()
+
+
+if __name__ == "__main__":
+    main()
@@ -8,9 +8,20 @@ from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QStyleFactory
 from vtk.qt.QVTKRenderWindowInteractor import QVTKRenderWindowInteractor
 from vtk.util.colors import cornflower
+from vtk.util import numpy_support
+import numpy as np
 import os
+import contextlib
+import queue
+import threading
+import time
 
 ICON_DIR = r"D:\SDV2025\project_env1\SDV_Assignment1_Sakinah_Ezyan_Sureka_Charlene\Icons"
+# On-disk cache of imported meshes (post clean + normals), keyed by file content hash
+MODEL_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".vtk3deditor_cache")
+MODEL_CACHE_MAX_BYTES = 2 * 1024 ** 3
+UNDO_MEMORY_BUDGET_BYTES = 512 * 1024 ** 2
+UNDO_MAX_STEPS = 500
 
 def _icon(filename, fallback_style=None, fallback_enum=None):
     """
@@ -26,6 +37,1185 @@ def _icon(filename, fallback_style=None, fallback_enum=None):
         return fallback_style.standardIcon(fallback_enum)
     return QtGui.QIcon()
 
+class LoadCancelled(Exception):
+    """Raised inside a model loader when the user cancels the import."""
+
+
+class ModelCache:
+    """
+    Size-bounded LRU cache of imported meshes. Each entry is a directory named by the
+    SHA-1 of the source file plus the surface-pipeline version, holding one raw binary
+    .vtp per part (the post-clean, post-normals polydata) and an index.json of names.
+    Entry mtime is the LRU clock. Safe to use from several loader threads.
+    """
+    # Bump when build_surface_pipeline or the parsers change what they produce
+    VERSION = "1"
+
+    def __init__(self, root=MODEL_CACHE_DIR, max_bytes=MODEL_CACHE_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def key_for(self, file_path):
+        import hashlib
+        h = hashlib.sha1()
+        h.update(f"{self.VERSION}:{os.path.splitext(file_path)[1].lower()}:".encode())
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(8 * 1024 * 1024), b""):
+                h.update(block)
+        return h.hexdigest()
+
+    def load(self, key):
+        """Return [(name, vtkPolyData)] for a cached entry, or None on a miss."""
+        import json
+        entry = os.path.join(self.root, key)
+        try:
+            with open(os.path.join(entry, "index.json"), "r", encoding="utf-8") as f:
+                names = json.load(f)
+            parts = []
+            for i, name in enumerate(names):
+                reader = vtk.vtkXMLPolyDataReader()
+                reader.SetFileName(os.path.join(entry, f"{i}.vtp"))
+                reader.Update()
+                if reader.GetErrorCode():
+                    raise IOError(f"unreadable cache part {i}")
+                poly = vtk.vtkPolyData()
+                poly.ShallowCopy(reader.GetOutput())
+                parts.append((name, poly))
+            os.utime(entry, None)   # mark as most recently used
+        except Exception:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return parts
+
+    def store(self, key, parts):
+        """Write [(name, vtkPolyData)] as a new entry, then evict down to max_bytes."""
+        import json, shutil
+        entry = os.path.join(self.root, key)
+        tmp = f"{entry}.tmp{threading.get_ident()}"
+        try:
+            os.makedirs(tmp, exist_ok=True)
+            for i, (name, poly) in enumerate(parts):
+                writer = vtk.vtkXMLPolyDataWriter()
+                writer.SetFileName(os.path.join(tmp, f"{i}.vtp"))
+                writer.SetInputData(poly)
+                writer.SetDataModeToAppended()
+                writer.EncodeAppendedDataOff()
+                writer.SetCompressorTypeToNone()
+                if not writer.Write():
+                    raise IOError(f"failed to write cache part {i}")
+            with open(os.path.join(tmp, "index.json"), "w", encoding="utf-8") as f:
+                json.dump([name for name, _ in parts], f)
+            if os.path.isdir(entry):
+                shutil.rmtree(entry, ignore_errors=True)
+            os.replace(tmp, entry)
+        except Exception as e:
+            print(f"Model cache write skipped: {e}")
+            shutil.rmtree(tmp, ignore_errors=True)
+            return
+        self.evict()
+
+    def evict(self):
+        import shutil
+        with self._lock:
+            try:
+                names = os.listdir(self.root)
+            except OSError:
+                return
+            entries = []
+            for name in names:
+                path = os.path.join(self.root, name)
+                if not os.path.isdir(path) or ".tmp" in name:
+                    continue
+                size = 0
+                for fn in os.listdir(path):
+                    try:
+                        size += os.path.getsize(os.path.join(path, fn))
+                    except OSError:
+                        pass
+                entries.append((os.path.getmtime(path), size, path))
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                shutil.rmtree(path, ignore_errors=True)
+                total -= size
+
+    def stats_text(self):
+        return f"Cache: {self.hits} hit / {self.misses} miss"
+
+
+class PrimitiveBatch:
+    """
+    Draws every instance of one create_object primitive type with a single
+    vtkGlyph3DMapper. Scene objects stay ordinary vtkActor proxies (object_registry,
+    outliner, gizmo, undo all work on them as before) but are never added to the
+    renderer: they share the full-resolution prototype mapper, which keeps bounds,
+    picking, stats and export exact. Proxy transform / color edits are folded into
+    per-instance position, quaternion, scale and color arrays just before a render.
+    """
+    # Total triangles the glyph actor may draw; the display prototype is decimated
+    # to stay within it as the batch grows (software GL is fill/vertex bound).
+    TRIANGLE_BUDGET = 1_000_000
+
+    def __init__(self, renderer, object_type, proto_mapper):
+        self.renderer = renderer
+        self.object_type = object_type
+        self.proto_mapper = proto_mapper
+        self.proxies = []           # row -> proxy actor
+        self._row = {}              # proxy actor -> row
+        self._obs = {}              # proxy actor -> [(object, tag)]
+        self._dirty = set()
+        self._layout_dirty = True
+        self._display_level = None
+
+        self.pos = np.zeros((0, 3))
+        self.quat = np.zeros((0, 4))
+        self.scale = np.zeros((0, 3))
+        self.color = np.zeros((0, 3), dtype=np.uint8)
+
+        self.instances = vtk.vtkPolyData()
+        self.mapper = vtk.vtkGlyph3DMapper()
+        self.mapper.SetInputData(self.instances)
+        self.mapper.SetOrientationModeToQuaternion()
+        self.mapper.SetOrientationArray("InstanceQuat")
+        self.mapper.ScalingOn()
+        self.mapper.SetScaleModeToScaleByVectorComponents()
+        self.mapper.SetScaleArray("InstanceScale")
+        self.mapper.SetScalarModeToUsePointFieldData()
+        self.mapper.SelectColorArray("InstanceColor")
+        self.mapper.SetColorModeToDirectScalars()
+        self.mapper.ScalarVisibilityOn()
+
+        self.actor = vtk.vtkActor()
+        self.actor.SetMapper(self.mapper)
+        self.actor.PickableOff()    # clicks resolve to the proxies (ScenePicker)
+        self.renderer.AddActor(self.actor)
+        # Sync before the renderer asks for bounds (clipping range, ResetCamera) and before drawing
+        self._render_tags = [self.renderer.AddObserver(evt, lambda *a: self.sync())
+                             for evt in ("ComputeVisiblePropBoundsEvent", "StartEvent")]
+
+    def __len__(self):
+        return len(self.proxies)
+
+    def contains(self, actor):
+        return actor in self._row
+
+    def add(self, actor):
+        if actor in self._row:
+            return
+        if not self.proxies:
+            self.actor.GetProperty().DeepCopy(actor.GetProperty())
+        self._row[actor] = len(self.proxies)
+        self.proxies.append(actor)
+        mark = lambda *a, act=actor: self._dirty.add(act)
+        self._obs[actor] = [(actor, actor.AddObserver("ModifiedEvent", mark)),
+                            (actor.GetProperty(), actor.GetProperty().AddObserver("ModifiedEvent", mark))]
+        self._layout_dirty = True
+
+    def remove(self, actor):
+        row = self._row.pop(actor, None)
+        if row is None:
+            return
+        for obj, tag in self._obs.pop(actor, []):
+            obj.RemoveObserver(tag)
+        # Swap-remove keeps rows dense without shifting the arrays
+        last = self.proxies.pop()
+        if last is not actor:
+            self.proxies[row] = last
+            self._row[last] = row
+        self._dirty.discard(actor)
+        self._layout_dirty = True
+
+    def clear(self):
+        for actor in list(self.proxies):
+            self.remove(actor)
+        self.renderer.RemoveActor(self.actor)
+        for tag in self._render_tags:
+            self.renderer.RemoveObserver(tag)
+
+    # ---- per-instance arrays ----
+    def _update_rows(self, rows):
+        mats = np.empty((len(rows), 16))
+        cols = np.empty((len(rows), 3))
+        m = vtk.vtkMatrix4x4()
+        for i, r in enumerate(rows):
+            actor = self.proxies[r]
+            actor.GetMatrix(m)
+            mats[i] = [m.GetElement(a, b) for a in range(4) for b in range(4)]
+            cols[i] = actor.GetProperty().GetColor()
+        mats = mats.reshape(-1, 4, 4)
+        lin = mats[:, :3, :3]
+        scale = np.linalg.norm(lin, axis=1)          # column norms (T * R * S)
+        scale[scale == 0.0] = 1e-12
+        rot = lin / scale[:, None, :]
+        flip = np.linalg.det(rot) < 0                # mirrored: fold sign into X scale
+        scale[flip, 0] *= -1.0
+        rot[flip, :, 0] *= -1.0
+
+        # Rotation matrix -> (w, x, y, z), Shepperd's method: take the largest of w, x, y, z
+        # from the diagonal and the rest from off-diagonal sums / differences divided by it
+        # (180 degree turns have all differences at zero, so no sign comes from those)
+        r00, r11, r22 = rot[:, 0, 0], rot[:, 1, 1], rot[:, 2, 2]
+        d21, d02, d10 = rot[:, 2, 1] - rot[:, 1, 2], rot[:, 0, 2] - rot[:, 2, 0], rot[:, 1, 0] - rot[:, 0, 1]
+        s01, s02, s12 = rot[:, 0, 1] + rot[:, 1, 0], rot[:, 0, 2] + rot[:, 2, 0], rot[:, 1, 2] + rot[:, 2, 1]
+        big = np.argmax(np.stack([r00 + r11 + r22, r00, r11, r22], axis=1), axis=1)
+        four = 2.0 * np.sqrt(np.maximum(1e-12, 1.0 + np.choose(big, [r00 + r11 + r22,
+                                                                     r00 - r11 - r22,
+                                                                     r11 - r00 - r22,
+                                                                     r22 - r00 - r11])))
+        q = np.choose(big[:, None], [np.stack([0.25 * four, d21 / four, d02 / four, d10 / four], axis=1),
+                                     np.stack([d21 / four, 0.25 * four, s01 / four, s02 / four], axis=1),
+                                     np.stack([d02 / four, s01 / four, 0.25 * four, s12 / four], axis=1),
+                                     np.stack([d10 / four, s02 / four, s12 / four, 0.25 * four], axis=1)])
+
+        rows = np.asarray(rows, dtype=np.int64)
+        self.pos[rows] = mats[:, :3, 3]
+        self.quat[rows] = q
+        self.scale[rows] = scale
+        self.color[rows] = np.clip(cols * 255.0 + 0.5, 0, 255).astype(np.uint8)
+
+    def _update_display_prototype(self):
+        """Decimate the glyph source so len(self) * triangles stays within TRIANGLE_BUDGET."""
+        self.proto_mapper.Update()
+        full = self.proto_mapper.GetInput()
+        tris = max(1, full.GetNumberOfPolys())
+        n = max(1, len(self.proxies))
+        # Re-decimate only when the batch crosses a power of two
+        level = max(0, int(np.ceil(np.log2(n))))
+        if level == self._display_level:
+            return
+        self._display_level = level
+        reduction = 1.0 - (self.TRIANGLE_BUDGET / float(2 ** level)) / tris
+        if reduction <= 0.05:
+            self.mapper.SetSourceData(full)
+            return
+        tri = vtk.vtkTriangleFilter()
+        tri.SetInputData(full)
+        dec = vtk.vtkQuadricDecimation()
+        dec.SetInputConnection(tri.GetOutputPort())
+        dec.SetTargetReduction(min(reduction, 0.98))
+        normals = vtk.vtkPolyDataNormals()
+        normals.SetInputConnection(dec.GetOutputPort())
+        normals.SplittingOn()
+        normals.SetFeatureAngle(30.0)
+        normals.Update()
+        self.mapper.SetSourceData(normals.GetOutput())
+
+    def sync(self):
+        """Push pending proxy changes into the glyph arrays (called from renderer events)."""
+        if not self._layout_dirty and not self._dirty:
+            return
+        n = len(self.proxies)
+        if self._layout_dirty:
+            self.pos = np.zeros((n, 3))
+            self.quat = np.zeros((n, 4))
+            self.scale = np.ones((n, 3))
+            self.color = np.zeros((n, 3), dtype=np.uint8)
+            rows = list(range(n))
+            self._update_display_prototype()
+        else:
+            rows = [self._row[a] for a in self._dirty if a in self._row]
+        self._dirty.clear()
+        self._layout_dirty = False
+        if rows:
+            self._update_rows(rows)
+
+        pts = vtk.vtkPoints()
+        pts.SetData(numpy_support.numpy_to_vtk(self.pos, deep=1))
+        self.instances.SetPoints(pts)
+        pd = self.instances.GetPointData()
+        for name, arr in (("InstanceQuat", self.quat), ("InstanceScale", self.scale), ("InstanceColor", self.color)):
+            va = numpy_support.numpy_to_vtk(arr, deep=1)
+            va.SetName(name)
+            pd.AddArray(va)
+        self.instances.Modified()
+        self.actor.SetVisibility(n > 0)
+
+
+class LODManager:
+    """
+    Decimated stand-ins for dense meshes, drawn only while the view is moving.
+    VTK's interactor styles and widgets raise the render window's DesiredUpdateRate
+    for the duration of a drag (animate_camera_transition does the same), so any
+    render above the still rate counts as interactive. For those renders each tracked
+    actor's mapper is swapped for the level that fits its share of the triangle budget
+    and swapped back when the render ends: outside Render() every actor still has its
+    full-detail mapper (stats, picking, export, edit tools are unaffected).
+    Levels are built on a background thread. The budget is the measured triangle
+    throughput of interactive renders times the frame time 1 / DesiredUpdateRate.
+    """
+    TARGET_FPS = 30.0
+    MIN_TRIANGLES = 50_000          # meshes below this always draw at full detail
+    LEVEL_FACTOR = 4                # each level keeps ~1/4 of the triangles of the one above
+    MIN_LEVEL_TRIANGLES = 2_000
+    MIN_BUDGET, MAX_BUDGET = 20_000, 50_000_000
+
+    def __init__(self, renderer):
+        self.renderer = renderer
+        self.budget = 1_000_000     # triangles of tracked meshes per interactive frame
+        self.actors = []
+        self.levels = {}            # full mapper -> [(triangles, mapper)], finest first
+        self._full_tris = {}        # full mapper -> triangles
+        self._source_mtime = {}     # full mapper -> input MTime the levels belong to
+        self._pending = set()       # full mappers queued on the worker
+        self._ready = []            # (full mapper, mtime, polydata or None) from the worker
+        self._lock = threading.Lock()
+        self._jobs = queue.Queue()
+        self._worker = None
+        self._swapped = []          # (actor, full mapper) for the render in progress
+        self._t0 = None
+        self._drawn = 0             # triangles of tracked meshes in the render in progress
+        self._tri_rate = None       # smoothed triangles / second of interactive renders
+        self._render_tags = [renderer.AddObserver("StartEvent", self._on_render_start),
+                             renderer.AddObserver("EndEvent", self._on_render_end)]
+
+    def track(self, actor):
+        if actor is None or actor in self.actors or getattr(actor, "_vt_batch", None) is not None:
+            return
+        self.actors.append(actor)
+        self._request(actor.GetMapper())
+
+    def untrack(self, actor):
+        if actor in self.actors:
+            self.actors.remove(actor)
+            self._forget_unused()
+
+    def clear(self):
+        self.actors = []
+        self._forget_unused()
+
+    # ---- level building ----
+    def _request(self, mapper):
+        """Queue a rebuild when the mapper's input changed since its levels were made."""
+        if not isinstance(mapper, vtk.vtkPolyDataMapper) or mapper in self._pending:
+            return
+        poly = mapper.GetInput()
+        if poly is None:
+            return
+        mtime = poly.GetMTime()
+        if self._source_mtime.get(mapper) == mtime:
+            return
+        self._source_mtime[mapper] = mtime
+        self.levels.pop(mapper, None)
+        tris = poly.GetNumberOfPolys() + poly.GetNumberOfStrips()
+        self._full_tris[mapper] = tris
+        if tris < self.MIN_TRIANGLES:
+            return
+        # Points and cells are copied now: the edit tools and VertexEditCommand write the
+        # live buffers in place while the worker reads. Other attributes (UVs) are never
+        # edited in place and stay shared. Results built from an outdated MTime are still
+        # dropped in _collect().
+        snapshot = vtk.vtkPolyData()
+        snapshot.ShallowCopy(poly)
+        if poly.GetPoints() is not None:
+            points = vtk.vtkPoints()
+            points.DeepCopy(poly.GetPoints())
+            snapshot.SetPoints(points)
+        for get, put in ((poly.GetPolys, snapshot.SetPolys), (poly.GetStrips, snapshot.SetStrips)):
+            cells = vtk.vtkCellArray()
+            cells.DeepCopy(get())
+            put(cells)
+        self._pending.add(mapper)
+        self._jobs.put((mapper, mtime, snapshot, tris))
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._run_worker, daemon=True)
+            self._worker.start()
+
+    def _run_worker(self):
+        while True:
+            mapper, mtime, poly, tris = self._jobs.get()
+            try:
+                for level in self._build_levels(poly, tris):
+                    with self._lock:
+                        self._ready.append((mapper, mtime, level))
+            except Exception:
+                pass
+            with self._lock:
+                self._ready.append((mapper, mtime, None))
+
+    def _build_levels(self, poly, tris):
+        """Yield decimated copies of poly, LEVEL_FACTOR apart, down to MIN_LEVEL_TRIANGLES."""
+        targets = []
+        t = tris // self.LEVEL_FACTOR
+        while t >= self.MIN_LEVEL_TRIANGLES:
+            targets.append(t)
+            t //= self.LEVEL_FACTOR
+
+        if poly.GetPointData().GetTCoords() is not None:
+            # Textured: quadric decimation carries texture coordinates; chain finest -> coarsest
+            current, count = poly, tris
+            for t in targets:
+                dec = vtk.vtkQuadricDecimation()
+                dec.SetInputData(current)
+                dec.SetTargetReduction(1.0 - t / float(count))
+                dec.AttributeErrorMetricOn()
+                dec.TCoordsAttributeOn()
+                dec.NormalsAttributeOff()
+                dec.ScalarsAttributeOff()
+                dec.VectorsAttributeOff()
+                dec.TensorsAttributeOff()
+                dec.Update()
+                current = dec.GetOutput()
+                count = max(1, current.GetNumberOfPolys())
+                yield self._with_normals(current)
+            return
+
+        # Untextured: vertex clustering is one linear pass per level. Its output size
+        # depends on the shape, so calibrate triangles-per-division^2 on a coarse grid
+        # and build coarsest first (something usable is ready almost immediately).
+        probe = 16
+        clus = vtk.vtkQuadricClustering()
+        clus.SetInputData(poly)
+        clus.AutoAdjustNumberOfDivisionsOff()
+        clus.SetNumberOfDivisions(probe, probe, probe)
+        clus.Update()
+        per_cell = max(1e-3, clus.GetOutput().GetNumberOfPolys() / float(probe * probe))
+        for t in reversed(targets):
+            div = int(min(1024, max(4, (t / per_cell) ** 0.5)))
+            clus.SetNumberOfDivisions(div, div, div)
+            clus.Update()
+            level = vtk.vtkPolyData()
+            level.ShallowCopy(clus.GetOutput())
+            yield self._with_normals(level)
+
+    @staticmethod
+    def _with_normals(poly):
+        normals = vtk.vtkPolyDataNormals()
+        normals.SetInputData(poly)
+        normals.ConsistencyOn()
+        normals.SplittingOn()
+        normals.SetFeatureAngle(30.0)
+        normals.Update()
+        return normals.GetOutput()
+
+    def _collect(self):
+        """Turn finished worker results into mappers (main thread)."""
+        with self._lock:
+            ready, self._ready = self._ready, []
+        for mapper, mtime, poly in ready:
+            if poly is None:
+                self._pending.discard(mapper)
+                continue
+            if self._source_mtime.get(mapper) != mtime:
+                continue
+            tris = poly.GetNumberOfPolys()
+            if tris == 0 or tris >= self._full_tris.get(mapper, 0):
+                continue
+            lod = vtk.vtkPolyDataMapper()
+            lod.ShallowCopy(mapper)         # scalar / coincident-topology settings
+            lod.SetInputData(poly)
+            levels = self.levels.setdefault(mapper, [])
+            levels.append((tris, lod))
+            levels.sort(key=lambda level: -level[0])
+
+    def _forget_unused(self):
+        used = {a.GetMapper() for a in self.actors}
+        for mapper in list(self._source_mtime):
+            if mapper not in used:
+                self._source_mtime.pop(mapper, None)
+                self._full_tris.pop(mapper, None)
+                self.levels.pop(mapper, None)
+
+    # ---- render hooks ----
+    def _interactive_rate(self):
+        window = self.renderer.GetRenderWindow()
+        if window is None:
+            return None
+        iren = window.GetInteractor()
+        still = iren.GetStillUpdateRate() if iren else 0.0001
+        rate = window.GetDesiredUpdateRate()
+        return rate if rate > still else None
+
+    def _on_render_start(self, caller, evt):
+        rate = self._interactive_rate()
+        if rate is None or not self.actors:
+            return
+        self._collect()
+        for actor in self.actors:
+            self._request(actor.GetMapper())
+        self._forget_unused()
+        self._t0 = time.perf_counter()
+        self._target = 1.0 / rate
+
+        managed = []
+        self._drawn = 0
+        for actor in self.actors:
+            mapper = actor.GetMapper()
+            if not actor.GetVisibility():
+                continue
+            self._drawn += self._full_tris.get(mapper, 0)
+            if self.levels.get(mapper):
+                managed.append((actor, mapper))
+        if not managed or self._drawn <= self.budget:
+            return
+
+        # Share the budget by projected size: (bounding radius / distance)^2
+        cam = self.renderer.GetActiveCamera().GetPosition()
+        weights = []
+        for actor, _ in managed:
+            b = actor.GetBounds()
+            c = ((b[0] + b[1]) * 0.5, (b[2] + b[3]) * 0.5, (b[4] + b[5]) * 0.5)
+            r = 0.5 * ((b[1] - b[0]) ** 2 + (b[3] - b[2]) ** 2 + (b[5] - b[4]) ** 2) ** 0.5
+            d = sum((cam[i] - c[i]) ** 2 for i in range(3)) ** 0.5
+            weights.append((r / max(d, r, 1e-9)) ** 2)
+        total = sum(weights) or 1.0
+        for (actor, mapper), w in zip(managed, weights):
+            share = self.budget * w / total
+            if self._full_tris[mapper] <= share:
+                continue
+            levels = self.levels[mapper]
+            tris, lod = next((level for level in levels if level[0] <= share), levels[-1])
+            actor.SetMapper(lod)
+            self._swapped.append((actor, mapper))
+            self._drawn -= self._full_tris[mapper] - tris
+
+    def _on_render_end(self, caller, evt):
+        for actor, mapper in self._swapped:
+            actor.SetMapper(mapper)
+        self._swapped = []
+        if self._t0 is None:
+            return
+        elapsed = max(1e-4, time.perf_counter() - self._t0)
+        self._t0 = None
+        if self._drawn <= 0:
+            return
+        rate = self._drawn / elapsed
+        self._tri_rate = rate if self._tri_rate is None else 0.7 * self._tri_rate + 0.3 * rate
+        self.budget = int(min(self.MAX_BUDGET, max(self.MIN_BUDGET, self._tri_rate * self._target)))
+
+
+class ScenePicker:
+    """
+    Click picking over the scene objects only (replaces a renderer-wide vtkCellPicker
+    pass). World bounds of the candidate actors sit in one array and are slab-tested
+    against the pick ray in a single vectorized step; the survivors are intersected
+    near-to-far with a vtkStaticCellLocator of their model-space geometry (the ray is
+    moved into model space by the inverse actor matrix), stopping as soon as the best
+    hit is nearer than the next box. Locators are built lazily per dataset and rebuilt
+    when its MTime changes, so moving an object never invalidates one. A bounds row is
+    recomputed only when its actor / mapper / input MTime changed since the last pick.
+    """
+    def __init__(self, renderer):
+        self.renderer = renderer
+        self._actors = []               # candidate actors, row order of _bounds
+        self._rows = []                 # per row: [mtime key, mapper, dataset, pickable]
+        self._bounds = np.zeros((0, 6))
+        self._locators = {}             # dataset address -> (mtime, dataset, locator)
+        self.last_tested = 0            # actors that reached the locator stage in the last pick
+
+    def _refresh(self, actors):
+        if actors != self._actors:
+            self._actors = actors
+            self._rows = [[None, None, None, False] for _ in actors]
+            self._bounds = np.zeros((len(actors), 6))
+            live = {id(a) for a in actors}
+            self._locators = {k: v for k, v in self._locators.items() if v[3] in live}
+        for i, actor in enumerate(actors):
+            row = self._rows[i]
+            mapper, data = row[1], row[2]
+            key = (actor.GetMTime(), mapper.GetMTime() if mapper else 0, data.GetMTime() if data else 0)
+            if key == row[0]:
+                continue
+            # Slow path (first pick, moved / edited / re-mapped actor)
+            mapper = actor.GetMapper()
+            data = mapper.GetInput() if mapper is not None else None
+            row[1], row[2] = mapper, data
+            row[0] = (actor.GetMTime(), mapper.GetMTime() if mapper else 0, data.GetMTime() if data else 0)
+            row[3] = bool(actor.GetVisibility() and actor.GetPickable() and data is not None
+                          and data.GetNumberOfCells() > 0)
+            if row[3]:
+                self._bounds[i] = actor.GetBounds()
+
+    def _locator(self, actor, data):
+        key = data.GetAddressAsString("vtkDataObject")
+        cached = self._locators.get(key)
+        if cached is None or cached[0] != data.GetMTime():
+            locator = vtk.vtkStaticCellLocator()
+            locator.SetDataSet(data)
+            locator.BuildLocator()
+            cached = (data.GetMTime(), data, locator, id(actor))
+            self._locators[key] = cached
+        return cached[2]
+
+    def _ray(self, x, y):
+        ends = []
+        for z in (0.0, 1.0):
+            self.renderer.SetDisplayPoint(x, y, z)
+            self.renderer.DisplayToWorld()
+            w = self.renderer.GetWorldPoint()
+            ends.append(np.array(w[:3]) / (w[3] if w[3] else 1.0))
+        return ends
+
+    def pick(self, x, y, actors):
+        """Nearest visible, pickable actor of `actors` under display (x, y): (actor, world_pos) or (None, None)."""
+        self._refresh(list(actors))
+        self.last_tested = 0
+        if not self._actors:
+            return None, None
+
+        p0, p1 = self._ray(x, y)
+        d = p1 - p0
+        d[d == 0.0] = 1e-30
+        bounds = self._bounds.reshape(-1, 3, 2)
+        pad = 1e-6 * max(1.0, float(np.abs(bounds).max()))
+        lo = (bounds[:, :, 0] - pad - p0) / d
+        hi = (bounds[:, :, 1] + pad - p0) / d
+        t_enter = np.minimum(lo, hi).max(axis=1)
+        t_exit = np.maximum(lo, hi).min(axis=1)
+        pickable = np.fromiter((row[3] for row in self._rows), dtype=bool, count=len(self._rows))
+        order = np.flatnonzero(pickable & (t_exit >= np.maximum(t_enter, 0.0)) & (t_enter <= 1.0))
+        order = order[np.argsort(t_enter[order])]
+
+        best_t, best = 2.0, (None, None)
+        t, sub_id, cell_id = vtk.reference(0.0), vtk.reference(0), vtk.reference(0)
+        pos, pcoords = [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]
+        inv = vtk.vtkMatrix4x4()
+        for i in order:
+            if t_enter[i] > best_t:
+                break
+            actor = self._actors[i]
+            self.last_tested += 1
+            actor.GetMatrix(inv)
+            inv.Invert()
+            a = inv.MultiplyPoint((*p0, 1.0))
+            b = inv.MultiplyPoint((*p1, 1.0))
+            a = [a[k] / a[3] for k in range(3)]
+            b = [b[k] / b[3] for k in range(3)]
+            # Affine map: the segment parameter t is the same in model and world space
+            locator = self._locator(actor, self._rows[i][2])
+            if locator.IntersectWithLine(a, b, 1e-9, t, pos, pcoords, sub_id, cell_id):
+                if float(t) < best_t:
+                    best_t = float(t)
+                    best = (actor, tuple(p0 + d * best_t))
+        return best
+
+
+class HardwarePicker(ScenePicker):
+    """
+    GPU pick backend for dense scenes: a vtkHardwareSelector renders prop and cell ids
+    for the whole viewport once, and every click until the view changes is answered by
+    a pixel lookup. The buffers are recaptured after a camera or window-size change,
+    after invalidate() (myVTK.render_all, i.e. any scene edit) and after an interactive
+    render (widget drags move actors without going through render_all).
+    The id cell is then intersected with the pick ray for the world position, falling
+    back to the actor's cell locator when the pixel centre ray misses that cell (pixels
+    on a shared edge), so actor, cell and position agree with vtkCellPicker; only
+    one-pixel silhouette slivers can differ.
+    Glyph batches are made pickable for the capture only; the glyph index is the row
+    of the proxy actor.
+    """
+    def __init__(self, renderer, batches=None):
+        super().__init__(renderer)
+        self.batches = batches if batches is not None else {}
+        self.selector = vtk.vtkHardwareSelector()
+        self.selector.SetRenderer(renderer)
+        self.selector.SetFieldAssociation(vtk.vtkDataObject.FIELD_ASSOCIATION_CELLS)
+        self._key = None                # (camera MTime, window size) of the current buffers
+        self._dirty = True
+        self._capturing = False
+        self.captures = 0
+        self.last_captured = False      # the last pick had to capture first
+        self._end_tag = renderer.AddObserver("EndEvent", self._on_render_end)
+
+    def invalidate(self):
+        self._dirty = True
+
+    def _on_render_end(self, caller, evt):
+        if self._capturing:
+            return
+        window = self.renderer.GetRenderWindow()
+        iren = window.GetInteractor() if window else None
+        if iren and window.GetDesiredUpdateRate() > iren.GetStillUpdateRate():
+            self._dirty = True
+
+    def _view_key(self):
+        window = self.renderer.GetRenderWindow()
+        return self.renderer.GetActiveCamera().GetMTime(), tuple(window.GetSize())
+
+    def _capture(self):
+        w, h = self.renderer.GetRenderWindow().GetSize()
+        if w <= 0 or h <= 0:
+            return False
+        glyphs = [b.actor for b in self.batches.values() if len(b)]
+        self._capturing = True
+        try:
+            for actor in glyphs:
+                actor.PickableOn()
+            self.selector.SetArea(0, 0, w - 1, h - 1)
+            ok = bool(self.selector.CaptureBuffers())
+        finally:
+            for actor in glyphs:
+                actor.PickableOff()
+            self._capturing = False
+        self.captures += 1
+        self._key = self._view_key()
+        self._dirty = not ok
+        return ok
+
+    def _lookup(self, x, y):
+        """Pixel lookup: (actor, cell_id) under display (x, y), batch glyphs resolved to proxies."""
+        self.last_captured = False
+        if self._dirty or self._key != self._view_key():
+            self.last_captured = True
+            if not self._capture():
+                return None, -1
+        sel = self.selector.GenerateSelection(int(x), int(y), int(x), int(y))
+        if sel is None or sel.GetNumberOfNodes() == 0:
+            return None, -1
+        node = sel.GetNode(0)
+        actor = node.GetProperties().Get(vtk.vtkSelectionNode.PROP())
+        ids = node.GetSelectionList()
+        cell_id = int(ids.GetTuple1(0)) if ids is not None and ids.GetNumberOfTuples() else -1
+        for batch in self.batches.values():
+            if actor is batch.actor:
+                if 0 <= cell_id < len(batch.proxies):
+                    return batch.proxies[cell_id], -1
+                return None, -1
+        return actor, cell_id
+
+    def pick_cell(self, x, y):
+        """Nearest pickable actor under display (x, y): (actor, cell_id, world_pos) or (None, -1, None)."""
+        actor, cell_id = self._lookup(x, y)
+        mapper = actor.GetMapper() if actor is not None else None
+        data = mapper.GetInput() if mapper is not None else None
+        if data is None or data.GetNumberOfCells() == 0:
+            return actor, cell_id, None
+
+        p0, p1 = self._ray(x, y)
+        inv = vtk.vtkMatrix4x4()
+        actor.GetMatrix(inv)
+        inv.Invert()
+        a = inv.MultiplyPoint((*p0, 1.0))
+        b = inv.MultiplyPoint((*p1, 1.0))
+        a = [a[k] / a[3] for k in range(3)]
+        b = [b[k] / b[3] for k in range(3)]
+        t, sub_id, hit_cell = vtk.reference(0.0), vtk.reference(0), vtk.reference(0)
+        pos, pcoords = [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]
+        if 0 <= cell_id < data.GetNumberOfCells():
+            if data.GetCell(cell_id).IntersectWithLine(a, b, 1e-9, t, pos, pcoords, sub_id):
+                return actor, cell_id, tuple(p0 + (p1 - p0) * float(t))
+        if self._locator(actor, data).IntersectWithLine(a, b, 1e-9, t, pos, pcoords, sub_id, hit_cell):
+            return actor, int(hit_cell), tuple(p0 + (p1 - p0) * float(t))
+        # Silhouette pixel: rasterized, but the centre ray grazes past (a vtkCellPicker miss)
+        return None, -1, None
+
+    def pick(self, x, y, actors):
+        """Same contract as ScenePicker.pick: a hit outside `actors` is an occluder, so (None, None)."""
+        actor, _, pos = self.pick_cell(x, y)
+        if actor is None or actor not in actors:
+            return None, None
+        return actor, pos
+
+
+class RegionSelector:
+    """
+    Box / lasso region test for viewport selection. The region is fixed in display
+    coordinates when the selector is made. Point arrays are pushed through the camera's
+    composite projection (times the actor matrix) in one vectorized step and tested
+    against the rectangle or a rasterized lasso mask, with the near/far planes closing
+    the frustum, so no candidate is ever picked on its own. Selection is x-ray: points
+    hidden behind other geometry still count.
+    """
+    def __init__(self, renderer, box=None, lasso=None):
+        self.renderer = renderer
+        cam = renderer.GetActiveCamera()
+        m = cam.GetCompositeProjectionTransformMatrix(renderer.GetTiledAspectRatio(), -1.0, 1.0)
+        self.world_to_clip = np.array([[m.GetElement(i, j) for j in range(4)] for i in range(4)])
+        w, h = renderer.GetRenderWindow().GetSize()
+        vp = renderer.GetViewport()
+        # NDC -> display, as vtkViewport::ViewToDisplay
+        self._scale = np.array([0.5 * w * (vp[2] - vp[0]), 0.5 * h * (vp[3] - vp[1])])
+        self._origin = np.array([w * vp[0], h * vp[1]]) + self._scale
+
+        self.mask = None
+        if lasso is not None:
+            pts = np.asarray(lasso, dtype=float).reshape(-1, 2)
+            x0, y0 = np.floor(pts.min(axis=0)).astype(int)
+            x1, y1 = np.ceil(pts.max(axis=0)).astype(int)
+            self.rect = (x0, y0, x1, y1)
+            self.mask = self._rasterize(pts - (x0, y0), x1 - x0 + 1, y1 - y0 + 1)
+        else:
+            (ax, ay), (bx, by) = box[:2], box[2:]
+            self.rect = (min(ax, bx), min(ay, by), max(ax, bx), max(ay, by))
+
+    @staticmethod
+    def _rasterize(poly, w, h):
+        """Even-odd fill of the lasso polygon into a (h, w) bool mask (row = display y)."""
+        img = QtGui.QImage(w, h, QtGui.QImage.Format_Grayscale8)
+        img.fill(0)
+        painter = QtGui.QPainter(img)
+        painter.setPen(QtCore.Qt.NoPen)
+        painter.setBrush(QtGui.QColor(255, 255, 255))
+        # Aliased fill samples pixel (i, j) at its corner, matching the int() lookup in contains()
+        painter.drawPolygon(QtGui.QPolygonF([QtCore.QPointF(x, y) for x, y in poly]),
+                            QtCore.Qt.OddEvenFill)
+        painter.end()
+        buf = np.frombuffer(img.constBits().asstring(img.bytesPerLine() * h), dtype=np.uint8)
+        return buf.reshape(h, img.bytesPerLine())[:, :w] > 0
+
+    def _to_display(self, points, matrix=None):
+        """(N, 3) points (model space when matrix is the actor matrix) -> display xy, in-depth flag."""
+        m = self.world_to_clip if matrix is None else self.world_to_clip @ matrix
+        pts = np.asarray(points)
+        clip = pts @ m[:, :3].T.astype(pts.dtype, copy=False) + m[:, 3].astype(pts.dtype, copy=False)
+        wc = clip[:, 3]
+        ok = (wc > 0) & (np.abs(clip[:, 2]) <= wc)
+        wc = np.where(ok, wc, 1)
+        xy = clip[:, :2] / wc[:, None] * self._scale + self._origin
+        return xy, ok
+
+    def contains(self, points, matrix=None):
+        """Bool mask of the (N, 3) points that lie inside the region's frustum."""
+        xy, ok = self._to_display(points, matrix)
+        x0, y0, x1, y1 = self.rect
+        ok &= (xy[:, 0] >= x0) & (xy[:, 0] <= x1) & (xy[:, 1] >= y0) & (xy[:, 1] <= y1)
+        if self.mask is not None:
+            idx = np.flatnonzero(ok)
+            col = np.minimum((xy[idx, 0] - x0).astype(np.int64), self.mask.shape[1] - 1)
+            row = np.minimum((xy[idx, 1] - y0).astype(np.int64), self.mask.shape[0] - 1)
+            ok[idx] = self.mask[row, col]
+        return ok
+
+    @staticmethod
+    def combine(current, ids, op):
+        """
+        Merge a region hit into a selection; both are sorted unique id arrays (flatnonzero
+        output). op is "replace", "add" or "subtract". Merged through a bool mask: far
+        cheaper than np.union1d / setdiff1d on million-id selections.
+        """
+        current = np.asarray(current, dtype=np.int64)
+        ids = np.asarray(ids, dtype=np.int64)
+        if op == "replace" or (op == "add" and not len(current)):
+            return ids
+        if not len(current) or not len(ids):
+            return current
+        mask = np.zeros(int(max(current[-1], ids[-1])) + 1, dtype=bool)
+        mask[current] = True
+        mask[ids] = op == "add"
+        return np.flatnonzero(mask)
+
+    @staticmethod
+    def actor_matrix(actor):
+        m = vtk.vtkMatrix4x4()
+        actor.GetMatrix(m)
+        return np.array([[m.GetElement(i, j) for j in range(4)] for i in range(4)])
+
+    def point_mask(self, data, matrix):
+        """Inside mask over the points of a model-space point set drawn with `matrix` (4x4)."""
+        points = data.GetPoints() if hasattr(data, "GetPoints") else None
+        if points is None or points.GetNumberOfPoints() == 0:
+            return np.zeros(0, dtype=bool)
+        return self.contains(numpy_support.vtk_to_numpy(points.GetData()), matrix)
+
+    @staticmethod
+    def cells_inside(poly, inside):
+        """Ids of the polygon cells of `poly` whose corners all lie inside (cell ids count verts/lines first)."""
+        polys = poly.GetPolys()
+        if polys is None or polys.GetNumberOfCells() == 0 or not inside.any():
+            return np.zeros(0, dtype=np.int64)
+        offsets = numpy_support.vtk_to_numpy(polys.GetOffsetsArray())
+        conn = numpy_support.vtk_to_numpy(polys.GetConnectivityArray())
+        all_in = np.logical_and.reduceat(inside[conn], offsets[:-1]) & (np.diff(offsets) > 0)
+        return np.flatnonzero(all_in) + poly.GetNumberOfVerts() + poly.GetNumberOfLines()
+
+    def select_actors(self, actors):
+        """Visible actors with any vertex inside the region (batched proxies included)."""
+        actors = [a for a in actors if a.GetVisibility()]
+        if not actors:
+            return []
+        # One projection of all bounding-box corners rejects (or, for a box, accepts) most actors
+        b = np.array([a.GetBounds() for a in actors]).reshape(-1, 3, 2)
+        corners = np.stack([b[:, [0, 1, 2], [i, j, k]] for i in (0, 1) for j in (0, 1) for k in (0, 1)], axis=1)
+        xy, ok = self._to_display(corners.reshape(-1, 3))
+        xy, ok = xy.reshape(-1, 8, 2), ok.reshape(-1, 8)
+        front = ok.all(axis=1)
+        x0, y0, x1, y1 = self.rect
+        lo, hi = xy.min(axis=1), xy.max(axis=1)
+        apart = front & ((hi[:, 0] < x0) | (lo[:, 0] > x1) | (hi[:, 1] < y0) | (lo[:, 1] > y1))
+        within = front & (lo[:, 0] >= x0) & (hi[:, 0] <= x1) & (lo[:, 1] >= y0) & (hi[:, 1] <= y1)
+
+        hits = []
+        for i, actor in enumerate(actors):
+            if apart[i]:
+                continue
+            if within[i] and self.mask is None:
+                hits.append(actor)
+                continue
+            mapper = actor.GetMapper()
+            data = mapper.GetInput() if mapper is not None else None
+            if data is None:
+                continue
+            mask = self.point_mask(data, self.actor_matrix(actor))
+            if mask.size == 0:
+                # No point array (image data etc.): fall back to the bounding-box corners
+                mask = self.contains(corners[i])
+            if mask.any():
+                hits.append(actor)
+        return hits
+
+
+class EditMesh:
+    """
+    Edit-mode drawing path for a vtkPolyData being edited in place.
+
+    The mapper draws the polydata directly: no vtkCleanPolyData (which may merge points
+    and renumber the ids the edit tools hold) and no vtkPolyDataNormals re-run over the
+    whole mesh per frame. Point normals live in the polydata and update(moved_ids) only
+    recomputes the faces touching moved points and those faces' corners (faces moved
+    rigidly as a whole keep their normal). Call rebuild() after the topology changes.
+    """
+
+    def __init__(self, poly):
+        self.poly = poly
+        self.mapper = vtk.vtkPolyDataMapper()
+        self.mapper.SetInputData(poly)
+        self.mapper.ScalarVisibilityOff()
+        self.mapper._vt_edit_mesh = self
+        self.rebuild()
+
+    def rebuild(self):
+        """Index the polygons as fan triangles and recompute every normal."""
+        self._plan_key = self._plan_rigid = None
+        self._tri = None
+        poly = self.poly
+        polys = poly.GetPolys()
+        n = poly.GetNumberOfPoints()
+        if not n or polys is None or polys.GetNumberOfCells() == 0 or poly.GetNumberOfStrips():
+            return
+        offsets = numpy_support.vtk_to_numpy(polys.GetOffsetsArray()).astype(np.int64)
+        conn = numpy_support.vtk_to_numpy(polys.GetConnectivityArray()).astype(np.int64)
+        sizes = np.diff(offsets)
+        corner_face = np.repeat(np.arange(len(sizes)), sizes)
+        # Polygon (v0, v1, ..., vk) -> fan triangles (v0, vj, vj+1)
+        pos = np.arange(len(conn)) - offsets[corner_face]
+        j = np.flatnonzero((pos >= 1) & (pos <= sizes[corner_face] - 2))
+        self._tri_face = corner_face[j]
+        self._tri = np.stack([conn[offsets[self._tri_face]], conn[j], conn[j + 1]], axis=1)
+        self._offsets = offsets
+        self._corner_point = conn
+        self._corner_face = corner_face
+        self._n_faces = len(sizes)
+
+        pts = self._points()
+        # Unnormalized (area-weighted) face normals and their per-point sums
+        self._face_n = self._fan_normals(pts, self._tri, self._tri_face, self._n_faces)
+        self._point_sum = np.zeros((n, 3))
+        for k in range(3):
+            self._point_sum[:, k] = np.bincount(conn, weights=self._face_n[corner_face, k], minlength=n)
+        normals = numpy_support.numpy_to_vtk(self._unit(self._point_sum).astype(np.float32), deep=1)
+        normals.SetName("Normals")
+        poly.GetPointData().SetNormals(normals)
+        self._normals_view = numpy_support.vtk_to_numpy(normals)
+        self._normals = normals
+
+    def _points(self):
+        return numpy_support.vtk_to_numpy(self.poly.GetPoints().GetData())
+
+    @staticmethod
+    def _fan_normals(pts, tri, tri_face, n_faces):
+        p = pts[tri].astype(np.float64)
+        cross = np.cross(p[:, 1] - p[:, 0], p[:, 2] - p[:, 0])
+        return np.stack([np.bincount(tri_face, weights=cross[:, k], minlength=n_faces) for k in range(3)], axis=1)
+
+    @staticmethod
+    def _unit(v):
+        length = np.linalg.norm(v, axis=1, keepdims=True)
+        return v / np.where(length > 0.0, length, 1.0)
+
+    def _plan(self, moved_ids, rigid_ids):
+        # Affected faces / triangles / corners depend only on which ids move, so a drag
+        # (same ids arrays every frame) computes them once
+        if self._plan_key is moved_ids and self._plan_rigid is rigid_ids:
+            return self._plan_cache
+        moved = np.zeros(len(self._point_sum), dtype=bool)
+        moved[moved_ids] = True
+        face_hit = np.zeros(self._n_faces, dtype=bool)
+        face_hit[self._corner_face[moved[self._corner_point]]] = True
+        if rigid_ids is not None and len(rigid_ids):
+            rigid = np.zeros(len(self._point_sum), dtype=bool)
+            rigid[rigid_ids] = True
+            face_hit &= ~np.logical_and.reduceat(rigid[self._corner_point], self._offsets[:-1])
+        faces = np.flatnonzero(face_hit)
+        tri_sel = face_hit[self._tri_face]
+        corner_sel = face_hit[self._corner_face]
+        corner_points = self._corner_point[corner_sel]
+        touched = np.zeros(len(self._point_sum), dtype=bool)
+        touched[corner_points] = True
+        touched = np.flatnonzero(touched)
+        self._plan_cache = (
+            faces,
+            self._tri[tri_sel],
+            np.searchsorted(faces, self._tri_face[tri_sel]),
+            np.searchsorted(touched, corner_points),
+            np.searchsorted(faces, self._corner_face[corner_sel]),
+            touched,
+        )
+        self._plan_key = moved_ids
+        self._plan_rigid = rigid_ids
+        return self._plan_cache
+
+    def update(self, moved_ids, rigid_ids=None):
+        """
+        Refresh normals after the points in moved_ids changed (topology unchanged).
+        rigid_ids: subset of moved_ids that all moved by the same translation.
+        """
+        if self._tri is None or not len(moved_ids):
+            return
+        faces, tris, tri_face, corner_slot, corner_face, touched = self._plan(moved_ids, rigid_ids)
+        new_n = self._fan_normals(self._points(), tris, tri_face, len(faces))
+        delta = new_n - self._face_n[faces]
+        self._face_n[faces] = new_n
+        corner_delta = delta[corner_face]
+        sums = self._point_sum[touched]
+        for k in range(3):
+            sums[:, k] += np.bincount(corner_slot, weights=corner_delta[:, k], minlength=len(touched))
+        self._point_sum[touched] = sums
+        self._normals_view[touched] = self._unit(sums)
+        self._normals.Modified()
+
+
+class SceneIndex:
+    """
+    Name index for the scene outliner. MainWindow keeps name -> actor (object_registry,
+    light_registry) and actor -> name (actor_names); this adds name -> tree item and a
+    counter per base name, so lookups and unique names are O(1) instead of a walk over
+    the tree or the registry. Suffixes are never handed out twice, so a deleted name
+    does not make the next add collide with a surviving one.
+    """
+    def __init__(self):
+        self.items = {}         # object / light name -> QTreeWidgetItem
+        self._counters = {}     # base name -> last suffix handed out
+
+    def unique_name(self, base, bare_first=True):
+        """base, base_2, base_3 ... (base_1 first when bare_first is False), skipping names in use."""
+        n = self._counters.get(base, 0)
+        while True:
+            n += 1
+            name = base if (n == 1 and bare_first) else f"{base}_{n}"
+            if name not in self.items:
+                break
+        self._counters[base] = n
+        return name
+
+    def add(self, name, item):
+        self.items[name] = item
+
+    def remove(self, name):
+        return self.items.pop(name, None)
+
+    def get(self, name):
+        return self.items.get(name)
+
+    def clear(self):
+        self.items.clear()
+        self._counters.clear()
+
+
+class ObjStreamWriter:
+    """
+    Streaming Wavefront OBJ writer. Points, normals, texture coordinates and polygon
+    connectivity are read as NumPy views of the VTK buffers and formatted CHUNK rows at
+    a time with one %-format over a repeated row template, so there is no Python loop
+    per vertex or face and the text in memory never exceeds one chunk. Polygons keep
+    their original sizes (no triangulation). Usage:
+
+        with open(path, "w", encoding="utf-8", newline="\n") as f:
+            w = ObjStreamWriter(f, normals=True, uvs=True)
+            w.write_object("part", poly, material="part_mtl")
+    """
+    CHUNK = 1 << 16
+
+    def __init__(self, fileobj, normals=False, uvs=False):
+        self.f = fileobj
+        self.normals = normals
+        self.uvs = uvs
+        self.v_offset = 0
+        self.vt_offset = 0
+        self.vn_offset = 0
+        self.bytes_written = 0
+
+    def _write(self, text):
+        self.f.write(text)
+        # Bytes of the UTF-8 file, not characters (object / material names may be non-ASCII)
+        self.bytes_written += len(text) if text.isascii() else len(text.encode("utf-8"))
+
+    def _write_rows(self, template, rows):
+        """rows: 2-D array; template: one line's %-format for a row."""
+        for start in range(0, len(rows), self.CHUNK):
+            chunk = rows[start:start + self.CHUNK]
+            self._write((template * len(chunk)) % tuple(chunk.ravel().tolist()))
+
+    def write_line(self, text):
+        self._write(text + "\n")
+
+    def write_object(self, name, poly, material=None):
+        """Append one object block ("o name", v / vt / vn, optional usemtl, f)."""
+        n_pts = poly.GetNumberOfPoints()
+        if n_pts == 0:
+            return
+        self.write_line(f"o {name}")
+        pts = numpy_support.vtk_to_numpy(poly.GetPoints().GetData())
+        self._write_rows("v %.6f %.6f %.6f\n", pts.astype(np.float64, copy=False))
+
+        pd = poly.GetPointData()
+        tcoords = pd.GetTCoords() if self.uvs else None
+        normals = pd.GetNormals() if self.normals else None
+        if tcoords is not None:
+            uv = numpy_support.vtk_to_numpy(tcoords).reshape(n_pts, -1)[:, :2]
+            self._write_rows("vt %.6f %.6f\n", uv.astype(np.float64, copy=False))
+        if normals is not None:
+            nrm = numpy_support.vtk_to_numpy(normals).reshape(n_pts, 3)
+            self._write_rows("vn %.6f %.6f %.6f\n", nrm.astype(np.float64, copy=False))
+        if material:
+            self.write_line(f"usemtl {material}")
+
+        # Face tokens: v, v/vt, v//vn or v/vt/vn, with each stream's own running offset
+        streams = [self.v_offset + 1]
+        token = "%d"
+        if tcoords is not None and normals is not None:
+            streams += [self.vt_offset + 1, self.vn_offset + 1]
+            token = "%d/%d/%d"
+        elif tcoords is not None:
+            streams.append(self.vt_offset + 1)
+            token = "%d/%d"
+        elif normals is not None:
+            streams.append(self.vn_offset + 1)
+            token = "%d//%d"
+        self._write_faces(poly.GetPolys(), np.array(streams, dtype=np.int64), token)
+
+        self.v_offset += n_pts
+        if tcoords is not None:
+            self.vt_offset += n_pts
+        if normals is not None:
+            self.vn_offset += n_pts
+
+    def _write_faces(self, cells, bases, token):
+        if cells is None or cells.GetNumberOfCells() == 0:
+            return
+        offsets = numpy_support.vtk_to_numpy(cells.GetOffsetsArray()).astype(np.int64, copy=False)
+        conn = numpy_support.vtk_to_numpy(cells.GetConnectivityArray()).astype(np.int64, copy=False)
+        sizes = np.diff(offsets)
+        n_cells = len(sizes)
+        for start in range(0, n_cells, self.CHUNK):
+            stop = min(start + self.CHUNK, n_cells)
+            # Runs of equal polygon size share one row template
+            cut = start + 1 + np.flatnonzero(sizes[start + 1:stop] != sizes[start:stop - 1])
+            bounds = [start, *cut.tolist(), stop]
+            for a, b in zip(bounds[:-1], bounds[1:]):
+                size = int(sizes[a])
+                if size < 3:
+                    continue    # OBJ faces need 3+ corners (same as before)
+                ids = conn[offsets[a]:offsets[b]].reshape(b - a, size)
+                rows = ids[:, :, None] + bases     # (faces, corners, streams)
+                self._write_rows("f" + (" " + token) * size + "\n", rows.reshape(b - a, -1))
+
+
 class myVTK:
     """
     Core VTK logic class. Now includes file loading capabilities
@@ -50,6 +1240,24 @@ class myVTK:
         self.axis_release_observer = None  # NEW
         self._axis_click_active = False
         self._saved_style = None
+        self.model_cache = ModelCache()
+        # create_object primitives are drawn through one glyph batch per type
+        self.batch_primitives = True
+        self.batches = {}       # object_type -> PrimitiveBatch
+        self.lod = None         # LODManager, created with the renderer
+        # Click picking backend: CPU pickers, or the hardware selector when gpu_picking is on
+        self.gpu_picking = False
+        self.hw_picker = None   # HardwarePicker, created with the renderer
+        # Render scheduling: render_all() only marks the view dirty (see flush_render)
+        self._render_timer = None
+        self._render_pending = False
+        self._last_render = 0.0
+        self._frame_interval = 1.0 / 60.0
+        self.render_requests = 0    # render_all() calls
+        self.render_count = 0       # window renders actually issued by the scheduler
+        self._bulk_depth = 0        # open bulk_add() transactions
+        self._camera_animation = None       # running QVariantAnimation (animate_camera_transition)
+        self._anim_interrupt_tags = []
 
     def get_reader_for_file(self, file_path):
         """Determines the appropriate VTK reader based on file extension."""
@@ -119,6 +1327,23 @@ class myVTK:
         Minimal custom 3DS loader: vertices, faces, UVs, multi-object support.
         Ignores empty nodes. Returns list of (actor, name).
         """
+        output = []
+        for poly, name in self.read_3ds_polydata(file_path):
+            # Wrap in VTK pipeline
+            tp = vtk.vtkTrivialProducer()
+            tp.SetOutput(poly)
+            mapper = self.create_mapper(tp)
+            actor = self.create_actor(mapper)
+            output.append((actor, name))
+
+        print(f"✓ Imported {len(output)} mesh object(s) from 3DS")
+        return output
+
+    def read_3ds_polydata(self, file_path):
+        """
+        Parse a .3ds file into raw geometry only. Returns list of (vtkPolyData, name).
+        Touches no VTK pipeline/render state, so it is safe to call from a loader thread.
+        """
 
         import struct
 
@@ -144,8 +1369,13 @@ class myVTK:
                 s += c
             return s.decode("utf-8", errors="ignore")
 
+        def read_array(f, count, dtype, ncomp):
+            """Read count*ncomp little-endian values in one call as a (count, ncomp) array."""
+            itemsize = np.dtype(dtype).itemsize
+            return np.frombuffer(f.read(count * ncomp * itemsize), dtype=dtype).reshape(-1, ncomp)
+
         # Store meshes here
-        meshes = {}   # name → {verts:[], faces:[], uvs:[]}
+        meshes = {}   # name → {verts, faces, uvs} as NumPy arrays
 
         with open(file_path, "rb") as f:
             # Root chunk
@@ -171,9 +1401,9 @@ class myVTK:
                         if scid == 0x4000:
                             name = read_cstring(f)
                             meshes[name] = {
-                                "verts": [],
-                                "faces": [],
-                                "uvs": []
+                                "verts": np.empty((0, 3), dtype=np.float32),
+                                "faces": np.empty((0, 3), dtype=np.uint16),
+                                "uvs": np.empty((0, 2), dtype=np.float32)
                             }
 
                             # Read object sub-chunks
@@ -191,26 +1421,22 @@ class myVTK:
                                         if not mcid:
                                             break
 
-                                        # VERTEX LIST
+                                        # VERTEX LIST (one read, decoded in bulk)
                                         if mcid == 0x4110:
                                             vcount = struct.unpack("<H", f.read(2))[0]
-                                            for _ in range(vcount):
-                                                x, y, z = struct.unpack("<fff", f.read(12))
-                                                meshes[name]["verts"].append((x, y, z))
+                                            meshes[name]["verts"] = read_array(f, vcount, "<f4", 3)
 
-                                        # FACE LIST
+                                        # FACE LIST (a, b, c, flag) -> drop the flag column
                                         elif mcid == 0x4120:
                                             fcount = struct.unpack("<H", f.read(2))[0]
-                                            for _ in range(fcount):
-                                                a, b, c, flag = struct.unpack("<HHHH", f.read(8))
-                                                meshes[name]["faces"].append((a, b, c))
+                                            meshes[name]["faces"] = read_array(f, fcount, "<u2", 4)[:, :3]
 
-                                        # UV LIST
+                                        # UV LIST (flip V for VTK)
                                         elif mcid == 0x4140:
                                             tcount = struct.unpack("<H", f.read(2))[0]
-                                            for _ in range(tcount):
-                                                u, v = struct.unpack("<ff", f.read(8))
-                                                meshes[name]["uvs"].append((u, 1 - v))
+                                            uvs = read_array(f, tcount, "<f4", 2).copy()
+                                            uvs[:, 1] = 1.0 - uvs[:, 1]
+                                            meshes[name]["uvs"] = uvs
 
                                         skip_to(f, mstart, mclen)
 
@@ -220,7 +1446,7 @@ class myVTK:
 
                 skip_to(f, start, clen)
 
-        # ----------- Build VTK actors -----------
+        # ----------- Build vtkPolyData -----------
         output = []
 
         for name, data in meshes.items():
@@ -231,42 +1457,270 @@ class myVTK:
             if len(verts) == 0 or len(faces) == 0:
                 continue  # ignore empty nodes, per your Option A
 
-            # Build vtkPolyData
-            pts = vtk.vtkPoints()
-            for v in verts:
-                pts.InsertNextPoint(v)
+            # Build vtkPolyData straight from the decoded buffers
+            offsets = np.arange(0, 3 * len(faces) + 1, 3, dtype=np.int64)
+            poly = self.polydata_from_arrays(
+                verts, faces.reshape(-1), offsets,
+                tcoords=uvs if len(uvs) == len(verts) else None)
+            output.append((poly, name))
 
-            polys = vtk.vtkCellArray()
-            for a, b, c in faces:
-                polys.InsertNextCell(3)
-                polys.InsertCellPoint(a)
-                polys.InsertCellPoint(b)
-                polys.InsertCellPoint(c)
-
-            poly = vtk.vtkPolyData()
-            poly.SetPoints(pts)
-            poly.SetPolys(polys)
-
-            # UVs
-            if len(uvs) == len(verts):
-                tcoords = vtk.vtkFloatArray()
-                tcoords.SetNumberOfComponents(2)
-                tcoords.SetName("TextureCoordinates")
-                for uv in uvs:
-                    tcoords.InsertNextTuple(uv)
-                poly.GetPointData().SetTCoords(tcoords)
+        return output
 
-            # Wrap in VTK pipeline
+    def load_obj_scene(self, file_path):
+        """
+        Single-pass multi-object OBJ loader: one vtkPolyData per 'o <name>' block.
+        Global v/vt tables are read once and each object is remapped to its own
+        compact vertex set, so nothing is re-parsed and no temp files are written.
+        Returns list of (actor, name).
+        """
+        output = []
+        for poly, name in self.read_obj_polydata(file_path):
             tp = vtk.vtkTrivialProducer()
             tp.SetOutput(poly)
             mapper = self.create_mapper(tp)
             actor = self.create_actor(mapper)
-
+            self._apply_obj_defaults(actor)
             output.append((actor, name))
 
-        print(f"✓ Imported {len(output)} mesh object(s) from 3DS")
+        print(f"✓ Imported {len(output)} mesh object(s) from OBJ")
         return output
 
+    def _apply_obj_defaults(self, actor):
+        """Y-up -> Z-up and brighter defaults for textured models (same as load_file)."""
+        self.orient_actor_y_up_to_z_up(actor)
+        prop = actor.GetProperty()
+        prop.SetAmbient(0.3)
+        prop.SetDiffuse(0.8)
+        prop.SetSpecular(0.2)
+
+    def read_obj_polydata(self, file_path, progress=None, cancel=None):
+        """
+        Parse an OBJ into one vtkPolyData per object. Returns list of (vtkPolyData, name).
+        progress(fraction) is called as the file is consumed; a set cancel event aborts
+        with LoadCancelled. Safe to call from a loader thread.
+        """
+        from array import array
+
+        v = array("d")      # flat x, y, z
+        vt = array("d")     # flat u, v
+        parts = []          # [(name, corner_v, corner_vt, sizes)]
+        cur = None
+
+        def new_part(name):
+            return (name, array("q"), array("q"), array("q"))
+
+        total = max(1, os.path.getsize(file_path))
+        try:
+            with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
+                for lineno, ln in enumerate(f):
+                    if lineno & 0xFFFF == 0 and lineno:
+                        if cancel is not None and cancel.is_set():
+                            raise LoadCancelled(file_path)
+                        if progress:
+                            progress(min(1.0, f.buffer.tell() / total))
+                    if ln.startswith("v "):
+                        toks = ln.split()
+                        v.extend((float(toks[1]), float(toks[2]), float(toks[3])))
+                    elif ln.startswith("vt "):
+                        toks = ln.split()
+                        vt.extend((float(toks[1]), float(toks[2]) if len(toks) > 2 else 0.0))
+                    elif ln.startswith("f "):
+                        if cur is None:
+                            cur = new_part("Object")
+                            parts.append(cur)
+                        _, corner_v, corner_vt, sizes = cur
+                        nv = len(v) // 3
+                        nt = len(vt) // 2
+                        toks = ln.split()[1:]
+                        for tok in toks:
+                            idx = tok.split("/")
+                            # Index 0 and relative indices before the first vertex come out
+                            # negative; those faces (and ids past the end) are dropped below
+                            vi = int(idx[0])
+                            corner_v.append(vi - 1 if vi > 0 else (nv + vi if vi < 0 else -1))
+                            if len(idx) > 1 and idx[1]:
+                                ti = int(idx[1])
+                                corner_vt.append(ti - 1 if ti > 0 else (nt + ti if ti < 0 else -1))
+                            else:
+                                corner_vt.append(-1)
+                        sizes.append(len(toks))
+                    elif ln.startswith("o "):
+                        cur = new_part(ln.strip()[2:].strip() or "Object")
+                        parts.append(cur)
+        except LoadCancelled:
+            raise
+        except Exception as e:
+            print(f"OBJ parse failed: {e}")
+            return []
+
+        V = np.frombuffer(v, dtype=np.float64).reshape(-1, 3)
+        VT = np.frombuffer(vt, dtype=np.float64).reshape(-1, 2)
+
+        output = []
+        skipped = 0
+        for name, corner_v, corner_vt, sizes in parts:
+            if len(sizes) == 0:
+                continue
+            cv = np.frombuffer(corner_v, dtype=np.int64)
+            ct = np.frombuffer(corner_vt, dtype=np.int64)
+            sizes = np.frombuffer(sizes, dtype=np.int64)
+
+            # Skip faces with a corner outside the vertex list; a bad UV id drops the UVs only
+            bad = (cv < 0) | (cv >= len(V))
+            if bad.any():
+                face_of = np.repeat(np.arange(len(sizes)), sizes)
+                bad_face = np.bincount(face_of[bad], minlength=len(sizes)) > 0
+                keep = ~bad_face[face_of]
+                cv, ct, sizes = cv[keep], ct[keep], sizes[~bad_face]
+                skipped += int(bad_face.sum())
+                if len(sizes) == 0:
+                    continue
+            ct = np.where(ct < len(VT), ct, -1)
+
+            # Compact per-object vertex set; (v, vt) pairs become one VTK point
+            has_uv = len(VT) > 0 and bool((ct >= 0).all())
+            if has_uv:
+                keys, conn = np.unique(np.stack([cv, ct], axis=1), axis=0, return_inverse=True)
+                points, tcoords = V[keys[:, 0]], VT[keys[:, 1]]
+            else:
+                keys, conn = np.unique(cv, return_inverse=True)
+                points, tcoords = V[keys], None
+
+            offsets = np.zeros(len(sizes) + 1, dtype=np.int64)
+            np.cumsum(sizes, out=offsets[1:])
+            poly = self.polydata_from_arrays(points, conn.reshape(-1), offsets, tcoords=tcoords)
+            output.append((poly, name))
+
+        if skipped:
+            print(f"OBJ: skipped {skipped} face(s) with out-of-range vertex indices in "
+                  f"{os.path.basename(file_path)}")
+        return output
+
+    def polydata_from_arrays(self, points, connectivity, offsets, tcoords=None):
+        """
+        Build a vtkPolyData from NumPy buffers without per-element Python work.
+        points: (N, 3) floats; connectivity/offsets: flat polygon layout as used by
+        vtkCellArray.SetData; tcoords: optional (N, 2) UVs.
+        """
+        pts = vtk.vtkPoints()
+        pts.SetData(numpy_support.numpy_to_vtk(
+            np.ascontiguousarray(points, dtype=np.float32), deep=1))
+
+        polys = vtk.vtkCellArray()
+        polys.SetData(
+            numpy_support.numpy_to_vtkIdTypeArray(np.ascontiguousarray(offsets, dtype=np.int64), deep=1),
+            numpy_support.numpy_to_vtkIdTypeArray(np.ascontiguousarray(connectivity, dtype=np.int64), deep=1))
+
+        poly = vtk.vtkPolyData()
+        poly.SetPoints(pts)
+        poly.SetPolys(polys)
+
+        if tcoords is not None:
+            tc = numpy_support.numpy_to_vtk(np.ascontiguousarray(tcoords, dtype=np.float32), deep=1)
+            tc.SetName("TextureCoordinates")
+            poly.GetPointData().SetTCoords(tc)
+        return poly
+
+    def prepare_model(self, file_path, progress=None, cancel=None):
+        """
+        Worker-thread half of a model import: read the file and run the clean + normals
+        stage to completion. Only builds private pipeline objects, so it never touches the
+        renderer. progress(fraction) is fed from each vtkAlgorithm ProgressEvent; a set
+        cancel event aborts the running filter and raises LoadCancelled.
+        Unchanged files are served from model_cache without parsing or filtering.
+        Returns list of (name, (cleaner, normals), cached_output) for finish_loaded_model.
+        """
+        extension = os.path.splitext(file_path)[1].lower()
+
+        key = None
+        try:
+            key = self.model_cache.key_for(file_path)
+            cached = self.model_cache.load(key)
+        except OSError:
+            cached = None
+        if cached:
+            prepared = []
+            for name, poly in cached:
+                # Live stage stays attached for later normals changes but is not run now
+                tp = vtk.vtkTrivialProducer()
+                tp.SetOutput(poly)
+                prepared.append((name, self.build_surface_pipeline(tp), poly))
+            if progress:
+                progress(1.0)
+            return prepared
+        # First half of the bar is reading, second half is clean + normals
+        stage = [0.0, 0.5]
+
+        def report(frac):
+            if progress:
+                progress(stage[0] + stage[1] * max(0.0, min(1.0, frac)))
+
+        def on_progress(caller, evt):
+            if cancel is not None and cancel.is_set():
+                caller.SetAbortExecute(1)
+            report(caller.GetProgress())
+
+        def run(alg):
+            alg.AddObserver("ProgressEvent", on_progress)
+            alg.Update()
+            if cancel is not None and cancel.is_set():
+                raise LoadCancelled(file_path)
+
+        if extension == ".3ds":
+            sources = []
+            for poly, name in self.read_3ds_polydata(file_path):
+                tp = vtk.vtkTrivialProducer()
+                tp.SetOutput(poly)
+                sources.append((name, tp))
+            if not sources:
+                raise ValueError("Failed or empty 3DS scene.")
+        elif extension == ".obj":
+            sources = []
+            for poly, name in self.read_obj_polydata(file_path, progress=report, cancel=cancel):
+                tp = vtk.vtkTrivialProducer()
+                tp.SetOutput(poly)
+                sources.append((name, tp))
+            if not sources:
+                # No faces found by the fast parser: fall back to vtkOBJReader
+                reader = vtk.vtkOBJReader()
+                reader.SetFileName(file_path)
+                run(reader)
+                sources = [(os.path.basename(file_path), reader)]
+        else:
+            reader = self.get_reader_for_file(file_path)
+            if not reader:
+                raise ValueError(f"Unsupported file format: {extension}")
+            reader.SetFileName(file_path)
+            run(reader)
+            sources = [(os.path.basename(file_path), reader)]
+
+        prepared = []
+        n = len(sources)
+        for i, (name, src) in enumerate(sources):
+            stage[:] = [0.5 + 0.5 * i / n, 0.5 / n]
+            cleaner, normals = self.build_surface_pipeline(src)
+            run(normals)
+            prepared.append((name, (cleaner, normals), None))
+        if key:
+            self.model_cache.store(key, [(name, pipeline[1].GetOutput()) for name, pipeline, _ in prepared])
+        report(1.0)
+        return prepared
+
+    def finish_loaded_model(self, file_path, prepared):
+        """
+        Main-thread half of a model import: attach mappers/actors to the pipelines that
+        prepare_model already executed. Returns list of (actor, name).
+        """
+        extension = os.path.splitext(file_path)[1].lower()
+        output = []
+        for name, pipeline, cached_output in prepared:
+            mapper = self.create_mapper(None, pipeline=pipeline, output=cached_output)
+            actor = self.create_actor(mapper)
+            if extension == ".obj":
+                self._apply_obj_defaults(actor)
+            output.append((actor, name))
+        print(f"✓ Imported {len(output)} mesh object(s) from {os.path.basename(file_path)}")
+        return output
 
     def create_parametric(self, kind: str):
         mapping = {
@@ -652,12 +2106,23 @@ class myVTK:
 
         self.sources.append(source)
         print(f"✓ {object_type.capitalize()} source created")
-        mapper = self.create_mapper(source)
-        actor = self.create_actor(mapper)
+        if self.batch_primitives and self.renderer is not None:
+            # Proxy actor sharing the batch's prototype mapper; add_actor_to_scene
+            # puts it into the glyph batch instead of the renderer
+            batch = self.batches.get(object_type)
+            if batch is None:
+                batch = PrimitiveBatch(self.renderer, object_type, self.create_mapper(source))
+                self.batches[object_type] = batch
+            actor = self.create_actor(batch.proto_mapper)
+            actor._vt_batch = batch
+        else:
+            mapper = self.create_mapper(source)
+            actor = self.create_actor(mapper)
         self.current_object_name = object_type
         return actor, object_type
     
-    def create_mapper(self, source):
+    def build_surface_pipeline(self, source):
+        """Clean + normals stage shared by every mesh mapper. Returns (cleaner, normals), not yet updated."""
         cleaner = vtk.vtkCleanPolyData()
         cleaner.SetInputConnection(source.GetOutputPort())
 
@@ -670,9 +2135,24 @@ class myVTK:
         # Use point normals by default for Gouraud/Phong
         normals.ComputeCellNormalsOff()
         normals.ComputePointNormalsOn()
+        return cleaner, normals
+
+    def create_mapper(self, source, pipeline=None, output=None):
+        """
+        Mapper fed by the clean + normals stage. Pass pipeline=(cleaner, normals) to reuse
+        a stage that was already executed (e.g. by a loader thread) instead of building one.
+        output is a precomputed result of that stage (model cache hit): the mapper draws it
+        directly and keeps the stage only for later normals changes.
+        """
+        cleaner, normals = pipeline if pipeline is not None else self.build_surface_pipeline(source)
 
         mapper = vtk.vtkPolyDataMapper()
-        mapper.SetInputConnection(normals.GetOutputPort())
+        if output is not None:
+            tp = vtk.vtkTrivialProducer()
+            tp.SetOutput(output)
+            mapper.SetInputConnection(tp.GetOutputPort())
+        else:
+            mapper.SetInputConnection(normals.GetOutputPort())
         mapper.InterpolateScalarsBeforeMappingOff()
         mapper.ScalarVisibilityOff()
 
@@ -680,11 +2160,24 @@ class myVTK:
         try:
             mapper._vt_cleaner = cleaner
             mapper._vt_normals = normals
+            mapper._vt_cached_output = output is not None
         except Exception:
             pass
 
         self.mappers.append(mapper)
         return mapper
+
+    def create_edited_mapper(self, poly):
+        """
+        Clean + normals mapper for a polydata produced by an edit tool. The tools resume
+        from poly rather than from the (normal-split) mapper output, so point ids stay
+        the same across edit sessions and earlier undo deltas still apply.
+        """
+        tp = vtk.vtkTrivialProducer()
+        tp.SetOutput(poly)
+        mapper = self.create_mapper(tp)
+        mapper._vt_edit_source = poly
+        return mapper
     
     def create_actor(self, mapper):
         actor = vtk.vtkActor()
@@ -717,6 +2210,10 @@ class myVTK:
         self.window = vtk_widget.GetRenderWindow()
         self.window.AddRenderer(self.renderer)
         self.interactor = self.window.GetInteractor()
+        # Frame-rate target for interactive renders; LODManager budgets against it
+        self.interactor.SetDesiredUpdateRate(LODManager.TARGET_FPS)
+        self.lod = LODManager(self.renderer)
+        self.hw_picker = HardwarePicker(self.renderer, self.batches)
 
         # Make sure the interactor/context is initialized
         try:
@@ -725,6 +2222,19 @@ class myVTK:
         except Exception:
             pass
 
+        # Coalesced rendering: one render per display refresh at most
+        try:
+            screen = vtk_widget.screen() if hasattr(vtk_widget, "screen") else QtGui.QGuiApplication.primaryScreen()
+            if screen and screen.refreshRate() > 1:
+                self._frame_interval = 1.0 / screen.refreshRate()
+        except Exception:
+            pass
+        self._render_timer = QtCore.QTimer(vtk_widget)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.timeout.connect(self.flush_render)
+        # Renders started elsewhere (interactor styles, widgets) satisfy pending requests too
+        self.window.AddObserver("StartEvent", self._on_window_render_start)
+
         self.setup_grid()
         self.setup_axis_lines()
         self.setup_axes_widget()
@@ -733,22 +2243,13 @@ class myVTK:
 
     def setup_grid(self):
         """Creates a Blender-like infinite grid with fading effect."""
-        # Create a plane source for the grid, make it much larger for an "infinite" feel
-        grid_size = 500
-        grid_resolution = 1000 # Increase resolution for the larger size
-        plane = vtk.vtkPlaneSource()
-        plane.SetOrigin(-grid_size, -grid_size, -0.01)
-        plane.SetPoint1(grid_size, -grid_size, -0.01)
-        plane.SetPoint2(-grid_size, grid_size, -0.01)
-        plane.SetXResolution(grid_resolution)
-        plane.SetYResolution(grid_resolution)
-        plane.Update()
-        
-        grid_polydata = plane.GetOutput()
-        
-        # Create a mapper and resolve Z-fighting
+        # A few hundred lines regenerated from the camera (see update_grid) instead of a
+        # fixed 1000x1000 plane: spacing follows the zoom level in powers of ten.
+        self.grid_polydata = vtk.vtkPolyData()
         mapper = vtk.vtkPolyDataMapper()
-        mapper.SetInputData(grid_polydata)
+        mapper.SetInputData(self.grid_polydata)
+        mapper.SetColorModeToDirectScalars()
+        mapper.ScalarVisibilityOn()
         # This is the key to preventing the grid from rendering through objects
         mapper.SetResolveCoincidentTopologyToPolygonOffset()
         mapper.SetRelativeCoincidentTopologyPolygonOffsetParameters(-1, -1)
@@ -756,13 +2257,75 @@ class myVTK:
         # Create the grid actor
         self.grid_actor = vtk.vtkActor()
         self.grid_actor.SetMapper(mapper)
-        self.grid_actor.GetProperty().SetRepresentationToWireframe()
         self.grid_actor.GetProperty().SetColor(0.294, 0.294, 0.294)
         self.grid_actor.GetProperty().SetOpacity(0.5)
         self.grid_actor.GetProperty().SetLineWidth(1)
         self.grid_actor.PickableOff()
-        
+
+        self._grid_key = None
+        self.update_grid()
         self.renderer.AddActor(self.grid_actor)
+        # Follow the camera before bounds are taken (clipping range) and before drawing
+        for evt in ("ComputeVisiblePropBoundsEvent", "StartEvent"):
+            self.renderer.AddObserver(evt, lambda *a: self.update_grid())
+
+    def update_grid(self, lines_per_side=100):
+        """
+        Rebuild the grid lines for the current camera. Minor spacing is the power of ten
+        below distance/30 (1 unit at the default view), majors every 10 minors; minor
+        lines fade out as the view zooms towards the next power, and all lines fade
+        towards their ends. Only rebuilt when spacing, center or fade step change.
+        """
+        if not self.renderer or not self.grid_actor:
+            return
+        camera = self.renderer.GetActiveCamera()
+        dist = max(1e-6, camera.GetDistance())
+        exponent = np.log10(dist / 30.0)
+        level = int(np.floor(exponent))
+        fade = round((exponent - level) * 16) / 16.0
+        minor = 10.0 ** level
+        major = minor * 10.0
+        fx, fy, _ = camera.GetFocalPoint()
+        cx, cy = round(fx / major) * major, round(fy / major) * major
+        color = self.grid_actor.GetProperty().GetColor()
+        key = (level, cx, cy, fade, color)
+        if key == self._grid_key:
+            return
+        self._grid_key = key
+
+        # Each line is 3 points (end, point nearest the center, end) so alpha can fall off
+        # to zero at both ends; minor lines cover lines_per_side * minor, majors 10x that.
+        rgb = [int(round(c * 255)) for c in color]
+        pts, alphas = [], []
+        for spacing, half, alpha in ((minor, lines_per_side * minor, 1.0 - fade),
+                                     (major, lines_per_side * major, 1.0)):
+            if alpha <= 0.0:
+                continue
+            index = np.arange(-lines_per_side, lines_per_side + 1)
+            if spacing == minor:
+                index = index[index % 10 != 0]      # every 10th minor line is a major line
+            offsets = index * spacing
+            for along_x in (True, False):
+                for o in offsets:
+                    for t, a in ((-half, 0.0), (0.0, alpha), (half, 0.0)):
+                        pts.append((cx + t, cy + o, -0.01) if along_x else (cx + o, cy + t, -0.01))
+                        alphas.append(a)
+        n_lines = len(pts) // 3
+        points = vtk.vtkPoints()
+        points.SetData(numpy_support.numpy_to_vtk(np.asarray(pts, dtype=np.float64), deep=1))
+        lines = vtk.vtkCellArray()
+        lines.SetData(numpy_support.numpy_to_vtkIdTypeArray(np.arange(0, 3 * n_lines + 1, 3, dtype=np.int64), deep=1),
+                      numpy_support.numpy_to_vtkIdTypeArray(np.arange(3 * n_lines, dtype=np.int64), deep=1))
+        colors = np.empty((3 * n_lines, 4), dtype=np.uint8)
+        colors[:, :3] = rgb
+        colors[:, 3] = np.round(np.asarray(alphas) * 255.0)
+        scalars = numpy_support.numpy_to_vtk(colors, deep=1)
+        scalars.SetName("GridColor")
+
+        self.grid_polydata.SetPoints(points)
+        self.grid_polydata.SetLines(lines)
+        self.grid_polydata.GetPointData().SetScalars(scalars)
+        self.grid_polydata.Modified()
 
     def setup_axis_lines(self):
         """Creates colored axis lines (X=Red, Y=Green, Z=Blue)."""
@@ -818,6 +2381,22 @@ class myVTK:
         
         self.renderer.ResetCameraClippingRange()
 
+    def reset_camera(self):
+        """
+        View > Reset Camera. The grid is sized from the camera distance, so it is left out
+        of the bounds being framed (otherwise every reset zooms out ~30x further). It is
+        counted again for the clipping range so the far plane still covers it.
+        """
+        if self.grid_actor:
+            self.grid_actor.UseBoundsOff()
+        try:
+            self.renderer.ResetCamera()
+        finally:
+            if self.grid_actor:
+                self.grid_actor.UseBoundsOn()
+        self.renderer.ResetCameraClippingRange()
+        self.render_all()
+
     def setup_axes_widget(self):
         """Creates and configures the orientation axes widget with clickable axis labels."""
         # Create the axes actor
@@ -858,6 +2437,13 @@ class myVTK:
         # Also swallow release to avoid camera spin when clicking the axes
         if self.interactor and self.axis_release_observer is None:
             self.axis_release_observer = self.interactor.AddObserver('LeftButtonReleaseEvent', self.on_axis_click, priority)
+        # Any click or wheel interrupts a running camera animation; runs before
+        # on_axis_click, which may then start a new one from the current view
+        if self.interactor and not self._anim_interrupt_tags:
+            for evt in ("LeftButtonPressEvent", "MiddleButtonPressEvent", "RightButtonPressEvent",
+                        "MouseWheelForwardEvent", "MouseWheelBackwardEvent"):
+                self._anim_interrupt_tags.append(
+                    self.interactor.AddObserver(evt, lambda *a: self.stop_camera_animation(), priority + 100.0))
     
     def _suppress_camera_style_begin(self):
         try:
@@ -883,6 +2469,14 @@ class myVTK:
         """Stop rendering and detach VTK widgets/observers safely."""
         # Stop future renders
         self._alive = False
+        try:
+            if self._camera_animation is not None:
+                self._camera_animation.stop()
+                self._camera_animation = None
+            if self._render_timer is not None:
+                self._render_timer.stop()
+        except Exception:
+            pass
         # Disable interactive widgets
         try:
             if self.axes_widget:
@@ -1001,94 +2595,153 @@ class myVTK:
         # Animate camera movement
         self.animate_camera_transition(current_pos, target_pos, camera.GetViewUp(), target_up, focal_point)
 
-    def animate_camera_transition(self, start_pos, end_pos, start_up, end_up, focal_point, steps=30):
-        """Smoothly interpolates camera from start to end position with lifecycle guards."""
-        camera = self.renderer.GetActiveCamera()
-        if not camera or not self.renderer or not self.window:
+    def animate_camera_transition(self, start_pos, end_pos, start_up, end_up, focal_point, duration=0.35):
+        """
+        Smoothly interpolates camera from start to end position without blocking the UI.
+        A QVariantAnimation places the camera for the elapsed wall-clock time on each tick
+        and requests a coalesced render, so slow frames are dropped instead of stretching
+        the animation. Starting another transition, or a click / wheel in the viewport,
+        interrupts the running one.
+        """
+        camera = self.renderer.GetActiveCamera() if self.renderer else None
+        if not camera or not self.window:
             return
-    
-        try:
-            steps = max(1, int(steps))
-        except Exception:
-            steps = 30
-    
-        # Block input during animation
-        try:
-            if self.interactor:
-                self.interactor.Disable()
-        except Exception:
-            pass
-    
+        self.stop_camera_animation()
+
         fx, fy, fz = focal_point
-    
-        for i in range(steps + 1):
-            # Stop if window is gone or not drawable (prevents wglMakeCurrent errors on Windows)
-            if not self._alive:
-                break
-            try:
-                if hasattr(self.window, "IsDrawable") and not self.window.IsDrawable():
-                    break
-                if hasattr(self.window, "GetMapped") and not self.window.GetMapped():
-                    break
-            except Exception:
-                break
-    
+
+        def place(t):
             # Smoothstep easing
-            t = i / float(steps)
             t = t * t * (3.0 - 2.0 * t)
-    
-            # Interpolate position and view-up
-            pos = (
-                start_pos[0] + (end_pos[0] - start_pos[0]) * t,
-                start_pos[1] + (end_pos[1] - start_pos[1]) * t,
-                start_pos[2] + (end_pos[2] - start_pos[2]) * t,
-            )
-            up = (
-                start_up[0] + (end_up[0] - start_up[0]) * t,
-                start_up[1] + (end_up[1] - start_up[1]) * t,
-                start_up[2] + (end_up[2] - start_up[2]) * t,
-            )
-    
-            camera.SetPosition(pos)
+            camera.SetPosition(*(start_pos[i] + (end_pos[i] - start_pos[i]) * t for i in range(3)))
             camera.SetFocalPoint(fx, fy, fz)
-            camera.SetViewUp(up)
-    
+            camera.SetViewUp(*(start_up[i] + (end_up[i] - start_up[i]) * t for i in range(3)))
             try:
                 self.renderer.ResetCameraClippingRange()
             except Exception:
                 pass
+
+        if self._render_timer is None:
+            # No event loop to drive the animation: jump to the end
+            place(1.0)
             self.render_all()
-    
-            # Keep UI responsive and pace the animation
-            try:
-                QtCore.QCoreApplication.processEvents(QtCore.QEventLoop.AllEvents, 1)
-                QtCore.QThread.msleep(10)
-            except Exception:
-                pass
-    
-        # Re-enable input
+            return
+
+        def on_value(value):
+            if not self._alive:
+                self.stop_camera_animation()
+                return
+            place(float(value))
+            self.render_all()
+
+        anim = QtCore.QVariantAnimation()
+        anim.setStartValue(0.0)
+        anim.setEndValue(1.0)
+        anim.setDuration(max(1, int(duration * 1000)))
+        anim.valueChanged.connect(on_value)
+        anim.finished.connect(self._on_camera_animation_finished)
+        self._camera_animation = anim
+        # Interactive rate while moving so LOD levels are used
         try:
             if self.interactor:
-                self.interactor.Enable()
+                self.window.SetDesiredUpdateRate(self.interactor.GetDesiredUpdateRate())
+        except Exception:
+            pass
+        anim.start()
+
+    def stop_camera_animation(self):
+        """Interrupt a running animate_camera_transition, leaving the camera where it is."""
+        anim = self._camera_animation
+        if anim is None:
+            return
+        self._camera_animation = None
+        anim.stop()
+        self._end_camera_animation()
+
+    def _on_camera_animation_finished(self):
+        self._camera_animation = None
+        self._end_camera_animation()
+
+    def _end_camera_animation(self):
+        # Back to the still rate and draw the final frame at full detail
+        try:
+            if self.interactor and self.window:
+                self.window.SetDesiredUpdateRate(self.interactor.GetStillUpdateRate())
         except Exception:
             pass
-    
         # Safety: ensure interactor style is restored even if mouse release was missed
         try:
             self._suppress_camera_style_end()
         except Exception:
             pass
+        self.render_all()
 
     def add_actor_to_scene(self, actor):
         if actor:
-            self.renderer.AddActor(actor)
+            # Execute the pipeline here rather than in the (deferred) render: callers read
+            # mapper.GetInput() right away for stats, gizmo bounds and LOD levels
+            mapper = actor.GetMapper()
+            if mapper is not None:
+                mapper.Update()
+            batch = getattr(actor, "_vt_batch", None)
+            if batch is not None:
+                batch.add(actor)
+            else:
+                self.renderer.AddActor(actor)
             # Track all scene actors (meshes, gizmos) for proper cleanup
             if actor not in self.actors:
                 self.actors.append(actor)
-            print(f"✓ Added actor to scene")
-        # Use ResetCameraClippingRange instead of ResetCamera to avoid zooming out
-        self.renderer.ResetCameraClippingRange()
-        self.render_all()
+            if not self._bulk_depth:
+                print(f"✓ Added actor to scene")
+        if not self._bulk_depth:
+            # Use ResetCameraClippingRange instead of ResetCamera to avoid zooming out
+            self.renderer.ResetCameraClippingRange()
+            self.render_all()
+        if actor and self.lod:
+            self.lod.track(actor)
+
+    @contextlib.contextmanager
+    def bulk_add(self):
+        """
+        Add many actors as one transaction: inside the block add_actor_to_scene skips
+        its clipping-range reset and redraw request; the outermost block does each once
+        on exit.
+        """
+        self._bulk_depth += 1
+        try:
+            yield
+        finally:
+            self._bulk_depth -= 1
+            if not self._bulk_depth and self.renderer is not None:
+                self.renderer.ResetCameraClippingRange()
+                self.render_all()
+
+    def remove_actor_from_scene(self, actor):
+        """Counterpart of add_actor_to_scene (handles batched primitive proxies)."""
+        batch = getattr(actor, "_vt_batch", None)
+        if batch is not None:
+            batch.remove(actor)
+        else:
+            self.renderer.RemoveActor(actor)
+        if self.lod:
+            self.lod.untrack(actor)
+
+    def release_from_batch(self, actor):
+        """
+        Turn a batched primitive proxy into a regular renderer actor (it keeps sharing
+        the prototype mapper). Used before edits the glyph path cannot express:
+        geometry editing, textures, per-object material settings.
+        """
+        batch = getattr(actor, "_vt_batch", None)
+        if batch is None:
+            return
+        live = batch.contains(actor)
+        batch.remove(actor)
+        actor._vt_batch = None
+        if live:
+            self.renderer.AddActor(actor)
+            if self.lod:
+                self.lod.track(actor)
 
     def clear_scene(self):
         print("Clearing scene...")
@@ -1096,6 +2749,11 @@ class myVTK:
         for actor in self.actors:
             self.renderer.RemoveActor(actor)
         self.actors.clear()
+        for batch in self.batches.values():
+            batch.clear()
+        self.batches.clear()
+        if self.lod:
+            self.lod.clear()
         self.mappers.clear()
         self.sources.clear()
         # Remove user-added lights
@@ -1105,6 +2763,27 @@ class myVTK:
         self.render_all()
 
     def render_all(self):
+        """
+        Request a redraw. The view is only marked dirty; a single-shot timer renders once
+        on the next tick, at most once per display refresh, however many requests came in.
+        Use flush_render() when the frame has to be drawn before returning.
+        """
+        if not self._alive or not self.window:
+            return
+        self.render_requests += 1
+        if self.hw_picker is not None:
+            self.hw_picker.invalidate()
+        if self._render_timer is None:
+            # No event loop yet (or headless use): render synchronously
+            self.flush_render()
+            return
+        self._render_pending = True
+        if not self._render_timer.isActive():
+            wait = self._frame_interval - (time.perf_counter() - self._last_render)
+            self._render_timer.start(max(0, int(wait * 1000)))
+
+    def flush_render(self):
+        """Render synchronously now (animation frames, screenshots); absorbs pending requests."""
         # Guard against rendering during teardown or when not drawable
         if not self._alive or not self.window:
             return
@@ -1114,10 +2793,44 @@ class myVTK:
             if hasattr(self.window, "GetMapped") and not self.window.GetMapped():
                 return
             self.window.Render()
+            self.render_count += 1
         except Exception:
             # Swallow render errors during shutdown on Windows
             pass
 
+    def _on_window_render_start(self, caller, evt):
+        self._render_pending = False
+        self._last_render = time.perf_counter()
+        if self._render_timer is not None:
+            self._render_timer.stop()
+
+    def active_hardware_picker(self):
+        """The HardwarePicker when GPU picking is on (pending frame drawn first), else None."""
+        if not self.gpu_picking or self.hw_picker is None:
+            return None
+        # The selector's capture passes count as a window render and would swallow the request
+        if self._render_pending:
+            self.flush_render()
+        return self.hw_picker
+
+    def pick_cell(self, x, y, cell_picker):
+        """
+        Pick at display (x, y) with the active backend: (actor, cell_id, world_pos), or
+        (None, -1, None) on a miss. cell_picker is the caller's vtkCellPicker (CPU backend).
+        """
+        hw = self.active_hardware_picker()
+        if hw is not None:
+            return hw.pick_cell(x, y)
+        cell_picker.Pick(x, y, 0, self.renderer)
+        actor = cell_picker.GetActor()
+        if actor is None:
+            return None, -1, None
+        cid = cell_picker.GetCellId()
+        return actor, int(cid) if cid >= 0 else -1, cell_picker.GetPickPosition()
+
+    def render_stats_text(self):
+        return f"Renders: {self.render_count} / {self.render_requests} requested"
+
     def change_color(self, color, actor=None):
         if actor:
             actor.GetProperty().SetColor(color)
@@ -1212,6 +2925,110 @@ class CameraPropertiesDialog(QtWidgets.QDialog):
         self.renderer.ResetCameraClippingRange()
         self.parent().vtk_app.render_all()
 
+class UndoSettingsDialog(QtWidgets.QDialog):
+    """Undo history limits: memory budget, number of steps and spilling old edits to disk."""
+    def __init__(self, main, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Undo History Settings")
+        layout = QtWidgets.QFormLayout(self)
+        self.budget_spin = QtWidgets.QSpinBox()
+        self.budget_spin.setRange(16, 1 << 20)
+        self.budget_spin.setSingleStep(64)
+        self.budget_spin.setSuffix(" MB")
+        self.budget_spin.setValue(main.undo_memory_budget // 2**20)
+        layout.addRow("Memory budget", self.budget_spin)
+        self.steps_spin = QtWidgets.QSpinBox()
+        self.steps_spin.setRange(1, 100000)
+        self.steps_spin.setValue(main.undo_max_steps)
+        layout.addRow("Maximum steps", self.steps_spin)
+        self.spill_check = QtWidgets.QCheckBox("Move old geometry edits to disk (compressed)")
+        self.spill_check.setChecked(main.undo_spill)
+        layout.addRow(self.spill_check)
+        buttons = QtWidgets.QDialogButtonBox(
+            QtWidgets.QDialogButtonBox.Ok | QtWidgets.QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addRow(buttons)
+
+class ObjExportOptionsDialog(QtWidgets.QDialog):
+    """Optional per-vertex attributes and materials for the multi-object OBJ export."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Export Multi-Object OBJ")
+        layout = QtWidgets.QFormLayout(self)
+        self.normals_check = QtWidgets.QCheckBox("Vertex normals (vn)")
+        self.uvs_check = QtWidgets.QCheckBox("Texture coordinates (vt), where present")
+        self.materials_check = QtWidgets.QCheckBox("Materials (.mtl file, usemtl per object)")
+        for check in (self.normals_check, self.uvs_check, self.materials_check):
+            layout.addRow(check)
+        buttons = QtWidgets.QDialogButtonBox(
+            QtWidgets.QDialogButtonBox.Ok | QtWidgets.QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addRow(buttons)
+
+class ExportWorker(QtCore.QThread):
+    """
+    One thread of the export_all_to_directory pool: takes (name, polydata, world matrix,
+    clean, path) jobs off a queue shared with the other workers and runs transform, clean and
+    write for each. VTK releases the GIL while filters and writers execute, so the
+    workers run on separate cores; results come back through a queued signal.
+    """
+    exported = QtCore.pyqtSignal(str, str, float, str)     # name, path, ms, error ("" = ok)
+
+    def __init__(self, main, jobs, cancel_event, parent=None):
+        super().__init__(parent)
+        self.main = main
+        self.jobs = jobs
+        self.cancel_event = cancel_event
+
+    def run(self):
+        while not self.cancel_event.is_set():
+            try:
+                name, poly, matrix, clean, path = self.jobs.get_nowait()
+            except queue.Empty:
+                return
+            t0 = time.perf_counter()
+            try:
+                out = self.main.transform_and_clean(poly, matrix, clean=clean)
+                error = "" if self.main.write_polydata(out, path) else "write failed"
+            except Exception as e:
+                error = str(e) or e.__class__.__name__
+            self.exported.emit(name, path, (time.perf_counter() - t0) * 1000.0, error)
+
+class ModelLoadWorker(QtCore.QThread):
+    """
+    Runs myVTK.prepare_model for one file off the GUI thread. Results come back
+    through queued signals, so actors are only created on the main thread.
+    """
+    progress = QtCore.pyqtSignal(str, float)
+    loaded = QtCore.pyqtSignal(str, object)
+    failed = QtCore.pyqtSignal(str, str)
+
+    def __init__(self, vtk_app, file_path, parent=None):
+        super().__init__(parent)
+        self.vtk_app = vtk_app
+        self.file_path = file_path
+        self.cancel_event = threading.Event()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def run(self):
+        try:
+            prepared = self.vtk_app.prepare_model(
+                self.file_path,
+                progress=lambda frac: self.progress.emit(self.file_path, frac),
+                cancel=self.cancel_event)
+        except LoadCancelled:
+            self.failed.emit(self.file_path, "")
+            return
+        except Exception as e:
+            self.failed.emit(self.file_path, str(e) or e.__class__.__name__)
+            return
+        self.loaded.emit(self.file_path, prepared)
+
+
 class MainWindow(QtWidgets.QMainWindow):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -1226,15 +3043,30 @@ class MainWindow(QtWidgets.QMainWindow):
         self.vtk_app = myVTK()
         self.vtk_app.start(self.vtkWidget)
         self.undo_stack = QtWidgets.QUndoStack(self)
+        self.undo_memory_budget = UNDO_MEMORY_BUDGET_BYTES
+        self.undo_max_steps = UNDO_MAX_STEPS
+        self.undo_spill = False
+        self._undo_spill_dir = None
+        self.undo_stack.indexChanged.connect(self._on_undo_stack_changed)
         self._pending_transform = None
         self._pending_prop_snapshot = None
         self.object_registry = {}
         self.light_registry = {}
+        self.actor_names = {}               # scene actor / light gizmo -> registry name
+        self.scene_index = SceneIndex()     # name -> outliner item, unique-name counters
+        self._outliner_icons = {}           # item kind -> QIcon (standardIcon is slow per item)
+        self._bulk_totals = None            # update_scene_totals calls held back by bulk_add()
         self.transform_widget = None
         self.current_transform_mode = 'translate'
         self.block_signals = False
         self.current_selected_actor = None
         self.current_tool = None
+        # Armed box / lasso selection (begin_region_select)
+        self._region_mode = None
+        self._region_style = None
+        self._region_prev_style = None
+        self._region_points = []
+        self._region_tags = {}
         self.snap_increment = 0.5
         self.clipboard = None
         self.actor_texture_paths = {}
@@ -1247,6 +3079,17 @@ class MainWindow(QtWidgets.QMainWindow):
         self._scale_uniform_lock = False
         self._scale_obs = []                # interactor observers for scale mode
         self._uniform_hint_actors = []      # two billboard text actors "⇔"
+        # Background model loading
+        self._load_workers = {}             # file_path -> running ModelLoadWorker
+        self._export_batch = None           # running export_all_to_directory batch (see _start_export_batch)
+        self._load_queue = []               # file paths waiting for a free worker
+        self._load_progress = {}            # file_path -> 0..1
+        self._load_dialog = None
+        # Scene statistics: per-polydata cache + running totals (see update_scene_totals)
+        self._stats_cache = {}              # polydata address -> (mtime, topology signature, stats)
+        self._scene_stats = {}              # actor -> (polydata address, stats) currently counted
+        self._scene_poly_refs = {}          # polydata address -> number of counted actors using it
+        self._scene_totals = {"verts": 0, "edges": 0, "faces": 0, "tris": 0, "memory_kb": 0}
 
         # Build UI and scene with the ORIGINAL Qt look
         self.create_ui()
@@ -1529,13 +3372,17 @@ class MainWindow(QtWidgets.QMainWindow):
             "Clear Scene", self, triggered=self.clear_scene)
     
         self.reset_camera_action = QtWidgets.QAction("Reset Camera", self,
-            triggered=lambda: self.vtk_app.renderer.ResetCamera())
+            triggered=lambda: self.vtk_app.reset_camera())
         self.camera_props_action = QtWidgets.QAction("Camera Properties...", self,
             triggered=self.open_camera_dialog)
     
         self.toggle_grid_action = QtWidgets.QAction("Show Grid", self, checkable=True,
             triggered=self.toggle_grid_visibility)
         self.toggle_grid_action.setChecked(True)
+
+        self.gpu_picking_action = QtWidgets.QAction("GPU Picking", self, checkable=True,
+            triggered=self.toggle_gpu_picking)
+        self.gpu_picking_action.setChecked(False)
     
         self.toggle_gizmo_action = QtWidgets.QAction("Show Transform Gizmo", self, checkable=True,
             triggered=self.toggle_gizmo)
@@ -1566,8 +3413,16 @@ class MainWindow(QtWidgets.QMainWindow):
             triggered=self.on_copy_selected)
         self.paste_action = QtWidgets.QAction("Paste", self, shortcut="Ctrl+V",
             triggered=self.on_paste_selected)
+        self.paste_instance_action = QtWidgets.QAction("Paste Instance", self, shortcut="Ctrl+Shift+V",
+            triggered=self.on_paste_instance)
         self.addAction(self.copy_action)
         self.addAction(self.paste_action)
+        self.addAction(self.paste_instance_action)
+
+        self.box_select_action = QtWidgets.QAction("Box Select", self, shortcut="B",
+            triggered=lambda: self.begin_region_select("box"))
+        self.lasso_select_action = QtWidgets.QAction("Lasso Select", self, shortcut="L",
+            triggered=lambda: self.begin_region_select("lasso"))
     
         self.vertex_edit_action = QtWidgets.QAction("Vertex Edit Tool", self,
             checkable=True, triggered=self.on_vertex_edit_toggled)
@@ -1585,6 +3440,10 @@ class MainWindow(QtWidgets.QMainWindow):
         self.undo_action.setShortcut("Ctrl+Z")
         self.redo_action = self.undo_stack.createRedoAction(self, "Redo")
         self.redo_action.setShortcut("Ctrl+Y")
+        # canUndoChanged fires after indexChanged and re-enables Undo; evicted entries keep it off
+        self.undo_stack.canUndoChanged.connect(self._update_undo_status)
+        self.undo_settings_action = QtWidgets.QAction("Undo History Settings...", self,
+            triggered=self.on_undo_settings)
 
     def create_menu_bar(self):
         menubar = self.menuBar()
@@ -1605,9 +3464,14 @@ class MainWindow(QtWidgets.QMainWindow):
         edit_menu = menubar.addMenu("&Edit")
         edit_menu.addAction(self.undo_action)   
         edit_menu.addAction(self.redo_action)  
+        edit_menu.addAction(self.undo_settings_action)
         edit_menu.addSeparator()
         edit_menu.addAction(self.copy_action)
         edit_menu.addAction(self.paste_action)
+        edit_menu.addAction(self.paste_instance_action)
+        edit_menu.addSeparator()
+        edit_menu.addAction(self.box_select_action)
+        edit_menu.addAction(self.lasso_select_action)
         
         create_menu = menubar.addMenu("&Create")
         primitives_menu = create_menu.addMenu("Primitives")
@@ -1653,6 +3517,7 @@ class MainWindow(QtWidgets.QMainWindow):
         view_menu = menubar.addMenu("&View")
         view_menu.addAction(self.toggle_grid_action)
         view_menu.addAction(self.toggle_lighting_action)  # NEW
+        view_menu.addAction(self.gpu_picking_action)
         view_menu.addSeparator()
         view_menu.addAction(self.reset_camera_action)
         view_menu.addAction(self.camera_props_action)
@@ -1678,41 +3543,58 @@ class MainWindow(QtWidgets.QMainWindow):
         if not filepath:
             return
 
-        # Build OBJ text
-        lines = []
-        v_offset = 0
-
-        for name, actor in self.object_registry.items():
-            poly = self.polydata_from_actor(actor, apply_transform=True)
-            if not poly or poly.GetNumberOfPoints() == 0:
-                continue
-
-            lines.append(f"o {name}")
-            pts = poly.GetPoints()
-            for i in range(pts.GetNumberOfPoints()):
-                x, y, z = pts.GetPoint(i)
-                lines.append(f"v {x:.6f} {y:.6f} {z:.6f}")
-
-            # Preserve original polygon topology (avoid forced triangulation to prevent diagonal seams)
-            polys = poly.GetPolys()
-            polys.InitTraversal()
-            id_list = vtk.vtkIdList()
-            while polys.GetNextCell(id_list):
-                # OBJ indices are 1-based; add v_offset
-                if id_list.GetNumberOfIds() >= 3:
-                    face_idx = " ".join(str(v_offset + id_list.GetId(j) + 1) for j in range(id_list.GetNumberOfIds()))
-                    lines.append(f"f {face_idx}")
-
-            v_offset += pts.GetNumberOfPoints()
+        opts = ObjExportOptionsDialog(self)
+        if opts.exec_() != QtWidgets.QDialog.Accepted:
+            return
+        materials = opts.materials_check.isChecked()
+        mtl_path = os.path.splitext(filepath)[0] + ".mtl" if materials else None
 
+        # Stream object by object; only one object's transformed copy is alive at a time
+        t0 = time.perf_counter()
+        count = 0
+        mtl_lines = []
         try:
-            with open(filepath, "w", encoding="utf-8") as f:
-                f.write("\n".join(lines) + "\n")
+            with open(filepath, "w", encoding="utf-8", newline="\n") as f:
+                writer = ObjStreamWriter(f, normals=opts.normals_check.isChecked(),
+                                         uvs=opts.uvs_check.isChecked())
+                if mtl_path:
+                    writer.write_line(f"mtllib {os.path.basename(mtl_path)}")
+                for name, actor in self.object_registry.items():
+                    poly = self.polydata_from_actor(actor, apply_transform=True)
+                    if not poly or poly.GetNumberOfPoints() == 0:
+                        continue
+                    material = None
+                    if mtl_path:
+                        material = "".join(c if c.isalnum() or c in "-_." else "_" for c in name)
+                        mtl_lines += self._mtl_entry(material, actor)
+                    writer.write_object(name, poly, material)
+                    count += 1
+            if mtl_path:
+                with open(mtl_path, "w", encoding="utf-8", newline="\n") as f:
+                    f.write("\n".join(mtl_lines) + "\n")
         except Exception as e:
             QtWidgets.QMessageBox.critical(self, "Export Multi-Object OBJ", f"Failed to write file:\n{e}")
             return
 
-        self.statusBar().showMessage(f"Exported {len(self.object_registry)} objects to {os.path.basename(filepath)} (multi-object OBJ)")
+        elapsed = max(time.perf_counter() - t0, 1e-6)
+        mb = writer.bytes_written / 2**20
+        self.statusBar().showMessage(
+            f"Exported {count} objects to {os.path.basename(filepath)} (multi-object OBJ, "
+            f"{mb:.1f} MB in {elapsed:.1f} s, {mb / elapsed:.0f} MB/s)")
+
+    def _mtl_entry(self, material, actor):
+        """MTL lines for an actor's surface property (and texture file, if one was applied)."""
+        prop = actor.GetProperty()
+        lines = [f"newmtl {material}",
+                 "Kd %.6f %.6f %.6f" % prop.GetDiffuseColor(),
+                 "Ka %.6f %.6f %.6f" % tuple(c * prop.GetAmbient() for c in prop.GetAmbientColor()),
+                 "Ks %.6f %.6f %.6f" % tuple(c * prop.GetSpecular() for c in prop.GetSpecularColor()),
+                 f"Ns {prop.GetSpecularPower():.6f}",
+                 f"d {prop.GetOpacity():.6f}"]
+        texture = self.actor_texture_paths.get(actor)
+        if texture:
+            lines.append(f"map_Kd {texture}")
+        return lines + [""]
 
     def debug_actor(self, actor):
         if not actor:
@@ -1726,154 +3608,174 @@ class MainWindow(QtWidgets.QMainWindow):
         print(f"Debug visibility: {actor.GetVisibility()}")
 
     def on_open_file(self):
-        file_path, _ = QtWidgets.QFileDialog.getOpenFileName(
+        file_paths, _ = QtWidgets.QFileDialog.getOpenFileNames(
             self,
             "Open Model File",
             "",
             "3D Models (*.obj *.stl *.ply *.vtk *.vtp *.3ds);;All Files (*)"
         )
-        if not file_path:
+        if not file_paths:
+            return
+        self.load_files_async(file_paths)
+
+    def load_files_async(self, file_paths):
+        """
+        Import models on ModelLoadWorker threads (one per file, up to the CPU count at
+        once) so the editor stays responsive. Progress and Cancel go through one dialog.
+        """
+        for path in file_paths:
+            if path in self._load_workers or path in self._load_queue:
+                continue
+            self._load_queue.append(path)
+            self._load_progress[path] = 0.0
+
+        if self._load_dialog is None:
+            dlg = QtWidgets.QProgressDialog("Loading models...", "Cancel", 0, 100, self)
+            dlg.setWindowTitle("Import")
+            dlg.setMinimumDuration(300)
+            dlg.setAutoClose(False)
+            dlg.setAutoReset(False)
+            dlg.canceled.connect(self.cancel_loading)
+            self._load_dialog = dlg
+        self._start_queued_loads()
+
+    def _start_queued_loads(self):
+        limit = max(1, QtCore.QThread.idealThreadCount())
+        while self._load_queue and len(self._load_workers) < limit:
+            path = self._load_queue.pop(0)
+            worker = ModelLoadWorker(self.vtk_app, path, self)
+            worker.progress.connect(self._on_model_load_progress)
+            worker.loaded.connect(self._on_model_loaded)
+            worker.failed.connect(self._on_model_load_failed)
+            self._load_workers[path] = worker
+            worker.start()
+        self._update_load_dialog()
+
+    def _update_load_dialog(self):
+        if self._load_dialog is None or not self._load_progress:
             return
+        n = len(self._load_progress)
+        done = sum(self._load_progress.values())
+        self._load_dialog.setLabelText(f"Loading {n} file(s)...")
+        self._load_dialog.setValue(int(100 * done / n))
+
+    def _on_model_load_progress(self, file_path, frac):
+        if file_path in self._load_progress:
+            self._load_progress[file_path] = frac
+            self._update_load_dialog()
+
+    def cancel_loading(self):
+        """Drop queued files and ask every running worker to abort."""
+        for path in self._load_queue:
+            self._load_progress.pop(path, None)
+        self._load_queue = []
+        for worker in self._load_workers.values():
+            worker.cancel()
+        self.statusBar().showMessage("Cancelling import...")
+
+    def _on_model_loaded(self, file_path, prepared):
+        try:
+            worker = self._load_workers.get(file_path)
+            if worker is not None and not worker.cancel_event.is_set():
+                t0 = time.perf_counter()
+                actors = self.vtk_app.finish_loaded_model(file_path, prepared)
+                self._add_loaded_actors(file_path, actors,
+                                        build_ms=(time.perf_counter() - t0) * 1000.0)
+        finally:
+            self._finish_load(file_path)
 
+    def _on_model_load_failed(self, file_path, message):
+        self._finish_load(file_path)
+        if not message:
+            self.statusBar().showMessage(f"Import cancelled: {os.path.basename(file_path)}")
+            return
+        print(f"Import failed for {file_path}: {message}")
+        QtWidgets.QMessageBox.warning(self, "Import", f"{os.path.basename(file_path)}: {message}")
+
+    def _finish_load(self, file_path):
+        worker = self._load_workers.pop(file_path, None)
+        if worker is not None:
+            worker.wait()
+            worker.deleteLater()
+        if getattr(self, "cache_status_label", None):
+            self.cache_status_label.setText(self.vtk_app.model_cache.stats_text())
+        self._start_queued_loads()
+        if not self._load_workers and not self._load_queue:
+            self._load_progress.clear()
+            if self._load_dialog is not None:
+                # close() emits canceled, which must not reach cancel_loading here
+                self._load_dialog.canceled.disconnect(self.cancel_loading)
+                self._load_dialog.close()
+                self._load_dialog.deleteLater()
+                self._load_dialog = None
+
+    def _add_loaded_actors(self, file_path, actors, build_ms=None):
+        """
+        Register actors from a finished import under a collection named after the file.
+        All parts go in through one bulk_add() transaction; the log line gives the time
+        spent per phase.
+        """
+        if not actors:
+            return
         ext = os.path.splitext(file_path)[1].lower()
         base = os.path.splitext(os.path.basename(file_path))[0]
         collection = self.ensure_collection(base)
 
-        if ext == ".3ds":
-            actors = self.vtk_app.load_3ds_scene(file_path)
-            if not actors:
-                QtWidgets.QMessageBox.warning(self, "3DS Import", "Failed or empty 3DS scene.")
-                return
+        phase = {"place": 0.0, "scene": 0.0, "outliner": 0.0}
+        t_start = time.perf_counter()
+        with self.bulk_add():
             for actor, name in actors:
                 if not actor:
                     continue
-                self.vtk_app.orient_actor_y_up_to_z_up(actor)
-                b = actor.GetBounds()
-                if b and (abs(b[1]-b[0]) < 0.01 and abs(b[3]-b[2]) < 0.01 and abs(b[5]-b[4]) < 0.01):
-                    actor.SetScale(100.0, 100.0, 100.0)
-
-                count = len([k for k in self.object_registry if k.startswith(name)]) + 1
-                unique = f"{name}_{count}" if count > 1 else name
+                t0 = time.perf_counter()
+                if ext == ".obj":
+                    # OBJs without vt lines get generated UVs so textures map
+                    self._ensure_texture_coordinates(actor, name)
+                elif ext == ".3ds":
+                    self.vtk_app.orient_actor_y_up_to_z_up(actor)
+                    b = actor.GetBounds()
+                    if b and (abs(b[1]-b[0]) < 0.01 and abs(b[3]-b[2]) < 0.01 and abs(b[5]-b[4]) < 0.01):
+                        actor.SetScale(100.0, 100.0, 100.0)
+                t1 = time.perf_counter()
+
+                unique = self.scene_index.unique_name(name)
                 self.object_registry[unique] = actor
+                self.actor_names[actor] = unique
                 actor.SetUserTransform(None)
                 self.vtk_app.add_actor_to_scene(actor)
+                t2 = time.perf_counter()
                 self._make_object_item(unique, "mesh", collection)
-                print(f"[3DS] Added part: {unique}")
+                t3 = time.perf_counter()
+                phase["place"] += t1 - t0
+                phase["scene"] += t2 - t1
+                phase["outliner"] += t3 - t2
+            t_refresh = time.perf_counter()
+        refresh_ms = (time.perf_counter() - t_refresh) * 1000.0
+
+        t0 = time.perf_counter()
+        if collection.childCount() > 0:
+            # OBJ selects its first part, everything else the most recent one
+            item = collection.child(0) if ext == ".obj" else collection.child(collection.childCount()-1)
+            self.scene_outliner.setCurrentItem(item)
+            self.on_outliner_selection_changed(item)
+        collection.setExpanded(True)
+        self.update_scene_totals(changed=[a for a, _ in actors if a])
+        refresh_ms += (time.perf_counter() - t0) * 1000.0
+
+        n = sum(1 for a, _ in actors if a)
+        timings = [f"{k} {v * 1000.0:.0f} ms" for k, v in phase.items()]
+        if build_ms is not None:
+            timings.insert(0, f"build {build_ms:.0f} ms")
+        timings.append(f"refresh {refresh_ms:.0f} ms")
+        print(f"[Import] {os.path.basename(file_path)}: {n} part(s) in "
+              f"{(time.perf_counter() - t_start) * 1000.0:.0f} ms ({', '.join(timings)})")
 
-            if collection.childCount() > 0:
-                self.scene_outliner.setCurrentItem(collection.child(collection.childCount()-1))
-                self.on_outliner_selection_changed(self.scene_outliner.currentItem())
-            collection.setExpanded(True)
-            self.update_scene_totals()
+        if ext == ".3ds":
             self.statusBar().showMessage(f"Imported 3DS scene: {os.path.basename(file_path)}")
-            return
-
-        if ext == ".obj":
-            parts = self._split_obj_to_temp_parts(file_path)
-            if not parts:
-                actor, name = self.vtk_app.load_file(file_path)
-                if actor:
-                    count = len([k for k in self.object_registry if k.startswith(name)]) + 1
-                    unique = f"{name}_{count}" if count > 1 else name
-                    self.object_registry[unique] = actor
-                    actor.SetUserTransform(None)
-                    self.vtk_app.add_actor_to_scene(actor)
-                    self._make_object_item(unique, "mesh", collection)
-                    self.scene_outliner.setCurrentItem(collection.child(collection.childCount()-1))
-                    self.on_outliner_selection_changed(self.scene_outliner.currentItem())
-                    collection.setExpanded(True)
-                    self.update_scene_totals()
-                return
-            for temp_path, obj_name in parts:
-                actor, _ = self.vtk_app.load_file(temp_path)
-                if not actor:
-                    continue
-                count = len([k for k in self.object_registry if k.startswith(obj_name)]) + 1
-                unique = f"{obj_name}_{count}" if count > 1 else obj_name
-                self.object_registry[unique] = actor
-                actor.SetUserTransform(None)
-                self.vtk_app.add_actor_to_scene(actor)
-                self._make_object_item(unique, "mesh", collection)
-
-            if collection.childCount() > 0:
-                self.scene_outliner.setCurrentItem(collection.child(0))
-                self.on_outliner_selection_changed(collection.child(0))
-            collection.setExpanded(True)
-            self.update_scene_totals()
+        elif ext == ".obj":
             self.statusBar().showMessage(f"Imported OBJ as collection '{base}' ({collection.childCount()} objects)")
-            return
-
-        actor, name = self.vtk_app.load_file(file_path)
-        if actor:
-            count = len([k for k in self.object_registry if k.startswith(name)]) + 1
-            unique = f"{name}_{count}" if count > 1 else name
-            self.object_registry[unique] = actor
-            actor.SetUserTransform(None)
-            self.vtk_app.add_actor_to_scene(actor)
-            self._make_object_item(unique, "mesh", collection)
-            self.scene_outliner.setCurrentItem(collection.child(collection.childCount()-1))
-            self.on_outliner_selection_changed(self.scene_outliner.currentItem())
-            collection.setExpanded(True)
-            self.update_scene_totals()
-            self.statusBar().showMessage(f"Imported {name}")
-
-    def _split_obj_to_temp_parts(self, file_path: str):
-        """Split an OBJ by 'o <name>' blocks into temp files. Returns [(temp_path, name)]."""
-        parts = []
-        try:
-            with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                lines = f.readlines()
-        except Exception:
-            return parts
-    
-        # Gather global tables to prepend to each chunk
-        v = []; vt = []; vn = []; mtllibs = []; cur_faces = []; cur_name = None
-    
-        for ln in lines:
-            if ln.startswith("mtllib "):
-                mtllibs.append(ln)
-            elif ln.startswith("v "):
-                v.append(ln)
-            elif ln.startswith("vt "):
-                vt.append(ln)
-            elif ln.startswith("vn "):
-                vn.append(ln)
-            elif ln.startswith("o "):
-                # Commit previous object
-                if cur_name and cur_faces:
-                    tmp = self._emit_obj_chunk(file_path, cur_name, mtllibs, v, vt, vn, cur_faces)
-                    parts.append(tmp)
-                cur_name = ln.strip()[2:].strip() or "Object"
-                cur_faces = []
-            else:
-                # Collect group, usemtl, s, f, etc. into current
-                if cur_name is None:
-                    # start default
-                    cur_name = "Object"
-                if ln.startswith(("g ", "usemtl ", "s ", "f ", "l ", "p ")):
-                    cur_faces.append(ln)
-    
-        if cur_name and cur_faces:
-            tmp = self._emit_obj_chunk(file_path, cur_name, mtllibs, v, vt, vn, cur_faces)
-            parts.append(tmp)
-    
-        return parts
-    
-    def _emit_obj_chunk(self, src_path, name, mtllibs, v, vt, vn, faces):
-        """Write one temp OBJ part, duplicating vertex tables (no reindexing)."""
-        import tempfile
-        dir_ = os.path.dirname(src_path)
-        fd, tmp_path = tempfile.mkstemp(prefix=f"{name}_", suffix=".obj", dir=dir_)
-        os.close(fd)
-        with open(tmp_path, "w", encoding="utf-8") as out:
-            for m in mtllibs:
-                out.write(m)
-            out.write(f"o {name}\n")
-            for lst in (v, vt, vn):
-                out.writelines(lst)
-            out.writelines(faces)
-        return (tmp_path, name)
-
+        else:
+            self.statusBar().showMessage(f"Imported {actors[-1][1]}")
 
     # NEW: open a fresh scene in a new top-level window and keep a reference on the QApplication
     def on_new_scene(self):
@@ -1892,6 +3794,14 @@ class MainWindow(QtWidgets.QMainWindow):
             status = "shown" if checked else "hidden"
             self.statusBar().showMessage(f"Grid is now {status}")
 
+    def toggle_gpu_picking(self, checked):
+        """Switches click picking between the CPU pickers and the hardware selector."""
+        self.vtk_app.gpu_picking = bool(checked)
+        if self.vtk_app.hw_picker:
+            self.vtk_app.hw_picker.invalidate()
+        backend = "GPU (hardware selector)" if checked else "CPU (cell picker)"
+        self.statusBar().showMessage(f"Picking backend: {backend}")
+
     def create_tool_bar(self):
         toolbar = self.addToolBar("Main Toolbar")
         toolbar.addAction(self.open_file_action)
@@ -1917,6 +3827,105 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def create_status_bar(self):
         self.statusBar().showMessage("Ready")
+        self.cache_status_label = QtWidgets.QLabel(self.vtk_app.model_cache.stats_text())
+        self.statusBar().addPermanentWidget(self.cache_status_label)
+        self.render_status_label = QtWidgets.QLabel(self.vtk_app.render_stats_text())
+        self.statusBar().addPermanentWidget(self.render_status_label)
+        self._render_status_timer = QtCore.QTimer(self)
+        self._render_status_timer.timeout.connect(
+            lambda: self.render_status_label.setText(self.vtk_app.render_stats_text()))
+        self._render_status_timer.start(1000)
+        self.undo_status_label = QtWidgets.QLabel()
+        self.statusBar().addPermanentWidget(self.undo_status_label)
+        self._update_undo_status()
+
+    # ----- undo history memory -----
+    def undo_memory_bytes(self):
+        """Approximate bytes held in memory by the undo history (commands that report nbytes())."""
+        total = 0
+        for i in range(self.undo_stack.count()):
+            cmd = self.undo_stack.command(i)
+            if hasattr(cmd, "nbytes"):
+                total += cmd.nbytes()
+        return total
+
+    def undo_spilled_bytes(self):
+        """Bytes of undo history moved to disk."""
+        total = 0
+        for i in range(self.undo_stack.count()):
+            cmd = self.undo_stack.command(i)
+            if hasattr(cmd, "spilled_bytes"):
+                total += cmd.spilled_bytes()
+        return total
+
+    def _on_undo_stack_changed(self, *_):
+        try:
+            self._enforce_undo_budget()
+            self._update_undo_status()
+        except RuntimeError:
+            pass  # stack already deleted (clear() from its destructor emits indexChanged)
+
+    def _enforce_undo_budget(self):
+        """
+        Keep the undoable history within undo_max_steps and undo_memory_budget. Old
+        geometry edits are spilled to disk first when undo_spill is on; after that the
+        oldest entries are evicted, so the reachable history is always a contiguous
+        run ending at the current state (the newest entry is never evicted).
+        """
+        stack = self.undo_stack
+        undoable = [stack.command(i) for i in range(stack.index())]
+        live = [cmd for cmd in undoable[:-1] if hasattr(cmd, "evict") and not cmd.evicted]
+        excess = sum(1 for cmd in undoable if not getattr(cmd, "evicted", False)) - self.undo_max_steps
+        total = self.undo_memory_bytes()
+        for cmd in live[:max(excess, 0)]:
+            total -= cmd.nbytes()
+            cmd.evict()
+        live = live[max(excess, 0):]
+        if total <= self.undo_memory_budget:
+            return
+        if self.undo_spill:
+            for cmd in live:
+                if total <= self.undo_memory_budget:
+                    return
+                if hasattr(cmd, "spill"):
+                    try:
+                        total -= cmd.spill(self._undo_spill_directory())
+                    except OSError:
+                        break  # disk full / not writable: fall back to evicting
+        for cmd in live:
+            if total <= self.undo_memory_budget:
+                break
+            total -= cmd.nbytes()
+            cmd.evict()
+
+    def _undo_spill_directory(self):
+        if not self._undo_spill_dir:
+            import tempfile
+            self._undo_spill_dir = tempfile.mkdtemp(prefix="vtk3deditor_undo_")
+        return self._undo_spill_dir
+
+    def _update_undo_status(self, *_):
+        try:
+            index = self.undo_stack.index()
+            if index and getattr(self.undo_stack.command(index - 1), "evicted", False):
+                self.undo_action.setEnabled(False)
+        except RuntimeError:
+            return
+        if getattr(self, "undo_status_label", None):
+            text = f"Undo: {self.undo_memory_bytes() / 2**20:.1f} / {self.undo_memory_budget / 2**20:.0f} MB"
+            spilled = self.undo_spilled_bytes()
+            if spilled:
+                text += f" (+{spilled / 2**20:.1f} MB on disk)"
+            self.undo_status_label.setText(text)
+
+    def on_undo_settings(self):
+        dlg = UndoSettingsDialog(self, self)
+        if dlg.exec_() != QtWidgets.QDialog.Accepted:
+            return
+        self.undo_memory_budget = dlg.budget_spin.value() * 2**20
+        self.undo_max_steps = dlg.steps_spin.value()
+        self.undo_spill = dlg.spill_check.isChecked()
+        self._on_undo_stack_changed()
 
     def create_dock_widgets(self):
         # LEFT DOCK: Scene Collection (QTreeWidget)
@@ -2047,8 +4056,10 @@ class MainWindow(QtWidgets.QMainWindow):
                     pass
             self.vtk_app.remove_light_from_scene(entry['light'])
             self.light_registry.pop(name, None)
+            self.actor_names.pop(entry.get('gizmo'), None)
 
             # remove tree item
+            self.scene_index.remove(name)
             if isinstance(item, QtWidgets.QTreeWidgetItem):
                 parent = item.parent()
                 if parent:
@@ -2066,7 +4077,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 self.transform_widget = None
 
             self.update_properties_panel(None)
-            self.update_scene_totals()
+            self.update_scene_totals(changed=())
             self.vtk_app.render_all()
             self.statusBar().showMessage(f'Deleted "{name}"')
             return
@@ -2104,14 +4115,19 @@ class MainWindow(QtWidgets.QMainWindow):
         parent = parent or self.ensure_collection("Collection")
         item = QtWidgets.QTreeWidgetItem([unique_name])
         item.setData(0, QtCore.Qt.UserRole, kind)  # 'mesh' | 'light' | 'camera'
-        # Icons
-        if kind == "mesh":
-            item.setIcon(0, self.style().standardIcon(QtWidgets.QStyle.SP_FileIcon))
-        elif kind == "light":
-            item.setIcon(0, self.style().standardIcon(QtWidgets.QStyle.SP_DialogYesButton))
-        else:
-            item.setIcon(0, self.style().standardIcon(QtWidgets.QStyle.SP_DesktopIcon))
+        # Icons (one QIcon per kind, shared by all items)
+        icon = self._outliner_icons.get(kind)
+        if icon is None:
+            if kind == "mesh":
+                icon = self.style().standardIcon(QtWidgets.QStyle.SP_FileIcon)
+            elif kind == "light":
+                icon = self.style().standardIcon(QtWidgets.QStyle.SP_DialogYesButton)
+            else:
+                icon = self.style().standardIcon(QtWidgets.QStyle.SP_DesktopIcon)
+            self._outliner_icons[kind] = icon
+        item.setIcon(0, icon)
         parent.addChild(item)
+        self.scene_index.add(unique_name, item)
         return item
     
     def on_tree_selection_changed(self):
@@ -2119,7 +4135,7 @@ class MainWindow(QtWidgets.QMainWindow):
         items = self.scene_outliner.selectedItems()
         if not items:
             self.update_properties_panel(None)
-            self.update_scene_totals()
+            self.update_scene_totals(changed=())
             return
         # Pick first non-collection item if multiple
         chosen = None
@@ -2130,7 +4146,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if not chosen:
             # Only collection(s) selected
             self.update_properties_panel(None)
-            self.update_scene_totals()
+            self.update_scene_totals(changed=())
             return
         # Reuse existing handler
         self.on_outliner_selection_changed(chosen)
@@ -2150,7 +4166,12 @@ class MainWindow(QtWidgets.QMainWindow):
             copy_act.triggered.connect(self.on_copy_selected)
             paste_act = QtWidgets.QAction("Paste (Duplicate)", self); paste_act.setShortcut("Ctrl+V")
             paste_act.triggered.connect(self.on_paste_selected)
-            menu.addAction(copy_act); menu.addAction(paste_act); menu.addSeparator()
+            menu.addAction(copy_act); menu.addAction(paste_act)
+            if kind == "mesh":
+                inst_act = QtWidgets.QAction("Paste Instance", self); inst_act.setShortcut("Ctrl+Shift+V")
+                inst_act.triggered.connect(self.on_paste_instance)
+                menu.addAction(inst_act)
+            menu.addSeparator()
     
         delete_action = QtWidgets.QAction("Delete", self)
         delete_action.setIcon(self.style().standardIcon(QtWidgets.QStyle.SP_TrashIcon))
@@ -2191,6 +4212,10 @@ class MainWindow(QtWidgets.QMainWindow):
         # Delete children using existing path
         for obj_item in to_delete:
             self.delete_selected_object(obj_item)
+        # Children the user chose to keep go away with the node: drop their index entries
+        for obj_item in to_delete:
+            if self.scene_index.get(obj_item.text(0)) is obj_item:
+                self.scene_index.remove(obj_item.text(0))
         # Remove empty collection node
         parent = col_item.parent()
         if parent:
@@ -2204,27 +4229,23 @@ class MainWindow(QtWidgets.QMainWindow):
         """Simple click-pick to select object in tree."""
         if not self.vtk_app or not self.vtk_app.interactor:
             return
-        self._tree_picker = vtk.vtkCellPicker()
-        self._tree_picker.SetTolerance(0.0005)
+        # Picks among registered objects and light gizmos only (batched primitive
+        # proxies included, though they are not in the renderer)
+        self.scene_picker = ScenePicker(self.vtk_app.renderer)
     
         def on_click(obj, evt):
             pos = self.vtk_app.interactor.GetEventPosition()
-            self._tree_picker.Pick(pos[0], pos[1], 0, self.vtk_app.renderer)
-            act = self._tree_picker.GetActor()
-            if not act:
-                return
-            # Find matching name in registry
-            name = None
-            for n, a in self.object_registry.items():
-                if a is act:
-                    name = n; break
-            if not name:
-                # Maybe a light gizmo
-                for n, entry in self.light_registry.items():
-                    if entry.get("gizmo") is act:
-                        name = n; break
+            hw = self.vtk_app.active_hardware_picker()
+            t0 = time.perf_counter()
+            act, _ = (hw or self.scene_picker).pick(pos[0], pos[1], self.actor_names.keys())
+            elapsed = (time.perf_counter() - t0) * 1000.0
+            name = self.actor_names.get(act) if act else None
             if not name:
                 return
+            backend = "CPU"
+            if hw is not None:
+                backend = "GPU, buffers recaptured" if hw.last_captured else "GPU"
+            self.statusBar().showMessage(f"Picked {name} ({backend} pick: {elapsed:.2f} ms)", 3000)
             # Locate item in tree and select
             it = self._find_tree_item_by_name(name)
             if it:
@@ -2237,19 +4258,129 @@ class MainWindow(QtWidgets.QMainWindow):
         if not hasattr(self, "_tree_pick_tag") or self._tree_pick_tag is None:
             self._tree_pick_tag = self.vtk_app.interactor.AddObserver("LeftButtonReleaseEvent", on_click)
     
+    # ===== Box / lasso selection =====
+    def begin_region_select(self, mode):
+        """
+        Arm a one-shot "box" or "lasso" selection: the next left drag in the viewport draws
+        the region and selects on release (Shift adds, Ctrl removes, Esc cancels). The VTK
+        rubber-band styles draw straight into the frame buffer, so dragging never re-renders
+        the scene. Objects are selected in the outliner; an edit tool with select_region()
+        selects its vertices / faces instead.
+        """
+        iren = self.vtk_app.interactor if self.vtk_app else None
+        if iren is None:
+            return
+        self.end_region_select()
+        if mode == "box":
+            style = vtk.vtkInteractorStyleRubberBand2D()
+        else:
+            style = vtk.vtkInteractorStyleDrawPolygon()
+        # The style runs before the edit tools' observers (priority 1.0) and the guard
+        # below aborts the mouse events, so neither the tools nor the click picker see the drag
+        style.SetPriority(10.0)
+        self._region_prev_style = iren.GetInteractorStyle()
+        self._region_style = style
+        self._region_mode = mode
+        self._region_points = []
+        iren.SetInteractorStyle(style)
+        for evt in ("LeftButtonPressEvent", "MouseMoveEvent", "LeftButtonReleaseEvent", "KeyPressEvent"):
+            self._region_tags[evt] = iren.AddObserver(evt, self._on_region_event, 5.0)
+        self.statusBar().showMessage(f"{mode.title()} Select: drag in the viewport (Shift adds, Ctrl removes, Esc cancels)")
+
+    def end_region_select(self):
+        """Disarm box / lasso selection and give the previous interactor style back."""
+        if self._region_mode is None:
+            return
+        iren = self.vtk_app.interactor
+        for tag in self._region_tags.values():
+            try:
+                iren.RemoveObserver(tag)
+            except Exception:
+                pass
+        self._region_tags = {}
+        try:
+            if self._region_prev_style:
+                iren.SetInteractorStyle(self._region_prev_style)
+        except Exception:
+            pass
+        self._region_mode = None
+        self._region_style = None
+        self._region_prev_style = None
+        self._region_points = []
+
+    def _on_region_event(self, obj, evt):
+        iren = self.vtk_app.interactor
+        if evt == "KeyPressEvent":
+            if (iren.GetKeySym() or "") == "Escape":
+                iren.GetCommand(self._region_tags[evt]).SetAbortFlag(1)
+                self.end_region_select()
+                self.vtk_app.render_all()
+                self.statusBar().showMessage("Selection cancelled")
+            return
+        iren.GetCommand(self._region_tags[evt]).SetAbortFlag(1)
+        pos = tuple(iren.GetEventPosition())
+        if evt == "LeftButtonPressEvent":
+            self._region_points = [pos]
+        elif evt == "MouseMoveEvent":
+            if self._region_points and pos != self._region_points[-1]:
+                self._region_points.append(pos)
+        elif self._region_points:
+            points = self._region_points + [pos]
+            mode = self._region_mode
+            op = "subtract" if iren.GetControlKey() else "add" if iren.GetShiftKey() else "replace"
+            self.end_region_select()
+            self.apply_region_select(mode, points, op)
+
+    def apply_region_select(self, mode, points, op="replace"):
+        """Select everything inside the dragged region; op is "replace", "add" or "subtract"."""
+        xs = [p[0] for p in points]
+        ys = [p[1] for p in points]
+        if max(xs) - min(xs) < 3 and max(ys) - min(ys) < 3:
+            self.vtk_app.render_all()
+            self.statusBar().showMessage("Selection cancelled (region too small)")
+            return
+        renderer = self.vtk_app.renderer
+        if mode == "box" or len(points) < 3:
+            selector = RegionSelector(renderer, box=(points[0][0], points[0][1], points[-1][0], points[-1][1]))
+        else:
+            selector = RegionSelector(renderer, lasso=points)
+        t0 = time.perf_counter()
+        tool = self.current_tool
+        if tool is not None and hasattr(tool, "select_region"):
+            count = tool.select_region(selector, op)
+            what = tool.region_items
+        else:
+            count = self._select_actors_in_region(selector, op)
+            what = "object(s)"
+        elapsed = (time.perf_counter() - t0) * 1000.0
+        self.vtk_app.render_all()
+        self.statusBar().showMessage(f"{mode.title()} Select: {count} {what} selected ({elapsed:.1f} ms)")
+
+    def _select_actors_in_region(self, selector, op):
+        hits = selector.select_actors(self.actor_names.keys())
+        items = self.scene_index.items
+        tree = self.scene_outliner
+        tree.blockSignals(True)
+        try:
+            if op == "replace":
+                tree.clearSelection()
+            first = None
+            for actor in hits:
+                item = items.get(self.actor_names.get(actor))
+                if item is None:
+                    continue
+                item.setSelected(op != "subtract")
+                first = first or item
+        finally:
+            tree.blockSignals(False)
+        if first is not None and op != "subtract":
+            tree.scrollToItem(first)
+        self.on_tree_selection_changed()
+        return len(tree.selectedItems())
+
     def _find_tree_item_by_name(self, name: str) -> QtWidgets.QTreeWidgetItem:
-        """Find a tree item by its text (depth-first)."""
-        def dfs(it):
-            if it.text(0) == name:
-                return it
-            for i in range(it.childCount()):
-                r = dfs(it.child(i))
-                if r: return r
-            return None
-        for i in range(self.scene_outliner.topLevelItemCount()):
-            r = dfs(self.scene_outliner.topLevelItem(i))
-            if r: return r
-        return None
+        """Find the tree item of a mesh / light by name (scene index lookup)."""
+        return self.scene_index.get(name)
 
     # ===== Camera Mode (orbit/pan/zoom) =====
     def on_camera_mode_toggled(self, checked: bool):
@@ -2490,9 +4621,9 @@ class MainWindow(QtWidgets.QMainWindow):
         gizmo_actor.SetPosition(*light.GetPosition())
     
         base = f"{light_type.lower()}_light"
-        count = len([n for n in list(self.light_registry.keys()) if n.startswith(base)]) + 1
-        name = f"{base}_{count}"
+        name = self.scene_index.unique_name(base, bare_first=False)
         self.light_registry[name] = {'light': light, 'gizmo': gizmo_actor, 'type': light_type}
+        self.actor_names[gizmo_actor] = name
         self.vtk_app.add_actor_to_scene(gizmo_actor)
     
         # Add in tree under selected collection or default
@@ -2628,8 +4759,8 @@ class MainWindow(QtWidgets.QMainWindow):
                 self.spinboxes[f"Scale{ax}"].setValue(1.0)
         self.block_signals = False
 
-        # Apply once using existing handler
-        self.on_transform_changed()
+        # Apply once (recorded as its own undo entry below)
+        self._apply_spinbox_transform(actor)
 
         after = self._get_actor_user_matrix16(actor)
         if after != before:
@@ -3096,9 +5227,30 @@ class MainWindow(QtWidgets.QMainWindow):
                 pass
             if self.camera_mode:
                 self.exit_camera_mode()
+            # Abort background exports and imports before VTK shuts down
+            try:
+                if self._export_batch is not None:
+                    self._export_batch["cancel"].set()
+                    for worker in self._export_batch["workers"]:
+                        worker.wait()
+                    self._export_batch = None
+            except Exception:
+                pass
+            try:
+                self._load_queue = []
+                for worker in list(self._load_workers.values()):
+                    worker.cancel()
+                    worker.wait()
+                self._load_workers.clear()
+            except Exception:
+                pass
             # Tell VTK side to stop rendering and detach observers
             if self.vtk_app:
                 self.vtk_app.shutdown()
+            if self._undo_spill_dir:
+                import shutil
+                shutil.rmtree(self._undo_spill_dir, ignore_errors=True)
+                self._undo_spill_dir = None
 
             app = QtWidgets.QApplication.instance()
             if hasattr(app, "_scene_windows"):
@@ -3138,10 +5290,10 @@ class MainWindow(QtWidgets.QMainWindow):
         if not actor:
             return ""
         if unique_name is None:
-            count = len([key for key in self.object_registry if key.startswith(base_name)]) + 1
-            unique_name = f"{base_name}_{count}" if count > 1 else base_name
+            unique_name = self.scene_index.unique_name(base_name)
         # register
         self.object_registry[unique_name] = actor
+        self.actor_names[actor] = unique_name
         actor.SetUserTransform(None)
         self.vtk_app.add_actor_to_scene(actor)
     
@@ -3164,7 +5316,7 @@ class MainWindow(QtWidgets.QMainWindow):
             self.scene_outliner.setCurrentItem(list_item)
             self.on_outliner_selection_changed(list_item)
     
-        self.update_scene_totals()
+        self.update_scene_totals(changed=[actor])
         return unique_name
 
     def _add_actor_no_undo(self, base_name: str, actor: vtk.vtkActor) -> str:
@@ -3183,16 +5335,17 @@ class MainWindow(QtWidgets.QMainWindow):
         if not actor:
             return
         try:
-            self.vtk_app.renderer.RemoveActor(actor)
+            self.vtk_app.remove_actor_from_scene(actor)
             if actor in self.vtk_app.actors:
                 self.vtk_app.actors.remove(actor)
         except Exception:
             pass
         self.object_registry.pop(name, None)
+        self.actor_names.pop(actor, None)
 
         # Remove from the outliner (tree-aware)
         if isinstance(self.scene_outliner, QtWidgets.QTreeWidget):
-            it = self._find_tree_item_by_name(name)
+            it = self.scene_index.remove(name)
             if it:
                 parent = it.parent()
                 if parent:
@@ -3214,7 +5367,7 @@ class MainWindow(QtWidgets.QMainWindow):
             self.transform_widget = None
 
         self.update_properties_panel(None)
-        self.update_scene_totals()
+        self.update_scene_totals(removed=[actor])
         self.vtk_app.render_all()
 
     def _get_actor_user_matrix16(self, actor: vtk.vtkActor):
@@ -3273,8 +5426,10 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self.vtk_app.clear_scene()
         self.scene_outliner.clear()
+        self.scene_index.clear()
         self.object_registry.clear()
         self.light_registry.clear()
+        self.actor_names.clear()
         self.update_properties_panel(None)
         # Update scene totals after clear
         self.update_scene_totals()
@@ -3338,7 +5493,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.update_properties_panel(actor)
         self.setup_transform_widget(actor) # Changed from setup_box_widget
         # Update scene totals to reflect new selection count
-        self.update_scene_totals()
+        self.update_scene_totals(changed=())
 
     def on_copy_selected(self):
         """Copy current selection (mesh or light) into internal clipboard."""
@@ -3367,28 +5522,90 @@ class MainWindow(QtWidgets.QMainWindow):
             self.statusBar().showMessage(f'Copied light "{lname}"')
             return
 
-        # Mesh?
-        actor = self.object_registry.get(name)
-        if actor:
-            self.clipboard = {"kind": "mesh", "actor": actor, "name": name}
-            self.statusBar().showMessage(f'Copied "{name}"')
-        else:
-            self.statusBar().showMessage("Copy: unsupported selection")
+        # Mesh?
+        actor = self.object_registry.get(name)
+        if actor:
+            self.clipboard = {"kind": "mesh", "actor": actor, "name": name}
+            self.statusBar().showMessage(f'Copied "{name}"')
+        else:
+            self.statusBar().showMessage("Copy: unsupported selection")
+
+
+    def on_paste_selected(self):
+        """Paste (duplicate) the last copied item."""
+        if not self.clipboard:
+            self.statusBar().showMessage("Paste: clipboard empty")
+            return
+        if self.clipboard.get("kind") == "mesh":
+            new_name = self._duplicate_actor(self.clipboard["actor"], base_name=self.clipboard.get("name", "object"))
+            self.statusBar().showMessage(f'Duplicated to "{new_name}"')
+        elif self.clipboard.get("kind") == "light":
+            self._duplicate_light_from_clipboard(self.clipboard)
+        else:
+            self.statusBar().showMessage("Paste: unsupported clipboard")
+
+    def on_paste_instance(self):
+        """Paste the copied mesh as an instance that shares geometry with the original."""
+        if not self.clipboard or self.clipboard.get("kind") != "mesh":
+            self.statusBar().showMessage("Paste Instance: copy a mesh first")
+            return
+        new_name = self._instance_actor(self.clipboard["actor"], base_name=self.clipboard.get("name", "object"))
+        if new_name:
+            self.statusBar().showMessage(f'Instanced to "{new_name}"')
+
+    def _instance_actor(self, src_actor: vtk.vtkActor, base_name: str = "object") -> str:
+        """
+        Create an instance of a mesh actor: it shares the source mapper (one polydata,
+        one GPU upload) and only owns its transform and vtkProperty. Edit tools and
+        normals changes give it private geometry first (see _make_geometry_unique).
+        """
+        if not src_actor or not src_actor.GetMapper():
+            return ""
+        actor2 = self.vtk_app.create_actor(src_actor.GetMapper())
+        actor2.GetProperty().DeepCopy(src_actor.GetProperty())
+        # Instances of a batched primitive join the same glyph batch
+        if getattr(src_actor, "_vt_batch", None) is not None:
+            actor2._vt_batch = src_actor._vt_batch
+
+        actor2.SetPosition(src_actor.GetPosition())
+        actor2.SetOrientation(src_actor.GetOrientation())
+        actor2.SetScale(src_actor.GetScale())
+        if src_actor.GetUserTransform():
+            tf = vtk.vtkTransform()
+            tf.DeepCopy(src_actor.GetUserTransform())
+            actor2.SetUserTransform(tf)
+
+        # Small offset so the instance is visible
+        px, py, pz = actor2.GetPosition()
+        actor2.SetPosition(px + 1.0, py + 1.0, pz)
 
+        # add_actor_with_name makes the name unique (_inst, _inst_2, ...)
+        return self.add_actor_with_name(f"{base_name}_inst", actor2)
 
-    def on_paste_selected(self):
-        """Paste (duplicate) the last copied item."""
-        if not self.clipboard:
-            self.statusBar().showMessage("Paste: clipboard empty")
+    def _is_shared_geometry(self, actor: vtk.vtkActor) -> bool:
+        """True if another scene object draws through the same mapper (an instance)."""
+        mapper = actor.GetMapper() if actor else None
+        if mapper is None:
+            return False
+        return any(a is not actor and a.GetMapper() is mapper for a in self.object_registry.values())
+
+    def _make_geometry_unique(self, actor: vtk.vtkActor):
+        """
+        Copy-on-write for instances: give actor its own clean + normals + mapper stage.
+        The input polydata stays shared (it is never modified in place); only the
+        normals output and GPU buffers become private.
+        """
+        if not self._is_shared_geometry(actor):
             return
-        if self.clipboard.get("kind") == "mesh":
-            new_name = self._duplicate_actor(self.clipboard["actor"], base_name=self.clipboard.get("name", "object"))
-            self.statusBar().showMessage(f'Duplicated to "{new_name}"')
-        elif self.clipboard.get("kind") == "light":
-            self._duplicate_light_from_clipboard(self.clipboard)
+        shared = actor.GetMapper()
+        cleaner = getattr(shared, "_vt_cleaner", None)
+        if cleaner is not None and cleaner.GetNumberOfInputConnections(0):
+            source = cleaner.GetInputConnection(0, 0).GetProducer()
         else:
-            self.statusBar().showMessage("Paste: unsupported clipboard")
-            
+            tp = vtk.vtkTrivialProducer()
+            tp.SetOutput(self.as_polydata(shared.GetInput()))
+            source = tp
+        actor.SetMapper(self.vtk_app.create_mapper(source))
 
     def _duplicate_actor(self, src_actor: vtk.vtkActor, base_name: str = "object") -> str:
         """Create a duplicated mesh actor (deep-copied geometry and properties)."""
@@ -3486,7 +5703,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 self.tex_thumb_label.setToolTip("No texture")
     
             self.statusBar().showMessage(f"Selected Light: {light_name}")
-            self.update_scene_totals()
+            self.update_scene_totals(changed=())
             self.block_signals = False
             return
     
@@ -3624,7 +5841,7 @@ class MainWindow(QtWidgets.QMainWindow):
             self.details_labels["ColorAttrCount"].setText("0")
     
         # Always refresh scene totals
-        self.update_scene_totals()
+        self.update_scene_totals(changed=[actor] if actor in self._scene_stats else ())
         self.block_signals = False
 
     def _set_appearance_controls_enabled(self, enabled: bool):
@@ -3691,6 +5908,8 @@ class MainWindow(QtWidgets.QMainWindow):
         if not tex:
             QtWidgets.QMessageBox.warning(self, "Load Texture", "Could not load the selected image.")
             return
+        # Glyph batches have no per-instance textures
+        self.vtk_app.release_from_batch(actor)
         # Ensure UVs first
         self._ensure_texture_coordinates(actor)
         actor.SetTexture(tex)
@@ -3702,8 +5921,9 @@ class MainWindow(QtWidgets.QMainWindow):
             self.tex_clear_button.setEnabled(True)
         self.vtk_app.render_all()
 
-    def _ensure_texture_coordinates(self, actor: vtk.vtkActor):
-        """Generate texture coordinates if the mesh has none."""
+    def _ensure_texture_coordinates(self, actor: vtk.vtkActor, name=None):
+        """Generate texture coordinates if the mesh has none. The mapping is picked
+        from name, or from the selected outliner item when name is None."""
         if not actor or not actor.GetMapper() or not actor.GetMapper().GetInput():
             return
         poly = actor.GetMapper().GetInput()
@@ -3711,10 +5931,12 @@ class MainWindow(QtWidgets.QMainWindow):
             return  # already has UVs
 
         # Choose a simple mapping based on rough shape (name heuristic)
-        name = ""
-        cur_item = self.scene_outliner.currentItem()
-        if cur_item:
-            name = cur_item.text(0).lower()
+        if name is None:
+            name = ""
+            cur_item = self.scene_outliner.currentItem()
+            if cur_item:
+                name = cur_item.text(0)
+        name = name.lower()
 
         src_pd = poly
 
@@ -3794,58 +6016,169 @@ class MainWindow(QtWidgets.QMainWindow):
         except Exception:
             return None
 
+    @staticmethod
+    def _cell_array_numpy(cells):
+        """(offsets, connectivity) of a vtkCellArray as int64 NumPy views."""
+        return (numpy_support.vtk_to_numpy(cells.GetOffsetsArray()).astype(np.int64, copy=False),
+                numpy_support.vtk_to_numpy(cells.GetConnectivityArray()).astype(np.int64, copy=False))
+
+    def _count_edges_and_tris(self, poly):
+        """
+        Unique topological edges and triangle count straight from the cell-array offsets
+        (what vtkExtractEdges / vtkTriangleFilter report for polys and lines, without running
+        them; strips count their real triangle edges).
+        """
+        tris = 0
+        edges = []
+        for cells, kind in ((poly.GetPolys(), "poly"), (poly.GetStrips(), "strip"), (poly.GetLines(), "line")):
+            if cells is None or cells.GetNumberOfCells() == 0:
+                continue
+            offsets, conn = self._cell_array_numpy(cells)
+            sizes = np.diff(offsets)
+            if kind in ("poly", "strip"):
+                tris += int(np.maximum(sizes - 2, 0).sum())
+            if kind == "poly" and len(sizes) and (sizes == sizes[0]).all():
+                # all-triangle / all-quad meshes: one row per cell, wrap by rolling the columns
+                corners = conn.reshape(-1, int(sizes[0]))
+                edges.append((corners.ravel(), np.roll(corners, -1, axis=1).ravel()))
+                continue
+            idx = np.arange(len(conn), dtype=np.int64)
+            cell_of = np.repeat(np.arange(len(sizes)), sizes)
+            pos_in_cell = idx - offsets[cell_of]
+            if kind == "poly":
+                # i -> i+1, last corner wraps to the first
+                nxt = np.where(pos_in_cell == sizes[cell_of] - 1, offsets[cell_of], idx + 1)
+                edges.append((conn, conn[nxt]))
+            else:
+                # lines and strips: i -> i+1; strips also i -> i+2
+                m = pos_in_cell < sizes[cell_of] - 1
+                edges.append((conn[m], conn[idx[m] + 1]))
+                if kind == "strip":
+                    m = pos_in_cell < sizes[cell_of] - 2
+                    edges.append((conn[m], conn[idx[m] + 2]))
+        if not edges:
+            return 0, tris
+        a = np.concatenate([e[0] for e in edges])
+        b = np.concatenate([e[1] for e in edges])
+        n = np.int64(max(1, poly.GetNumberOfPoints()))
+        keys = np.minimum(a, b) * n + np.maximum(a, b)
+        # sort + count boundaries is much cheaper than np.unique (no second array / inverse)
+        keys.sort()
+        return int(1 + np.count_nonzero(keys[1:] != keys[:-1])) if len(keys) else 0, tris
+
     def compute_polydata_stats(self, poly):
-        """Compute verts/edges/faces/tris and memory for a vtkPolyData."""
+        """
+        Verts/edges/faces/tris and memory for a vtkPolyData, cached per polydata.
+        Unchanged MTime -> cached result. Changed MTime with the same topology signature
+        (point/cell counts and cell-array MTimes, e.g. a vertex drag) -> only verts/memory
+        are refreshed.
+        """
         stats = {"verts": 0, "edges": 0, "faces": 0, "tris": 0, "memory_kb": 0}
         if poly is None:
             return stats
 
-        # Ensure pipeline is updated
-        poly.Modified()
-        poly.BuildCells()
-
+        key = poly.GetAddressAsString("vtkPolyData")
+        mtime = poly.GetMTime()
+        cached = self._stats_cache.get(key)
+        if cached and cached[0] == mtime:
+            return cached[2]
+
+        signature = (poly.GetNumberOfPoints(), poly.GetNumberOfVerts(), poly.GetNumberOfLines(),
+                     poly.GetNumberOfPolys(), poly.GetNumberOfStrips(),
+                     poly.GetPolys().GetNumberOfConnectivityIds(),
+                     # In-place connectivity edits keep the counts; vtkCellArray.GetMTime()
+                     # does not see its storage arrays, so take theirs too
+                     tuple(max(cells.GetMTime(), cells.GetConnectivityArray().GetMTime(),
+                               cells.GetOffsetsArray().GetMTime())
+                           for cells in (poly.GetPolys(), poly.GetStrips(), poly.GetLines())))
         stats["verts"] = poly.GetNumberOfPoints()
         # Faces: polygons + triangle strips as polygonal faces
         stats["faces"] = poly.GetNumberOfPolys() + poly.GetNumberOfStrips()
-
-        # Edges via extract edges (unique topological edges)
-        ext = vtk.vtkExtractEdges()
-        ext.SetInputData(poly)
-        ext.Update()
-        edges_out = ext.GetOutput()
-        stats["edges"] = edges_out.GetNumberOfLines()
-
-        # Triangles via triangulation
-        tri = vtk.vtkTriangleFilter()
-        tri.SetInputData(poly)
-        tri.Update()
-        tri_out = tri.GetOutput()
-        stats["tris"] = tri_out.GetNumberOfPolys()
+        if cached and cached[1] == signature:
+            stats["edges"], stats["tris"] = cached[2]["edges"], cached[2]["tris"]
+        else:
+            stats["edges"], stats["tris"] = self._count_edges_and_tris(poly)
 
         # Memory (KB) from polydata
         stats["memory_kb"] = poly.GetActualMemorySize()
+        self._stats_cache[key] = (mtime, signature, stats)
         return stats
 
+    def _actor_stats_entry(self, actor):
+        """(polydata key, stats) for a scene actor."""
+        mapper = actor.GetMapper() if actor else None
+        poly = self.as_polydata(mapper.GetInput()) if mapper else None
+        if poly is None:
+            return None, self.compute_polydata_stats(None)
+        return poly.GetAddressAsString("vtkPolyData"), self.compute_polydata_stats(poly)
+
+    def _scene_stats_apply(self, entry, sign):
+        key, s = entry
+        t = self._scene_totals
+        for k in ("verts", "edges", "faces", "tris"):
+            t[k] += sign * s[k]
+        # Instances share one polydata: its memory counts once while any user remains
+        ref = self._scene_poly_refs.setdefault(key, [0, 0])   # [users, memory_kb counted]
+        ref[0] += sign
+        if ref[0] <= 0:
+            t["memory_kb"] -= ref[1]
+            del self._scene_poly_refs[key]
+        elif sign > 0 and ref[1] != s["memory_kb"]:
+            t["memory_kb"] += s["memory_kb"] - ref[1]
+            ref[1] = s["memory_kb"]
+
+    def _scene_stats_refresh(self, actor):
+        new = self._actor_stats_entry(actor)
+        old = self._scene_stats.get(actor)
+        if old is not None and old[0] == new[0] and old[1] is new[1]:
+            return
+        # Add before removing so a shared polydata never drops to zero users mid-update
+        self._scene_stats[actor] = new
+        self._scene_stats_apply(new, +1)
+        if old is not None:
+            self._scene_stats_apply(old, -1)
+            if old[0] not in self._scene_poly_refs:
+                self._stats_cache.pop(old[0], None)
+
+    def _scene_stats_drop(self, actor):
+        old = self._scene_stats.pop(actor, None)
+        if old is not None:
+            self._scene_stats_apply(old, -1)
+            if old[0] not in self._scene_poly_refs:
+                self._stats_cache.pop(old[0], None)
+
     def compute_scene_totals(self):
-        """Compute scene-wide totals across all objects in the outliner/registry."""
-        totals = {"verts": 0, "edges": 0, "faces": 0, "tris": 0, "memory_kb": 0}
-        for name, actor in self.object_registry.items():
-            mapper = actor.GetMapper()
-            if not mapper:
-                continue
-            data = mapper.GetInput()
-            poly = self.as_polydata(data)
-            s = self.compute_polydata_stats(poly)
-            totals["verts"] += s["verts"]
-            totals["edges"] += s["edges"]
-            totals["faces"] += s["faces"]
-            totals["tris"] += s["tris"]
-            totals["memory_kb"] += s["memory_kb"]
-        return totals
-
-    def update_scene_totals(self):
-        """Update the Scene Totals labels."""
-        totals = self.compute_scene_totals()
+        """Scene-wide totals as running sums; re-checks every registered object (cache hits are cheap)."""
+        live = set(self.object_registry.values())
+        for actor in [a for a in self._scene_stats if a not in live]:
+            self._scene_stats_drop(actor)
+        for actor in live:
+            self._scene_stats_refresh(actor)
+        return dict(self._scene_totals)
+
+    def update_scene_totals(self, changed=None, removed=()):
+        """
+        Update the Scene Totals labels. changed: actors whose geometry was added or may
+        have changed (only those are re-counted); removed: actors that left the scene.
+        With neither given, everything in object_registry is reconciled. Inside
+        bulk_add() the calls are merged and applied once when the transaction ends.
+        """
+        pending = self._bulk_totals
+        if pending is not None:
+            if changed is None and not removed:
+                pending["full"] = True
+            else:
+                pending["changed"].extend(changed or ())
+                pending["removed"].extend(removed)
+            return
+        if changed is None and not removed:
+            totals = self.compute_scene_totals()
+        else:
+            for actor in removed:
+                self._scene_stats_drop(actor)
+            for actor in (changed or ()):
+                self._scene_stats_refresh(actor)
+            totals = self._scene_totals
         total_objects = len(self.object_registry)
         selected_objects = len(self.scene_outliner.selectedItems())
 
@@ -3858,6 +6191,33 @@ class MainWindow(QtWidgets.QMainWindow):
         mb = totals["memory_kb"] / 1024.0 if totals["memory_kb"] else 0.0
         self.details_labels["SceneMemory"].setText(f"{mb:.2f} MB" if mb > 0 else "N/A")
 
+    @contextlib.contextmanager
+    def bulk_add(self):
+        """
+        Transaction for adding many objects (multi-part imports, scripted scenes): the
+        renderer is not asked to redraw per actor (myVTK.bulk_add), the outliner neither
+        repaints nor emits selection signals, and Scene Totals updates are merged. One
+        redraw, one outliner repaint and one totals update happen on exit.
+        """
+        if self._bulk_totals is not None:
+            yield   # nested: the outer transaction refreshes
+            return
+        self._bulk_totals = {"changed": [], "removed": [], "full": False}
+        tree = self.scene_outliner
+        tree.setUpdatesEnabled(False)
+        was_blocked = tree.blockSignals(True)
+        try:
+            with self.vtk_app.bulk_add():
+                yield
+        finally:
+            pending, self._bulk_totals = self._bulk_totals, None
+            tree.blockSignals(was_blocked)
+            tree.setUpdatesEnabled(True)
+            if pending["full"]:
+                self.update_scene_totals()
+            elif pending["changed"] or pending["removed"]:
+                self.update_scene_totals(changed=pending["changed"], removed=pending["removed"])
+
     def count_color_arrays(self, pd):
         """Count color-like attributes in point/cell data."""
         def arrays_in_data(data):
@@ -3980,27 +6340,35 @@ class MainWindow(QtWidgets.QMainWindow):
             self.vtk_app.render_all()
             return
 
-        # Mesh objects: original behavior
+        # Mesh objects: apply, then record; a run of spinbox steps merges into one undo entry
         actor = self.get_selected_actor()
         if actor:
-            transform = vtk.vtkTransform()
-            pos = [self.spinboxes[f"Position{ax}"].value() for ax in "XYZ"]
-            rot = [self.spinboxes[f"Rotation{ax}"].value() for ax in "XYZ"]
-            scale = [self.spinboxes[f"Scale{ax}"].value() for ax in "XYZ"]
+            before = self._get_actor_user_matrix16(actor)
+            self._apply_spinbox_transform(actor)
+            after = self._get_actor_user_matrix16(actor)
+            if after != before:
+                self.undo_stack.push(TransformActorCommand(
+                    self, actor, before, after, mergeable=True, applied=True))
 
-            transform.Identity()
-            transform.Translate(pos)
-            transform.RotateZ(rot[2])
-            transform.RotateY(rot[1])
-            transform.RotateX(rot[0])
-            transform.Scale(scale)
+    def _apply_spinbox_transform(self, actor):
+        transform = vtk.vtkTransform()
+        pos = [self.spinboxes[f"Position{ax}"].value() for ax in "XYZ"]
+        rot = [self.spinboxes[f"Rotation{ax}"].value() for ax in "XYZ"]
+        scale = [self.spinboxes[f"Scale{ax}"].value() for ax in "XYZ"]
 
-            actor.SetUserTransform(transform)
+        transform.Identity()
+        transform.Translate(pos)
+        transform.RotateZ(rot[2])
+        transform.RotateY(rot[1])
+        transform.RotateX(rot[0])
+        transform.Scale(scale)
 
-            if self.transform_widget:
-                self.setup_transform_widget(actor)
+        actor.SetUserTransform(transform)
 
-            self.vtk_app.render_all()
+        if self.transform_widget:
+            self.sync_transform_widget(actor)
+
+        self.vtk_app.render_all()
 
     def on_appearance_changed(self):
         if self.block_signals: return
@@ -4014,6 +6382,13 @@ class MainWindow(QtWidgets.QMainWindow):
             discrete = True
 
         before = self._get_actor_property_snapshot(actor) if discrete else None
+        # Material settings are per batch in the glyph path; an object only needs its own
+        # actor once the panel asks for something other than the batch's settings
+        batch = getattr(actor, "_vt_batch", None)
+        if batch is not None and self._panel_matches_property(batch.actor.GetProperty()):
+            self._update_appearance_labels()
+            return
+        self.vtk_app.release_from_batch(actor)
 
         prop = actor.GetProperty()
         prop.SetOpacity(self.sliders["Opacity"].value() / 100.0)
@@ -4024,6 +6399,9 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # Reconfigure the existing normals filter instead of stacking a new one
         interp_idx = self.combos["Interpolation"].currentIndex()
+        # Instances share one normals filter; only detach when this actor actually changes shading
+        if self._is_shared_geometry(actor) and (prop.GetInterpolation() == 0) != (interp_idx == 0):
+            self._make_geometry_unique(actor)
         mapper = actor.GetMapper()
         if mapper:
             normals = getattr(mapper, "_vt_normals", None)
@@ -4060,11 +6438,18 @@ class MainWindow(QtWidgets.QMainWindow):
                     normals.ComputePointNormalsOn()
                     normals.SplittingOn()              # CHANGED
                     normals.SetFeatureAngle(30.0)
-                normals.Modified()
-                try:
-                    normals.Update()
-                except Exception:
-                    pass
+                # Cache-loaded meshes draw the stored Gouraud/Phong normals; only Flat
+                # needs the live stage, and then the mapper switches over for good
+                cached = getattr(mapper, "_vt_cached_output", False)
+                if cached and interp_idx == 0:
+                    mapper.SetInputConnection(normals.GetOutputPort())
+                    mapper._vt_cached_output = cached = False
+                if not cached:
+                    normals.Modified()
+                    try:
+                        normals.Update()
+                    except Exception:
+                        pass
 
         mode_idx = self.combos.get("Representation").currentIndex() if "Representation" in self.combos else 0
         if mode_idx == 0: prop.SetRepresentationToSurface()
@@ -4078,11 +6463,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if self.checks.get("FrontfaceCulling"):
             prop.FrontfaceCullingOn() if self.checks["FrontfaceCulling"].isChecked() else prop.FrontfaceCullingOff()
 
-        self.slider_value_labels["Opacity"].setText(f"{self.sliders['Opacity'].value()}%")
-        self.slider_value_labels["Ambient"].setText(f"{self.sliders['Ambient'].value()}%")
-        self.slider_value_labels["Diffuse"].setText(f"{self.sliders['Diffuse'].value()}%")
-        self.slider_value_labels["Specular"].setText(f"{self.sliders['Specular'].value()}%")
-        self.slider_value_labels["SpecularPower"].setText(str(self.sliders["SpecularPower"].value()))
+        self._update_appearance_labels()
 
         self.vtk_app.render_all()
 
@@ -4091,6 +6472,29 @@ class MainWindow(QtWidgets.QMainWindow):
             if after != before:
                 self.undo_stack.push(PropertyChangeCommand(self, actor, before, after))
 
+    def _update_appearance_labels(self):
+        self.slider_value_labels["Opacity"].setText(f"{self.sliders['Opacity'].value()}%")
+        self.slider_value_labels["Ambient"].setText(f"{self.sliders['Ambient'].value()}%")
+        self.slider_value_labels["Diffuse"].setText(f"{self.sliders['Diffuse'].value()}%")
+        self.slider_value_labels["Specular"].setText(f"{self.sliders['Specular'].value()}%")
+        self.slider_value_labels["SpecularPower"].setText(str(self.sliders["SpecularPower"].value()))
+
+    def _panel_matches_property(self, prop):
+        """True if the appearance panel shows prop's settings (read back as the panel reads them)."""
+        checks = getattr(self, "checks", {})
+        rep_idx = self.combos["Representation"].currentIndex() if "Representation" in self.combos else 0
+        return (self.sliders["Opacity"].value() == int(prop.GetOpacity() * 100)
+                and self.sliders["Ambient"].value() == int(prop.GetAmbient() * 100)
+                and self.sliders["Diffuse"].value() == int(prop.GetDiffuse() * 100)
+                and self.sliders["Specular"].value() == int(prop.GetSpecular() * 100)
+                and self.sliders["SpecularPower"].value() == int(prop.GetSpecularPower())
+                and self.combos["Interpolation"].currentIndex() == prop.GetInterpolation()
+                and (2, 1, 0)[rep_idx] == prop.GetRepresentation()
+                and all(checks[name].isChecked() == bool(value) for name, value in (
+                    ("ShowEdges", prop.GetEdgeVisibility()),
+                    ("BackfaceCulling", prop.GetBackfaceCulling()),
+                    ("FrontfaceCulling", prop.GetFrontfaceCulling())) if name in checks))
+
     def change_current_object_color(self):
         """Change color for all selected mesh objects."""
         # Collect selected mesh actors (exclude lights/collections)
@@ -4134,22 +6538,100 @@ class MainWindow(QtWidgets.QMainWindow):
      # ===== Export helpers =====
     def polydata_from_actor(self, actor: vtk.vtkActor, apply_transform=True) -> vtk.vtkPolyData:
         """Return a (optionally world-transformed) vtkPolyData from an actor."""
-        if not actor or not actor.GetMapper() or not actor.GetMapper().GetInput():
-            return None
-        data = actor.GetMapper().GetInput()
-        poly = self.as_polydata(data)
+        poly, clean = self.export_source(actor)
         if poly is None:
             return None
+        mat = None
         if apply_transform:
             mat = vtk.vtkMatrix4x4()
             actor.GetMatrix(mat)  # world transform (includes UserTransform)
+        return self.transform_and_clean(poly, mat, clean=clean)
+
+    def export_source(self, actor):
+        """
+        (polydata, clean) for exporting an actor's mesh. clean is True when the data is
+        the output of the clean + normals stage (live or cached), which has no unused
+        points or degenerate cells; only points split along feature edges may coincide.
+        """
+        mapper = actor.GetMapper() if actor else None
+        data = mapper.GetInput() if mapper else None
+        poly = self.as_polydata(data)
+        if poly is None:
+            return None, False
+        return poly, poly is data and getattr(mapper, "_vt_normals", None) is not None
+
+    @staticmethod
+    def has_coincident_points(poly: vtk.vtkPolyData) -> bool:
+        """True if two points of poly may share exact coordinates (what vtkCleanPolyData merges)."""
+        n = poly.GetNumberOfPoints()
+        if n < 2:
+            return False
+        pts = numpy_support.vtk_to_numpy(poly.GetPoints().GetData())
+        uint = np.uint64 if pts.dtype.itemsize == 8 else np.uint32
+        bits = (pts + pts.dtype.type(0)).view(uint).astype(np.uint64)   # -0.0 -> +0.0
+        # Equal points hash equal; a collision only costs an unneeded clean
+        h = bits[:, 0] * np.uint64(0x9E3779B97F4A7C15)
+        h ^= bits[:, 1] * np.uint64(0xC2B2AE3D27D4EB4F)
+        h ^= bits[:, 2]
+        h.sort()
+        return bool(np.any(h[1:] == h[:-1]))
+
+    @staticmethod
+    def transform_polydata(poly: vtk.vtkPolyData, matrix: vtk.vtkMatrix4x4) -> vtk.vtkPolyData:
+        """
+        Apply matrix to poly like vtkTransformPolyDataFilter. Identity returns poly itself;
+        an affine matrix writes new points (and normals) through NumPy into a shallow copy.
+        """
+        m = np.array([[matrix.GetElement(r, c) for c in range(4)] for r in range(4)])
+        if np.array_equal(m, np.eye(4)):
+            return poly
+        pd, cd = poly.GetPointData(), poly.GetCellData()
+        if not np.array_equal(m[3], (0.0, 0.0, 0.0, 1.0)) or pd.GetVectors() or cd.GetVectors() \
+                or poly.GetPoints() is None:
             tf = vtk.vtkTransform()
-            tf.SetMatrix(mat)
+            tf.SetMatrix(matrix)
             tpf = vtk.vtkTransformPolyDataFilter()
             tpf.SetInputData(poly)
             tpf.SetTransform(tf)
             tpf.Update()
-            poly = tpf.GetOutput()
+            return tpf.GetOutput()
+
+        out = vtk.vtkPolyData()
+        out.ShallowCopy(poly)
+        src = numpy_support.vtk_to_numpy(poly.GetPoints().GetData())
+        xyz = src @ m[:3, :3].T          # the one unavoidable copy, in double
+        xyz += m[:3, 3]
+        arr = numpy_support.numpy_to_vtk(xyz.astype(src.dtype, copy=False), deep=True)
+        pts = vtk.vtkPoints()
+        pts.SetData(arr)
+        out.SetPoints(pts)
+
+        normal_m = np.linalg.inv(m[:3, :3]).T
+        for data, out_data in ((pd, out.GetPointData()), (cd, out.GetCellData())):
+            normals = data.GetNormals()
+            if normals is None:
+                continue
+            nsrc = numpy_support.vtk_to_numpy(normals)
+            nrm = nsrc @ normal_m.T
+            length = np.linalg.norm(nrm, axis=1, keepdims=True)
+            np.divide(nrm, length, out=nrm, where=length > 0.0)
+            narr = numpy_support.numpy_to_vtk(nrm.astype(nsrc.dtype, copy=False), deep=True)
+            narr.SetName(normals.GetName())
+            out_data.SetNormals(narr)
+        return out
+
+    @classmethod
+    def transform_and_clean(cls, poly: vtk.vtkPolyData, matrix: vtk.vtkMatrix4x4 = None,
+                            clean=False) -> vtk.vtkPolyData:
+        """
+        World-transform (when matrix is given) and clean a polydata; safe off the GUI thread.
+        clean=True (see export_source) runs the cleaner only if points coincide, so an
+        untransformed, split-free mesh is returned as is.
+        """
+        if matrix is not None:
+            poly = cls.transform_polydata(poly, matrix)
+        if clean and not cls.has_coincident_points(poly):
+            return poly
 
         # Optional: clean before write
         cleaner = vtk.vtkCleanPolyData()
@@ -4212,7 +6694,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 return
             self.current_tool = VertexEditTool(self)
             self.current_tool.start()
-            self.statusBar().showMessage("Vertex Edit: click a vertex then drag to move it.")
+            self.statusBar().showMessage("Vertex Edit: click a vertex then drag to move it; O toggles proportional editing.")
         else:
             # Start face edit tool
             actor = self.get_selected_actor()
@@ -4369,18 +6851,87 @@ class MainWindow(QtWidgets.QMainWindow):
         }
         ext = ext_map[item]
 
-        count_ok, count_fail = 0, 0
+        # Snapshot geometry and world matrix here; the pool only sees these copies
+        jobs = queue.Queue()
+        count_fail = 0
         for name, actor in self.object_registry.items():
             # sanitize filename
             base = "".join(c if c.isalnum() or c in ("-", "_") else "_" for c in name)
             out_path = os.path.join(target_dir, base + ext)
-            poly = self.polydata_from_actor(actor, apply_transform=True)
-            if poly is None or not self.write_polydata(poly, out_path):
+            poly, clean = self.export_source(actor)
+            if poly is None:
                 count_fail += 1
-            else:
-                count_ok += 1
-
-        self.statusBar().showMessage(f"Exported {count_ok} object(s), {count_fail} failed. Directory: {target_dir}")
+                continue
+            snapshot = vtk.vtkPolyData()
+            snapshot.ShallowCopy(poly)
+            mat = vtk.vtkMatrix4x4()
+            actor.GetMatrix(mat)
+            jobs.put((name, snapshot, mat, clean, out_path))
+        self._start_export_batch(jobs, target_dir, count_fail)
+
+    def _start_export_batch(self, jobs, target_dir, count_fail=0):
+        """Run queued export jobs on one ExportWorker per core, with a cancellable progress dialog."""
+        if self._export_batch is not None:
+            self.statusBar().showMessage("Export All: an export is already running")
+            return
+        total = jobs.qsize()
+        cancel_event = threading.Event()
+        dlg = QtWidgets.QProgressDialog(f"Exporting {total} object(s)...", "Cancel", 0, max(total, 1), self)
+        dlg.setWindowTitle("Export All")
+        dlg.setMinimumDuration(300)
+        dlg.setAutoClose(False)
+        dlg.setAutoReset(False)
+        dlg.canceled.connect(cancel_event.set)
+        self._export_batch = {
+            "dir": target_dir, "total": total, "done": 0, "ok": 0, "fail": count_fail, "timings": [],
+            "cancel": cancel_event, "dialog": dlg, "workers": [], "t0": time.perf_counter(),
+        }
+        n_workers = min(max(1, QtCore.QThread.idealThreadCount()), total)
+        for _ in range(n_workers):
+            worker = ExportWorker(self, jobs, cancel_event, self)
+            worker.exported.connect(self._on_object_exported)
+            worker.finished.connect(self._on_export_worker_finished)
+            self._export_batch["workers"].append(worker)
+            worker.start()
+        if not n_workers:
+            self._finish_export_batch()
+
+    def _on_object_exported(self, name, path, ms, error):
+        batch = self._export_batch
+        if batch is None:
+            return
+        if error:
+            batch["fail"] += 1
+            print(f"[Export] {name}: FAILED after {ms:.0f} ms ({error})")
+        else:
+            batch["ok"] += 1
+            batch["timings"].append((ms, name))
+            print(f"[Export] {name} -> {os.path.basename(path)}: {ms:.0f} ms")
+        batch["done"] += 1
+        batch["dialog"].setValue(batch["done"])
+
+    def _on_export_worker_finished(self):
+        batch = self._export_batch
+        if batch is not None and all(w.isFinished() for w in batch["workers"]):
+            self._finish_export_batch()
+
+    def _finish_export_batch(self):
+        batch, self._export_batch = self._export_batch, None
+        for worker in batch["workers"]:
+            worker.wait()
+            worker.deleteLater()
+        # (closing the dialog emits canceled, so count cancellations from what is left)
+        batch["dialog"].close()
+        batch["dialog"].deleteLater()
+        elapsed = time.perf_counter() - batch["t0"]
+        msg = f"Exported {batch['ok']} object(s), {batch['fail']} failed"
+        if batch["done"] < batch["total"]:
+            msg += f", {batch['total'] - batch['done']} cancelled"
+        msg += f" in {elapsed:.1f} s ({len(batch['workers'])} thread(s))"
+        if batch["timings"]:
+            slowest_ms, slowest = max(batch["timings"])
+            msg += f", slowest {slowest} {slowest_ms:.0f} ms"
+        self.statusBar().showMessage(f"{msg}. Directory: {batch['dir']}")
 
     def export_scene_as_one(self):
         """Export all mesh objects merged into one mesh file."""
@@ -4394,23 +6945,23 @@ class MainWindow(QtWidgets.QMainWindow):
             return
 
         append = vtk.vtkAppendPolyData()
-        any_data = False
+        parts = []
         for _, actor in self.object_registry.items():
             poly = self.polydata_from_actor(actor, apply_transform=True)
             if poly and poly.GetNumberOfPoints() > 0:
                 append.AddInputData(poly)
-                any_data = True
+                parts.append(poly)
 
-        if not any_data:
+        if not parts:
             QtWidgets.QMessageBox.warning(self, "Export Scene", "No valid mesh data to export.")
             return
 
-        append.Update()
-        # Clean and (optional) triangulate for formats like STL
-        cleaned = vtk.vtkCleanPolyData()
-        cleaned.SetInputData(append.GetOutput())
-        cleaned.Update()
-        out_poly = cleaned.GetOutput()
+        if len(parts) == 1:
+            out_poly = parts[0]     # already cleaned by polydata_from_actor
+        else:
+            append.Update()
+            # Parts are clean on their own; only points shared between parts need merging
+            out_poly = self.transform_and_clean(append.GetOutput(), clean=True)
 
         # For STL, ensure triangles
         if os.path.splitext(filepath)[1].lower() == ".stl":
@@ -4433,6 +6984,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if not app:
             return
         # Recreate the style object (flush caches)
+        self._outliner_icons = {}
         try:
             current_style_name = app.style().objectName()
             app.setStyle(QStyleFactory.create(current_style_name))
@@ -4656,6 +7208,27 @@ class MainWindow(QtWidgets.QMainWindow):
 
             self.vtk_app.render_all()
 
+    def sync_transform_widget(self, actor):
+        """
+        Move the existing gizmo to the actor's current transform without recreating it
+        (spinbox edits). Falls back to setup_transform_widget if the gizmo does not fit.
+        """
+        widget = self.transform_widget
+        if widget is None or actor is not self.current_selected_actor:
+            self.setup_transform_widget(actor)
+            return
+        try:
+            rep = widget.GetRepresentation()
+            if isinstance(widget, vtk.vtkImplicitPlaneWidget2):
+                rep.PlaceWidget(actor.GetBounds())
+                rep.SetOrigin(self._world_pos_from_actor(actor))
+            else:
+                rep.SetTransform(actor.GetUserTransform())
+                if self.current_transform_mode == 'scale':
+                    self._update_uniform_scale_hints(actor)
+        except Exception:
+            self.setup_transform_widget(actor)
+
     def setup_translate_handle_widget(self, actor):
         """Sets up a vtkImplicitPlaneWidget2 for translation, showing a circle."""
         self.transform_widget = vtk.vtkImplicitPlaneWidget2()
@@ -4983,14 +7556,15 @@ class MainWindow(QtWidgets.QMainWindow):
             self.setup_transform_widget(self.current_selected_actor)
 
     def add_actor_with_name(self, name: str, actor: vtk.vtkActor):
+        """Register actor under a unique name derived from name and return that name."""
         if not actor:
             return
         # Generate unique name
-        count = len([key for key in self.object_registry if key.startswith(name)]) + 1
-        unique_name = f"{name}_{count}" if count > 1 else name
+        unique_name = self.scene_index.unique_name(name)
 
         # Register and add to scene
         self.object_registry[unique_name] = actor
+        self.actor_names[actor] = unique_name
         actor.SetUserTransform(None)
         self.vtk_app.add_actor_to_scene(actor)
 
@@ -5013,7 +7587,8 @@ class MainWindow(QtWidgets.QMainWindow):
             self.scene_outliner.setCurrentItem(list_item)
             self.on_outliner_selection_changed(list_item)
 
-        self.update_scene_totals()
+        self.update_scene_totals(changed=[actor])
+        return unique_name
 
     # NEW: start the Add Cube interactive tool
     def activate_add_cube_tool(self):
@@ -5619,11 +8194,15 @@ class FaceEditTool:
       - Click a face to select (highlights).
       - Drag to move that face along its normal (moves all vertices of that face).
       - Press Delete (or click overlay button) to delete the face.
+      - Box / lasso (B / L) selects every face whose corners are all inside; Delete
+        removes them together.
     Notes:
       * Edits a single selected mesh actor.
       * No topology fixes; shared vertices move with the face.
-      * Undo integrates via existing VertexEditCommand.
+      * Undo integrates via VertexEditCommand (point deltas; deletions as removed polygons).
     """
+    region_items = "faces"
+
     def __init__(self, main_window: MainWindow):
         self.main = main_window
         self.vtk_app = main_window.vtk_app
@@ -5633,18 +8212,20 @@ class FaceEditTool:
 
         self.active_actor = None
         self.edit_poly = None
+        self.edit_mesh = None
 
         self.cell_picker = vtk.vtkCellPicker()
         self.cell_picker.SetTolerance(0.0005)
 
         self.selected_cell_id = -1
+        self.selected_cell_ids = np.zeros(0, dtype=np.int64)   # box / lasso selection
         self.face_point_ids = []       # [pid...]
         self.face_points_start = []    # [(x,y,z)...] at drag start
         self.face_normal = (0.0, 0.0, 1.0)
 
         self.dragging = False
         self.drag_start_y = 0
-        self.poly_before = None
+        self.points_before = None      # point coordinates at the last undo entry
 
         # Highlight actor (semi-transparent overlay of the selected face)
         self.highlight_actor = None
@@ -5666,24 +8247,24 @@ class FaceEditTool:
             return
 
         self.active_actor = actor
+        self.vtk_app.release_from_batch(actor)
 
-        # Make an editable copy of the mesh
-        src = actor.GetMapper().GetInput()
-        poly = self.main.as_polydata(src)
+        # Make an editable copy of the mesh (this is also the copy-on-write point for
+        # instances: the actor leaves the shared mapper and gets its own below)
+        poly = getattr(actor.GetMapper(), "_vt_edit_source", None)
+        if poly is None:
+            poly = self.main.as_polydata(actor.GetMapper().GetInput())
         if poly is None:
             return
 
         self.edit_poly = vtk.vtkPolyData()
         self.edit_poly.DeepCopy(poly)
-
-        self.poly_before = vtk.vtkPolyData()
-        self.poly_before.DeepCopy(self.edit_poly)
+        self.points_before = numpy_support.vtk_to_numpy(self.edit_poly.GetPoints().GetData()).copy()
 
         # IMPORTANT: map the editable poly directly so picker CellIds match
-        mapper = vtk.vtkPolyDataMapper()
-        mapper.SetInputData(self.edit_poly)
-        mapper.ScalarVisibilityOff()
-        self.active_actor.SetMapper(mapper)
+        # (EditMesh: no clean, normals kept current for the moved faces only)
+        self.edit_mesh = EditMesh(self.edit_poly)
+        self.active_actor.SetMapper(self.edit_mesh.mapper)
 
         # Build highlight overlay (shares same points)
         self._build_highlight_actor()
@@ -5770,17 +8351,29 @@ class FaceEditTool:
         except Exception:
             pass
 
-        # push undo snapshot if not cancelled
+        # Back on the regular clean + normals mapper, fed by the edited polydata
+        if self.active_actor and self.edit_poly:
+            self.active_actor.SetMapper(self.vtk_app.create_edited_mapper(self.edit_poly))
+        self.edit_mesh = None
+
+        # push undo delta if not cancelled
         if not cancel and self.active_actor and self.edit_poly:
-            poly_after = vtk.vtkPolyData()
-            poly_after.DeepCopy(self.edit_poly)
             try:
-                self.main.undo_stack.push(VertexEditCommand(self.main, self.active_actor, self.poly_before, poly_after))
+                self._push_point_edit()
             except Exception:
                 pass
 
         self.vtk_app.render_all()
 
+    def _push_point_edit(self):
+        """Undo entry for the face moves since the last entry (changed points only)."""
+        cmd = VertexEditCommand(self.main, self.active_actor, self.edit_poly,
+                                points_before=self.points_before, text="Move Faces")
+        if cmd.is_empty():
+            return
+        self.main.undo_stack.push(cmd)
+        self.points_before = numpy_support.vtk_to_numpy(self.edit_poly.GetPoints().GetData()).copy()
+
     # ---- ui helpers ----
     def _position_delete_button(self):
         if not self.delete_btn:
@@ -5848,6 +8441,7 @@ class FaceEditTool:
     def _set_highlight_face(self, cell_id: int):
         self.highlight_cells.Reset()
         self.selected_cell_id = -1
+        self.selected_cell_ids = np.zeros(0, dtype=np.int64)
         self.face_point_ids = []
         if cell_id < 0:
             self.highlight_actor.VisibilityOff()
@@ -5880,6 +8474,40 @@ class FaceEditTool:
         self.selected_cell_id = cell_id
         self.vtk_app.render_all()
 
+    def select_region(self, selector, op="replace"):
+        """Select every face inside a RegionSelector region; returns the selection size."""
+        if not self.active_actor or not self.edit_poly:
+            return 0
+        inside = selector.point_mask(self.edit_poly, RegionSelector.actor_matrix(self.active_actor))
+        current = self.selected_cell_ids
+        if not len(current) and self.selected_cell_id >= 0:
+            current = np.array([self.selected_cell_id], dtype=np.int64)
+        self._set_highlight_faces(RegionSelector.combine(current, RegionSelector.cells_inside(self.edit_poly, inside), op))
+        return len(self.selected_cell_ids)
+
+    def _set_highlight_faces(self, cell_ids):
+        """Highlight many polygon faces at once (connectivity gathered with NumPy)."""
+        self._set_highlight_face(-1)
+        cell_ids = np.asarray(cell_ids, dtype=np.int64)
+        if not len(cell_ids):
+            return
+        polys = self.edit_poly.GetPolys()
+        offsets = numpy_support.vtk_to_numpy(polys.GetOffsetsArray())
+        conn = numpy_support.vtk_to_numpy(polys.GetConnectivityArray())
+        rows = cell_ids - (self.edit_poly.GetNumberOfVerts() + self.edit_poly.GetNumberOfLines())
+        starts, sizes = offsets[rows], offsets[rows + 1] - offsets[rows]
+        new_offsets = np.concatenate(([0], np.cumsum(sizes)))
+        gather = np.repeat(starts - new_offsets[:-1], sizes) + np.arange(new_offsets[-1])
+        self.highlight_cells.SetData(numpy_support.numpy_to_vtkIdTypeArray(new_offsets.astype(np.int64), deep=1),
+                                     numpy_support.numpy_to_vtkIdTypeArray(conn[gather].astype(np.int64), deep=1))
+        self.highlight_cells.Modified()
+        self.highlight_poly.Modified()
+        self.highlight_actor.VisibilityOn()
+        self.selected_cell_ids = cell_ids
+        if self.delete_btn:
+            self.delete_btn.show()
+        self.vtk_app.render_all()
+
     # ---- normals / scale ----
     def _compute_face_normal(self):
         if not self.face_point_ids or len(self.face_point_ids) < 3:
@@ -5927,9 +8555,7 @@ class FaceEditTool:
     # ---- events ----
     def _on_left_down(self, obj, evt):
         x, y = self.iren.GetEventPosition()
-        self.cell_picker.Pick(x, y, 0, self.renderer)
-        picked_actor = self.cell_picker.GetActor()
-        cid = int(self.cell_picker.GetCellId()) if self.cell_picker.GetCellId() >= 0 else -1
+        picked_actor, cid, _ = self.vtk_app.pick_cell(x, y, self.cell_picker)
 
         # Clicked outside or on a different actor: clear
         if picked_actor is not self.active_actor or cid < 0:
@@ -5983,6 +8609,7 @@ class FaceEditTool:
             pts.SetPoint(pid, x0 + vx, y0 + vy, z0 + vz)
         pts.Modified()
         self.edit_poly.Modified()
+        self.edit_mesh.update(self.face_point_ids, self.face_point_ids)
         self.vtk_app.render_all()
 
     def _on_key_press(self, obj, evt):
@@ -5992,29 +8619,23 @@ class FaceEditTool:
 
     # ---- operations ----
     def _delete_selected_face(self):
-        if self.selected_cell_id < 0 or not self.edit_poly:
+        if not self.edit_poly:
             return
-        # record undo snapshot around delete
-        before = vtk.vtkPolyData(); before.DeepCopy(self.edit_poly)
-
-        self.edit_poly.BuildCells()
-        self.edit_poly.BuildLinks()
+        # Box / lasso selection, else the clicked face
+        cell_ids = [int(c) for c in self.selected_cell_ids]
+        if not cell_ids and self.selected_cell_id >= 0:
+            cell_ids = [self.selected_cell_id]
+        if not cell_ids:
+            return
+        # Face moves so far get their own entry; the deletion is a command whose redo
+        # removes the polygons (its undo re-inserts them at their old positions)
         try:
-            self.edit_poly.DeleteCell(self.selected_cell_id)
-            self.edit_poly.RemoveDeletedCells()
+            self._push_point_edit()
+            removed = VertexEditCommand.capture_polys(self.edit_poly, cell_ids)
+            self.main.undo_stack.push(VertexEditCommand(self.main, self.active_actor, self.edit_poly,
+                                                        removed_polys=removed, text="Delete Faces", applied=False))
         except Exception:
-            # fallback: rebuild polys skipping the selected id
-            new_polys = vtk.vtkCellArray()
-            old = self.edit_poly.GetPolys()
-            id_list = vtk.vtkIdList()
-            idx = 0
-            old.InitTraversal()
-            while old.GetNextCell(id_list):
-                if idx != self.selected_cell_id:
-                    new_polys.InsertNextCell(id_list)
-                idx += 1
-            self.edit_poly.SetPolys(new_polys)
-        self.edit_poly.Modified()
+            pass
 
         # clear highlight
         self._set_highlight_face(-1)
@@ -6023,24 +8644,28 @@ class FaceEditTool:
 
         self.vtk_app.render_all()
 
-        after = vtk.vtkPolyData(); after.DeepCopy(self.edit_poly)
-        try:
-            self.main.undo_stack.push(VertexEditCommand(self.main, self.active_actor, before, after))
-        except Exception:
-            pass
-
 
 class VertexEditTool:
     """
     Minimal vertex edit tool:
       - works on the currently selected mesh actor
       - click a vertex to select (highlighted as a small sphere)
-      - drag mouse to move that vertex in the camera view plane
+      - Shift-click toggles a vertex in the selection; Ctrl-click selects every vertex
+        within select_radius of it (Ctrl+Shift adds them); box / lasso (B / L) too
+      - drag a selected vertex to move the whole selection in the camera view plane
+      - O toggles proportional editing (unselected vertices within proportional_radius
+        follow the drag, weighted by a falloff); Shift+O cycles smooth / sphere / linear
+        falloff and the mouse wheel scales the radius
 
     Notes:
-      * Only single-vertex editing (one at a time).
+      * Selected vertices are highlighted as points.
+      * The drag writes all selected vertices with one NumPy assignment into a
+        zero-copy view of the vtkPoints array; actor matrices are cached as NumPy 4x4.
       * Works for any object type that can be converted to vtkPolyData.
     """
+    region_items = "vertices"
+    FALLOFFS = ("smooth", "sphere", "linear")
+
     def __init__(self, main_window):
         self.main = main_window
         self.vtk_app = main_window.vtk_app
@@ -6050,11 +8675,28 @@ class VertexEditTool:
 
         self.active_actor = None
         self.edit_poly = None
+        self.edit_mesh = None
 
         self.picker = vtk.vtkCellPicker()
         self.picker.SetTolerance(0.0005)
 
         self.highlight_actor = None
+        # Region (box / lasso) selection: sorted point ids + point overlay
+        self.selected_pids = np.zeros(0, dtype=np.int64)
+        self.selection_actor = None
+        self.selection_poly = None
+        self._overlay_view = None      # NumPy view of the overlay points (follows drags)
+        self.select_radius = None      # model units for Ctrl-click; default 5% of the mesh diagonal
+        # Proportional editing; radius in model units, default 10% of the mesh diagonal
+        self.proportional = False
+        self.falloff = "smooth"
+        self.proportional_radius = None
+        # Drag state: moved ids (selection first, then falloff neighbours), their
+        # model-space start positions, per-vertex weights and the last applied delta
+        self._drag_ids = np.zeros(0, dtype=np.int64)
+        self._drag_start = np.zeros((0, 3))
+        self._drag_weights = np.ones((0, 1))
+        self._drag_delta = np.zeros(3)
 
         self.dragging = False
         self.picked_pid = -1
@@ -6079,29 +8721,33 @@ class VertexEditTool:
             return
 
         self.active_actor = actor
+        self.main.vtk_app.release_from_batch(actor)
 
-        # Detach geometry into an editable vtkPolyData copy
-        src_data = actor.GetMapper().GetInput()
-        poly = self.main.as_polydata(src_data)
+        # Detach geometry into an editable vtkPolyData copy (copy-on-write point for
+        # instances: only this actor moves off the shared mapper)
+        poly = getattr(actor.GetMapper(), "_vt_edit_source", None)
+        if poly is None:
+            poly = self.main.as_polydata(actor.GetMapper().GetInput())
         if poly is None:
             return
 
         self.edit_poly = vtk.vtkPolyData()
         self.edit_poly.DeepCopy(poly)
+        self.points_before = numpy_support.vtk_to_numpy(self.edit_poly.GetPoints().GetData()).copy()
 
-        self.poly_before = vtk.vtkPolyData()
-        self.poly_before.DeepCopy(self.edit_poly)
-
-        tp = vtk.vtkTrivialProducer()
-        tp.SetOutput(self.edit_poly)
-        new_mapper = self.main.vtk_app.create_mapper(tp)
-        self.active_actor.SetMapper(new_mapper)
+        # Draw the editable copy directly: fixed topology (point ids stay valid) and
+        # normals refreshed only around moved vertices, see EditMesh
+        self.edit_mesh = EditMesh(self.edit_poly)
+        self.active_actor.SetMapper(self.edit_mesh.mapper)
 
         # Save actor matrices (world <-> local)
         self.actor_matrix = vtk.vtkMatrix4x4()
         self.active_actor.GetMatrix(self.actor_matrix)
         self.actor_matrix_inv = vtk.vtkMatrix4x4()
         vtk.vtkMatrix4x4.Invert(self.actor_matrix, self.actor_matrix_inv)
+        # NumPy copies for the per-move math
+        self._m = RegionSelector.actor_matrix(self.active_actor)
+        self._m_inv = np.linalg.inv(self._m)
 
         # Highlight sphere (hidden until a vertex is selected)
         sphere = vtk.vtkSphereSource()
@@ -6172,6 +8818,9 @@ class VertexEditTool:
         self._add_obs("LeftButtonPressEvent", self.on_left_down)
         self._add_obs("LeftButtonReleaseEvent", self.on_left_up)
         self._add_obs("MouseMoveEvent", self.on_mouse_move)
+        self._add_obs("KeyPressEvent", self.on_key_press)
+        self._add_obs("MouseWheelForwardEvent", self.on_wheel)
+        self._add_obs("MouseWheelBackwardEvent", self.on_wheel)
 
         self.vtk_app.render_all()
 
@@ -6185,9 +8834,12 @@ class VertexEditTool:
         try:
             if self.highlight_actor:
                 self.renderer.RemoveActor(self.highlight_actor)
+            if self.selection_actor:
+                self.renderer.RemoveActor(self.selection_actor)
         except Exception:
             pass
         self.highlight_actor = None
+        self.selection_actor = None
 
         # Detach observers
         for (_, tag) in self.obs:
@@ -6211,12 +8863,17 @@ class VertexEditTool:
         except Exception:
             pass
 
-        # Commit undo (only if accepted)
+        # Back on the regular clean + normals mapper, fed by the edited polydata
+        if self.active_actor and self.edit_poly:
+            self.active_actor.SetMapper(self.vtk_app.create_edited_mapper(self.edit_poly))
+        self.edit_mesh = None
+
+        # Commit undo (only if accepted): changed points only
         if not cancel and self.active_actor and self.edit_poly:
-            poly_after = vtk.vtkPolyData()
-            poly_after.DeepCopy(self.edit_poly)
             try:
-                self.main.undo_stack.push(VertexEditCommand(self.main, self.active_actor, self.poly_before, poly_after))
+                cmd = VertexEditCommand(self.main, self.active_actor, self.edit_poly, points_before=self.points_before)
+                if not cmd.is_empty():
+                    self.main.undo_stack.push(cmd)
             except Exception:
                 pass
 
@@ -6275,20 +8932,138 @@ class VertexEditTool:
         return (wp[0] / wp[3], wp[1] / wp[3], wp[2] / wp[3])
 
     def _local_to_world(self, xyz):
-        x, y, z = xyz
-        m = self.actor_matrix
-        vx = m.GetElement(0, 0) * x + m.GetElement(0, 1) * y + m.GetElement(0, 2) * z + m.GetElement(0, 3)
-        vy = m.GetElement(1, 0) * x + m.GetElement(1, 1) * y + m.GetElement(1, 2) * z + m.GetElement(1, 3)
-        vz = m.GetElement(2, 0) * x + m.GetElement(2, 1) * y + m.GetElement(2, 2) * z + m.GetElement(2, 3)
-        return (vx, vy, vz)
+        return tuple(self._m[:3, :3] @ np.asarray(xyz, dtype=float) + self._m[:3, 3])
+
+    def _world_to_local(self, xyz):
+        return tuple(self._m_inv[:3, :3] @ np.asarray(xyz, dtype=float) + self._m_inv[:3, 3])
 
     def _world_vec_to_local(self, dx, dy, dz):
         # Multiply by inverse matrix, w=0 (pure direction)
-        m = self.actor_matrix_inv
-        lx = m.GetElement(0, 0) * dx + m.GetElement(0, 1) * dy + m.GetElement(0, 2) * dz
-        ly = m.GetElement(1, 0) * dx + m.GetElement(1, 1) * dy + m.GetElement(1, 2) * dz
-        lz = m.GetElement(2, 0) * dx + m.GetElement(2, 1) * dy + m.GetElement(2, 2) * dz
-        return (lx, ly, lz)
+        return tuple(self._m_inv[:3, :3] @ np.array((dx, dy, dz)))
+
+    def _points_view(self):
+        """Zero-copy (N, 3) NumPy view of the edited vtkPoints array (writes go straight to VTK)."""
+        return numpy_support.vtk_to_numpy(self.edit_poly.GetPoints().GetData())
+
+    def _points_within(self, center_local, radius):
+        """Point ids within radius of a model-space point (vtkPointLocator query)."""
+        ids = vtk.vtkIdList()
+        self.point_locator.FindPointsWithinRadius(radius, center_local, ids)
+        n = ids.GetNumberOfIds()
+        return np.sort(np.fromiter((ids.GetId(i) for i in range(n)), dtype=np.int64, count=n))
+
+    # ----- proportional editing -----
+    @staticmethod
+    def _falloff_weights(t, kind):
+        """Falloff weights for t = 1 - distance / radius (1 at the selection, 0 at the radius)."""
+        if kind == "sphere":
+            return np.sqrt(np.clip(t * (2.0 - t), 0.0, None))
+        if kind == "linear":
+            return t
+        return t * t * (3.0 - 2.0 * t)
+
+    def _proportional_neighbours(self, view, sel):
+        """Unselected point ids within proportional_radius of the selection, with their distances."""
+        r = self.proportional_radius
+        if len(sel) == 1:
+            # Single vertex: radius query on the tool's point locator
+            centre = view[sel[0]].astype(np.float64)
+            ids = self._points_within(tuple(centre), r)
+            ids = ids[ids != sel[0]]
+            return ids, np.linalg.norm(view[ids] - centre, axis=1)
+        # Candidates inside the selection bounds grown by r, then the distance to the
+        # nearest selected vertex for all of them in one vtkPointInterpolator pass
+        # (Voronoi kernel = nearest source point) over a kd-tree
+        selected = np.zeros(len(view), dtype=bool)
+        selected[sel] = True
+        sel_pts = view[sel].astype(np.float64)
+        lo, hi = sel_pts.min(axis=0) - r, sel_pts.max(axis=0) + r
+        mask = np.all((view >= lo) & (view <= hi), axis=1) & ~selected
+        ids = np.flatnonzero(mask)
+        if not len(ids):
+            return ids, np.zeros(0)
+        # Seen from outside, the nearest selected vertex is on the selection border
+        # (selected corners of cells that also have unselected corners): far fewer sources
+        polys = self.edit_poly.GetPolys()
+        if polys is not None and polys.GetNumberOfCells():
+            offsets = numpy_support.vtk_to_numpy(polys.GetOffsetsArray())
+            conn = numpy_support.vtk_to_numpy(polys.GetConnectivityArray())
+            corner_sel = selected[conn]
+            sizes = np.diff(offsets)
+            count = np.add.reduceat(corner_sel.astype(np.int32), offsets[:-1]) * (sizes > 0)
+            mixed = (count > 0) & (count < sizes)
+            border = np.zeros(len(view), dtype=bool)
+            border[conn[np.repeat(mixed, sizes) & corner_sel]] = True
+            if border.any():
+                sel_pts = view[border].astype(np.float64)
+        src = vtk.vtkPolyData()
+        src_points = vtk.vtkPoints()
+        src_points.SetData(numpy_support.numpy_to_vtk(sel_pts, deep=1))
+        src.SetPoints(src_points)
+        nearest = numpy_support.numpy_to_vtk(sel_pts, deep=1)
+        nearest.SetName("nearest")
+        src.GetPointData().AddArray(nearest)
+        probe = vtk.vtkPolyData()
+        probe_points = vtk.vtkPoints()
+        probe_points.SetData(numpy_support.numpy_to_vtk(np.ascontiguousarray(view[ids], dtype=np.float64), deep=1))
+        probe.SetPoints(probe_points)
+        locator = vtk.vtkKdTreePointLocator()
+        locator.SetDataSet(src)
+        interp = vtk.vtkPointInterpolator()
+        interp.SetInputData(probe)
+        interp.SetSourceData(src)
+        interp.SetKernel(vtk.vtkVoronoiKernel())
+        interp.SetLocator(locator)
+        interp.Update()
+        near = numpy_support.vtk_to_numpy(interp.GetOutput().GetPointData().GetArray("nearest"))
+        dist = np.linalg.norm(view[ids] - near, axis=1)
+        keep = dist < r
+        return ids[keep], dist[keep]
+
+    def _begin_drag_set(self):
+        """Snapshot what a drag moves: the selection plus, when proportional, weighted neighbours."""
+        view = self._points_view()
+        sel = self.selected_pids
+        ids, weights = sel, np.ones(len(sel))
+        if self.proportional and len(sel):
+            if self.proportional_radius is None:
+                self.proportional_radius = 0.1 * self.edit_poly.GetLength()
+            nbr, dist = self._proportional_neighbours(view, sel)
+            ids = np.concatenate([sel, nbr])
+            t = 1.0 - dist / self.proportional_radius
+            weights = np.concatenate([weights, self._falloff_weights(t, self.falloff)])
+        self._drag_ids = ids
+        self._drag_start = view[ids].astype(np.float64)
+        self._drag_weights = weights[:, None]
+
+    def _apply_drag(self, delta):
+        """Move the drag set by a model-space delta in one vectorized write."""
+        self._drag_delta = delta
+        moved = self._drag_start + self._drag_weights * delta
+        self._points_view()[self._drag_ids] = moved
+        pts = self.edit_poly.GetPoints()
+        pts.GetData().Modified()
+        pts.Modified()
+        self.edit_poly.Modified()
+        if self.edit_mesh:
+            # The selection itself translates rigidly (weight 1)
+            self.edit_mesh.update(self._drag_ids, self.selected_pids)
+        n = len(self.selected_pids)
+        if self._overlay_view is not None and len(self._overlay_view) == n:
+            self._overlay_view[:] = moved[:n]
+            self.selection_poly.GetPoints().Modified()
+
+    def _show_proportional_status(self):
+        if self.proportional:
+            if self.proportional_radius is None and self.edit_poly:
+                self.proportional_radius = 0.1 * self.edit_poly.GetLength()
+            msg = f"Proportional editing: {self.falloff} falloff, radius {self.proportional_radius:.4g} (wheel to resize, Shift+O falloff)"
+        else:
+            msg = "Proportional editing off"
+        try:
+            self.main.statusBar().showMessage(msg)
+        except Exception:
+            pass
 
     def _intersect_drag_plane(self, sx, sy):
         # Ray from camera through screen point
@@ -6306,24 +9081,86 @@ class VertexEditTool:
         t = ((ox - p0[0]) * nx + (oy - p0[1]) * ny + (oz - p0[2]) * nz) / denom
         return (p0[0] + dx * t, p0[1] + dy * t, p0[2] + dz * t)
 
+    # ----- region selection -----
+    def select_region(self, selector, op="replace"):
+        """Select every vertex inside a RegionSelector region; returns the selection size."""
+        if not self.active_actor or not self.edit_poly:
+            return 0
+        inside = selector.point_mask(self.edit_poly, RegionSelector.actor_matrix(self.active_actor))
+        self.select_points(RegionSelector.combine(self.selected_pids, np.flatnonzero(inside), op))
+        return len(self.selected_pids)
+
+    def select_points(self, pids):
+        """Replace the region selection with the given point ids and refresh the point overlay."""
+        self.selected_pids = np.asarray(pids, dtype=np.int64)
+        if self.selection_actor is None:
+            self.selection_poly = vtk.vtkPolyData()
+            mapper = vtk.vtkPolyDataMapper()
+            mapper.SetInputData(self.selection_poly)
+            mapper.ScalarVisibilityOff()
+            self.selection_actor = vtk.vtkActor()
+            self.selection_actor.SetMapper(mapper)
+            prop = self.selection_actor.GetProperty()
+            prop.SetColor(1.0, 0.6, 0.0)
+            prop.SetPointSize(6)
+            prop.SetRenderPointsAsSpheres(True)
+            prop.SetLighting(False)
+            self.selection_actor.PickableOff()
+            self.renderer.AddActor(self.selection_actor)
+        # Overlay points stay in model space; the actor matrix places them
+        self.selection_actor.SetUserMatrix(self.actor_matrix)
+        n = len(self.selected_pids)
+        src = numpy_support.vtk_to_numpy(self.edit_poly.GetPoints().GetData())
+        points = vtk.vtkPoints()
+        points.SetData(numpy_support.numpy_to_vtk(np.ascontiguousarray(src[self.selected_pids]), deep=1))
+        self._overlay_view = numpy_support.vtk_to_numpy(points.GetData())
+        verts = vtk.vtkCellArray()
+        verts.SetData(numpy_support.numpy_to_vtkIdTypeArray(np.arange(n + 1, dtype=np.int64), deep=1),
+                      numpy_support.numpy_to_vtkIdTypeArray(np.arange(n, dtype=np.int64), deep=1))
+        self.selection_poly.SetPoints(points)
+        self.selection_poly.SetVerts(verts)
+        self.selection_actor.SetVisibility(n > 0)
+        self.vtk_app.render_all()
+
     # ----- events -----
     def on_left_down(self, obj, evt):
         if not self.active_actor or not self.edit_poly:
             return
         x, y = self.iren.GetEventPosition()
         # Use picker ray to get a world point first
-        self.picker.Pick(x, y, 0, self.renderer)
-        pick_pos = self.picker.GetPickPosition()
-        # Use locator for nearest vertex (stable even when zoomed)
-        pid = self.point_locator.FindClosestPoint(pick_pos)
+        _, _, pick_pos = self.vtk_app.pick_cell(x, y, self.picker)
+        if pick_pos is None:
+            # Nothing hit: keep the vtkCellPicker fallback point
+            self.picker.Pick(x, y, 0, self.renderer)
+            pick_pos = self.picker.GetPickPosition()
+        # Use locator for nearest vertex (stable even when zoomed). It indexes model space,
+        # and is rebuilt here if a drag moved points (no-op otherwise)
+        self.point_locator.BuildLocator()
+        pid = self.point_locator.FindClosestPoint(self._world_to_local(pick_pos))
         if pid < 0:
             self.dragging = False
             return
+        view = self._points_view()
+        local = tuple(float(c) for c in view[pid])
+        if self.iren.GetControlKey():
+            if self.select_radius is None:
+                self.select_radius = 0.05 * self.edit_poly.GetLength()
+            op = "add" if self.iren.GetShiftKey() else "replace"
+            self.select_points(RegionSelector.combine(self.selected_pids, self._points_within(local, self.select_radius), op))
+        elif self.iren.GetShiftKey():
+            if np.any(self.selected_pids == pid):
+                self.select_points(self.selected_pids[self.selected_pids != pid])
+                self.dragging = False
+                return
+            self.select_points(RegionSelector.combine(self.selected_pids, [pid], "add"))
+        elif not np.any(self.selected_pids == pid):
+            # Plain click outside the selection: select just this vertex
+            self.select_points(np.array([pid], dtype=np.int64))
         self.picked_pid = pid
         self.dragging = True
+        self._begin_drag_set()
+        self._drag_delta = np.zeros(3)
         # Plane origin at picked vertex world position
-        pts = self.edit_poly.GetPoints()
-        local = pts.GetPoint(pid)
         world = self._local_to_world(local)
         self.drag_plane_origin = world
         cam = self.renderer.GetActiveCamera()
@@ -6365,26 +9202,108 @@ class VertexEditTool:
         dx = plane_pt[0] - self.initial_plane_point_world[0]
         dy = plane_pt[1] - self.initial_plane_point_world[1]
         dz = plane_pt[2] - self.initial_plane_point_world[2]
-        ldx, ldy, ldz = self._world_vec_to_local(dx, dy, dz)
+        delta = np.array(self._world_vec_to_local(dx, dy, dz))
 
-        pts = self.edit_poly.GetPoints()
-        px0, py0, pz0 = self.initial_local_pos
-        new_pos = (px0 + ldx, py0 + ldy, pz0 + ldz)
-        pts.SetPoint(self.picked_pid, *new_pos)
-        pts.Modified()
-        self.edit_poly.Modified()
+        # Whole drag set in one vectorized write into the vtkPoints buffer
+        self._apply_drag(delta)
+        new_pos = tuple(np.asarray(self.initial_local_pos) + delta)
 
         if self.highlight_actor:
             world_pos = self._local_to_world(new_pos)
             self.highlight_actor.SetPosition(*world_pos)
             self._rescale_highlight()
 
-        self.main.update_scene_totals()
+        self.main.update_scene_totals(changed=[self.active_actor])
+        self.vtk_app.render_all()
+
+    def on_key_press(self, obj, evt):
+        key = self.iren.GetKeySym() or ""
+        if key == "o":
+            self.proportional = not self.proportional
+        elif key == "O":
+            i = self.FALLOFFS.index(self.falloff)
+            self.falloff = self.FALLOFFS[(i + 1) % len(self.FALLOFFS)]
+        else:
+            return
+        self._rebuild_running_drag()
+        self._show_proportional_status()
+
+    def on_wheel(self, obj, evt):
+        """Mouse wheel scales the proportional radius (a running drag is re-weighted)."""
+        if not self.proportional or not self.edit_poly:
+            return
+        if self.proportional_radius is None:
+            self.proportional_radius = 0.1 * self.edit_poly.GetLength()
+        self.proportional_radius *= 1.1 if evt == "MouseWheelForwardEvent" else 1.0 / 1.1
+        self._rebuild_running_drag()
+        self._show_proportional_status()
+
+    def _rebuild_running_drag(self):
+        # Put the drag set back, recompute neighbours/weights, re-apply the current delta.
+        # The points are back at their pre-drag positions, so the locator is still valid.
+        if not self.dragging or not self.edit_poly:
+            return
+        self._points_view()[self._drag_ids] = self._drag_start
+        if self.edit_mesh:
+            self.edit_mesh.update(self._drag_ids)
+        self._begin_drag_set()
+        self._apply_drag(self._drag_delta)
         self.vtk_app.render_all()
 
 # ======= Undo/Redo Commands =======
 
-class AddActorCommand(QUndoCommand):
+class UndoCommand(QUndoCommand):
+    """
+    Base for the editor's undo commands. nbytes() is the approximate memory only the
+    history keeps alive (MainWindow enforces the undo budget with it); evict() drops
+    the payload and marks the command obsolete, so QUndoStack deletes it when reached
+    instead of undoing it. Subclasses implement _redo / _undo and release their
+    references in _drop.
+    """
+    BASE_BYTES = 512
+
+    def __init__(self, text):
+        super().__init__(text)
+        self.evicted = False
+
+    @staticmethod
+    def actor_bytes(actor):
+        """Geometry reachable through an actor: mapper input plus the cleaner's input."""
+        mapper = actor.GetMapper() if actor is not None else None
+        if mapper is None:
+            return 0
+        n = 0
+        data = mapper.GetInput()
+        if data is not None:
+            n += data.GetActualMemorySize() * 1024
+        cleaner = getattr(mapper, "_vt_cleaner", None)
+        if cleaner is not None and cleaner.GetNumberOfInputConnections(0):
+            src = cleaner.GetInputDataObject(0, 0)
+            if src is not None and src is not data:
+                n += src.GetActualMemorySize() * 1024
+        return n
+
+    def nbytes(self):
+        return self.BASE_BYTES
+
+    def evict(self):
+        self._drop()
+        self.evicted = True
+        self.setObsolete(True)
+
+    def _drop(self):
+        pass
+
+    def redo(self):
+        if not self.evicted:
+            self._redo()
+
+    def undo(self):
+        if not self.evicted:
+            self._undo()
+
+
+class AddActorCommand(UndoCommand):
     def __init__(self, main: MainWindow, base_name: str, actor: vtk.vtkActor):
         super().__init__(f"Add {base_name}")
         self.main = main
@@ -6392,46 +9311,97 @@ class AddActorCommand(QUndoCommand):
         self.actor = actor
         self.unique_name = None
 
-    def redo(self):
+    def nbytes(self):
+        # While added, the scene owns the actor; once undone only the history holds it
+        held = self.actor is not None and self.actor not in self.main.actor_names
+        return self.BASE_BYTES + (self.actor_bytes(self.actor) if held else 0)
+
+    def _drop(self):
+        self.actor = None
+
+    def _redo(self):
         if self.unique_name is None:
             self.unique_name = self.main._add_actor_no_undo(self.base_name, self.actor)
         else:
             self.main._add_actor_no_undo_with_name(self.unique_name, self.actor)
 
-    def undo(self):
+    def _undo(self):
         if self.unique_name:
             self.main._remove_object_silent(self.unique_name)
 
 
-class DeleteActorCommand(QUndoCommand):
+class DeleteActorCommand(UndoCommand):
     def __init__(self, main: MainWindow, unique_name: str, actor: vtk.vtkActor):
         super().__init__(f"Delete {unique_name}")
         self.main = main
         self.unique_name = unique_name
         self.actor = actor
 
-    def redo(self):
+    def nbytes(self):
+        # While deleted, the history is the only owner of the actor
+        held = self.actor is not None and self.actor not in self.main.actor_names
+        return self.BASE_BYTES + (self.actor_bytes(self.actor) if held else 0)
+
+    def _drop(self):
+        self.actor = None
+
+    def _redo(self):
         self.main._remove_object_silent(self.unique_name)
 
-    def undo(self):
+    def _undo(self):
         self.main._add_actor_no_undo_with_name(self.unique_name, self.actor)
 
 
-class TransformActorCommand(QUndoCommand):
-    def __init__(self, main: MainWindow, actor: vtk.vtkActor, before_m16, after_m16):
+class TransformActorCommand(UndoCommand):
+    """
+    UserTransform change on one actor. mergeable commands (spinbox edits) fold into the
+    previous mergeable one for the same actor while they arrive within MERGE_WINDOW_S
+    of each other, so scrolling a spinbox leaves a single undo entry.
+    """
+    MERGE_ID = 1001
+    MERGE_WINDOW_S = 1.0
+
+    def __init__(self, main: MainWindow, actor: vtk.vtkActor, before_m16, after_m16,
+                 mergeable=False, applied=False):
         super().__init__("Transform")
         self.main = main
         self.actor = actor
         self.before = list(before_m16)
         self.after = list(after_m16)
+        self.mergeable = mergeable
+        self.stamp = time.monotonic()
+        # Pushed after the change was already applied: skip the first redo
+        self._applied = applied
 
-    def redo(self):
+    def id(self):
+        return self.MERGE_ID if self.mergeable else -1
+
+    def mergeWith(self, other):
+        if (self.evicted or other.actor is not self.actor
+                or other.stamp - self.stamp > self.MERGE_WINDOW_S):
+            return False
+        self.after = other.after
+        self.stamp = other.stamp
+        # Back where the run started: QUndoStack drops the entry
+        self.setObsolete(self.after == self.before)
+        return True
+
+    def nbytes(self):
+        return self.BASE_BYTES + 2 * 16 * 8
+
+    def _drop(self):
+        self.actor = None
+
+    def _redo(self):
+        if self._applied:
+            self._applied = False
+            return
         self.main._apply_user_matrix16(self.actor, self.after)
 
-    def undo(self):
+    def _undo(self):
         self.main._apply_user_matrix16(self.actor, self.before)
 
-class BatchPropertyChangeCommand(QUndoCommand):
+class BatchPropertyChangeCommand(UndoCommand):
     """Undo/redo for property changes across multiple actors."""
     def __init__(self, main: MainWindow, before_list, after_list):
         super().__init__(f"Change {len(before_list)} Object(s) Color")
@@ -6440,42 +9410,213 @@ class BatchPropertyChangeCommand(QUndoCommand):
         self.before = list(before_list)
         self.after = list(after_list)
 
-    def redo(self):
+    def nbytes(self):
+        return self.BASE_BYTES + 256 * (len(self.before) + len(self.after))
+
+    def _drop(self):
+        self.before, self.after = [], []
+
+    def _redo(self):
         for actor, snap in self.after:
             self.main._apply_actor_property_snapshot(actor, snap)
         self.main.vtk_app.render_all()
 
-    def undo(self):
+    def _undo(self):
         for actor, snap in self.before:
             self.main._apply_actor_property_snapshot(actor, snap)
         self.main.vtk_app.render_all()
 
-class VertexEditCommand(QUndoCommand):
-    def __init__(self, main: MainWindow, actor: vtk.vtkActor, poly_before: vtk.vtkPolyData, poly_after: vtk.vtkPolyData):
-        super().__init__("Edit Vertices")
+class VertexEditCommand(UndoCommand):
+    """
+    Geometry edit stored as a delta on the edited polydata: the changed point ids with
+    their old and new coordinates and, for face deletion, the removed polygons with
+    their positions in the polys array. Undo / redo patch the polydata the actor's
+    mapper already draws in place (a private copy is made first if that polydata was
+    replaced or is shared with instances since the edit). spill() moves the delta to a
+    compressed .npz file that is read back when the entry is undone / redone.
+    """
+    def __init__(self, main: MainWindow, actor: vtk.vtkActor, poly: vtk.vtkPolyData,
+                 points_before=None, removed_polys=None, text="Edit Vertices", applied=True):
+        super().__init__(text)
         self.main = main
         self.actor = actor
+        self.target = poly
+        self.ids = np.zeros(0, dtype=np.int64)
+        self.old = self.new = np.zeros((0, 3), dtype=np.float32)
+        if points_before is not None:
+            after = numpy_support.vtk_to_numpy(poly.GetPoints().GetData())
+            if len(after) == len(points_before):
+                self.ids = np.flatnonzero((after != points_before).any(axis=1))
+                self.old = points_before[self.ids]
+                self.new = after[self.ids]
+        # (poly indices, sizes, connectivity) of the deleted polygons, from capture_polys()
+        self.removed = removed_polys
+        self.spill_path = None
+        # Pushed after the edit: the scene already shows the new state
+        self._applied = applied
+
+    @staticmethod
+    def capture_polys(poly, cell_ids):
+        """Record polygons (dataset cell ids) before they are deleted: (indices, sizes, connectivity)."""
+        polys = poly.GetPolys()
+        offsets = numpy_support.vtk_to_numpy(polys.GetOffsetsArray()).astype(np.int64)
+        conn = numpy_support.vtk_to_numpy(polys.GetConnectivityArray()).astype(np.int64)
+        idx = np.unique(np.asarray(cell_ids, dtype=np.int64)) - poly.GetNumberOfVerts() - poly.GetNumberOfLines()
+        idx = idx[(idx >= 0) & (idx < len(offsets) - 1)]
+        sizes = offsets[idx + 1] - offsets[idx]
+        starts = np.repeat(offsets[idx] - np.concatenate([[0], np.cumsum(sizes)[:-1]]), sizes)
+        return idx, sizes, conn[starts + np.arange(sizes.sum())]
+
+    def is_empty(self):
+        return not len(self.ids) and (self.removed is None or not len(self.removed[0]))
+
+    def nbytes(self):
+        n = self.BASE_BYTES + self.ids.nbytes + self.old.nbytes + self.new.nbytes
+        if self.removed is not None:
+            n += sum(a.nbytes for a in self.removed)
+        return n
+
+    def spilled_bytes(self):
+        try:
+            return os.path.getsize(self.spill_path) if self.spill_path else 0
+        except OSError:
+            return 0
 
-        self.before = vtk.vtkPolyData()
-        self.before.DeepCopy(poly_before)
-        self.after = vtk.vtkPolyData()
-        self.after.DeepCopy(poly_after)
-
-    def _apply_poly(self, poly):
-        tp = vtk.vtkTrivialProducer()
-        tp.SetOutput(poly)
-        mapper = self.main.vtk_app.create_mapper(tp)
-        self.actor.SetMapper(mapper)
-        self.main.update_scene_totals()
+    def spill(self, directory):
+        """Write the delta to a compressed file in directory and free it; returns the bytes freed."""
+        if self.spill_path or self.is_empty():
+            return 0
+        freed = self.nbytes() - self.BASE_BYTES
+        arrays = {"ids": self.ids, "old": self.old, "new": self.new}
+        if self.removed is not None:
+            arrays.update(zip(("removed_idx", "removed_sizes", "removed_conn"), self.removed))
+        import tempfile
+        fd, path = tempfile.mkstemp(suffix=".npz", dir=directory)
+        with os.fdopen(fd, "wb") as f:
+            np.savez_compressed(f, **arrays)
+        self.spill_path = path
+        self.ids = np.zeros(0, dtype=np.int64)
+        self.old = self.new = np.zeros((0, 3), dtype=np.float32)
+        self.removed = None
+        return freed
+
+    def _unspill(self):
+        with np.load(self.spill_path) as z:
+            self.ids, self.old, self.new = z["ids"], z["old"], z["new"]
+            if "removed_idx" in z:
+                self.removed = (z["removed_idx"], z["removed_sizes"], z["removed_conn"])
+        self._remove_spill_file()
+
+    def _remove_spill_file(self):
+        try:
+            os.remove(self.spill_path)
+        except OSError:
+            pass
+        self.spill_path = None
+
+    def _drop(self):
+        self.ids = np.zeros(0, dtype=np.int64)
+        self.old = self.new = np.zeros((0, 3), dtype=np.float32)
+        self.removed = None
+        if self.spill_path:
+            self._remove_spill_file()
+
+    def _source_poly(self):
+        """The in-memory polydata feeding the actor's mapper (the cleaner's input), or None."""
+        mapper = self.actor.GetMapper()
+        if mapper is None or getattr(mapper, "_vt_cached_output", False):
+            return None
+        cleaner = getattr(mapper, "_vt_cleaner", None)
+        if cleaner is not None and cleaner.GetNumberOfInputConnections(0):
+            producer = cleaner.GetInputConnection(0, 0).GetProducer()
+        elif mapper.GetNumberOfInputConnections(0):
+            producer = mapper.GetInputConnection(0, 0).GetProducer()
+        else:
+            return None
+        if not isinstance(producer, vtk.vtkTrivialProducer):
+            return None
+        data = producer.GetOutputDataObject(0)
+        return data if isinstance(data, vtk.vtkPolyData) else None
+
+    def _writable_target(self):
+        target = self._source_poly()
+        if target is self.target and not self.main._is_shared_geometry(self.actor):
+            return target
+        # Mapper replaced or shared since the edit: patch a private copy of what is drawn
+        source = target if target is not None else self.main.as_polydata(self.actor.GetMapper().GetInput())
+        if source is None or source.GetNumberOfPoints() != self.target.GetNumberOfPoints():
+            return None
+        self.target = vtk.vtkPolyData()
+        self.target.DeepCopy(source)
+        self.actor.SetMapper(self.main.vtk_app.create_edited_mapper(self.target))
+        return self.target
+
+    @staticmethod
+    def _set_polys(poly, offsets, conn):
+        cells = vtk.vtkCellArray()
+        cells.SetData(numpy_support.numpy_to_vtkIdTypeArray(offsets, deep=1),
+                      numpy_support.numpy_to_vtkIdTypeArray(conn, deep=1))
+        poly.SetPolys(cells)
+
+    def _patch_polys(self, poly, delete):
+        idx, sizes, removed_conn = self.removed
+        polys = poly.GetPolys()
+        offsets = numpy_support.vtk_to_numpy(polys.GetOffsetsArray()).astype(np.int64)
+        conn = numpy_support.vtk_to_numpy(polys.GetConnectivityArray()).astype(np.int64)
+        cur_sizes = np.diff(offsets)
+        if delete:
+            keep = np.ones(len(cur_sizes), dtype=bool)
+            keep[idx] = False
+            new_sizes = cur_sizes[keep]
+            new_conn = conn[np.repeat(keep, cur_sizes)]
+        else:
+            keep = np.ones(len(cur_sizes) + len(idx), dtype=bool)
+            keep[idx] = False
+            new_sizes = np.empty(len(keep), dtype=np.int64)
+            new_sizes[keep] = cur_sizes
+            new_sizes[idx] = sizes
+            corner_kept = np.repeat(keep, new_sizes)
+            new_conn = np.empty(len(corner_kept), dtype=np.int64)
+            new_conn[corner_kept] = conn
+            new_conn[~corner_kept] = removed_conn
+        self._set_polys(poly, np.concatenate([[0], np.cumsum(new_sizes)]), new_conn)
+        # Cells changed under the links / cell map built for picking and deletion
+        poly.DeleteCells()
+
+    def _apply(self, forward):
+        if self.spill_path:
+            self._unspill()
+        target = self._writable_target()
+        if target is None:
+            self.main.statusBar().showMessage(f"{self.text()}: mesh was replaced; nothing to apply")
+            return
+        if len(self.ids):
+            pts = target.GetPoints()
+            numpy_support.vtk_to_numpy(pts.GetData())[self.ids] = self.new if forward else self.old
+            pts.GetData().Modified()
+            pts.Modified()
+        if self.removed is not None and len(self.removed[0]):
+            self._patch_polys(target, delete=forward)
+        target.Modified()
+        edit_mesh = getattr(self.actor.GetMapper(), "_vt_edit_mesh", None)
+        if edit_mesh is not None:
+            if self.removed is not None:
+                edit_mesh.rebuild()
+            else:
+                edit_mesh.update(self.ids)
+        self.main.update_scene_totals(changed=[self.actor])
         self.main.vtk_app.render_all()
 
-    def redo(self):
-        self._apply_poly(self.after)
+    def _redo(self):
+        if self._applied:
+            self._applied = False
+            return
+        self._apply(True)
 
-    def undo(self):
-        self._apply_poly(self.before)
+    def _undo(self):
+        self._apply(False)
 
-class PropertyChangeCommand(QUndoCommand):
+class PropertyChangeCommand(UndoCommand):
     def __init__(self, main: MainWindow, actor: vtk.vtkActor, before_snap: dict, after_snap: dict):
         super().__init__("Change Appearance")
         self.main = main
@@ -6483,11 +9624,17 @@ class PropertyChangeCommand(QUndoCommand):
         self.before = dict(before_snap)
         self.after = dict(after_snap)
 
-    def redo(self):
+    def nbytes(self):
+        return self.BASE_BYTES + 512
+
+    def _drop(self):
+        self.actor = None
+
+    def _redo(self):
         self.main._apply_actor_property_snapshot(self.actor, self.after)
         self.main.vtk_app.render_all()
 
-    def undo(self):
+    def _undo(self):
         self.main._apply_actor_property_snapshot(self.actor, self.before)
         self.main.vtk_app.render_all()
 